@@ -0,0 +1,76 @@
+"""
+AST memory benchmark: memory held by the tree parsed from a generated
+program, per node and per 100k nodes, and the size of the same tree copied
+into a NodeArena.
+
+    python -m benchmarks.ast_memory [--methods N]
+"""
+import argparse
+import gc
+import tracemalloc
+
+from cmp.cool_lang.ast import NodeArena
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_DESCENT_PARSER
+from cmp.profiler import count_nodes
+
+METHOD = """    m{0}(x: Int, y: String): Int {{
+        let z: Int <- x * {0} + 1 in {{
+            if z < {0} then out_string(y.concat("{0}")) else self fi;
+            while not z = 0 loop z <- z - 1 pool;
+            case z of i: Int => i + ~x; o: Object => isvoid o; esac;
+            z;
+        }}
+    }};
+"""
+
+
+def generate(methods: int):
+    body = "".join(METHOD.format(i) for i in range(methods))
+    return f"class Main inherits IO {{\n{body}    main(): Int {{ 0 }};\n}};\n"
+
+
+def retained(build):
+    """
+    Result of `build()` and the memory still allocated once it returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--methods", type=int, default=2000)
+    args = parser.parse_args()
+
+    code = generate(args.methods)
+    lexer = COOL_LEXER()
+    lexer.build()
+
+    def parse():
+        cool_parser = COOL_DESCENT_PARSER()
+        lexer.input(code)
+        assert cool_parser.parse(lexer), cool_parser.errors
+        return cool_parser.result
+
+    program, tree_bytes = retained(parse)
+    nodes = count_nodes(program)
+    arena, arena_bytes = retained(lambda: NodeArena.from_ast(program))
+    assert len(arena) == nodes
+
+    print(f"nodes: {nodes}")
+    for name, size in (("tree", tree_bytes), ("arena", arena_bytes)):
+        print(
+            f"{name:<5}: {size / nodes:7.1f} bytes/node "
+            f"{size / nodes * 100000 / 2 ** 20:7.2f} MiB/100k nodes"
+        )
+
+
+if __name__ == "__main__":
+    main()
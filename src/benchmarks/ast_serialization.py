@@ -0,0 +1,68 @@
+"""
+AST serialization benchmark: time to rebuild the AST of a generated
+program with load_ast against lexing and parsing its source again, and the
+size of the serialized AST.
+
+    python -m benchmarks.ast_serialization [--methods N] [--repeat N]
+"""
+import argparse
+import time
+
+from benchmarks.ast_memory import generate
+from cmp.cool_lang.ast import dump_ast, load_ast
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_DESCENT_PARSER, COOL_PARSER
+from cmp.cool_lang.semantics import COOL_CHECKER
+
+
+def best_of(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--methods", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    code = generate(args.methods)
+    lexer = COOL_LEXER()
+    lexer.build()
+
+    def front_end(cool_parser):
+        def parse():
+            lexer.input(code)
+            assert cool_parser.parse(lexer), cool_parser.errors
+            return cool_parser.result
+
+        return parse
+
+    ply_parser = COOL_PARSER()
+    ply_parser.build()
+    program = front_end(ply_parser)()
+    checker = COOL_CHECKER()
+    assert checker.check_semantics(program), checker.errors
+    data = dump_ast(program)
+    typed = dump_ast(program, typed=True)
+
+    print(f"source: {len(code):9} bytes")
+    print(f"ast   : {len(data):9} bytes")
+    print(f"typed : {len(typed):9} bytes")
+    for name, function in (
+        ("lex + ply parse", front_end(ply_parser)),
+        ("lex + descent parse", front_end(COOL_DESCENT_PARSER())),
+        ("load_ast", lambda: load_ast(data)),
+        ("load_ast typed", lambda: load_ast(typed, checker.context)),
+    ):
+        elapsed = best_of(function, args.repeat)
+        print(f"{name:<19}: {elapsed * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Basic types benchmark: time to start the semantic and the CIL phases of a
+compilation, building the basic types context and cloning the one shared
+by the process, and building the CIL of the basic types against loading
+its snapshot, with the time of checking and generating the CIL of small
+programs both ways.
+
+    python -m benchmarks.basics [--repeat N]
+"""
+import argparse
+import os
+import time
+from unittest import mock
+
+from cmp.cil import COOL_TO_CIL_VISITOR
+from cmp.cil.basic_transform import BASE_COOL_CIL_TRANSFORM
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER, build_basic_context
+
+tests_dir = os.path.join(os.path.dirname(__file__), "..", "..", "tests", "codegen")
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def building():
+    return mock.patch.object(
+        BASE_COOL_CIL_TRANSFORM, "load_basics", BASE_COOL_CIL_TRANSFORM.build_basics
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    compiler = COOL_COMPILER()
+    context = compiler.basic_context
+    built = best(build_basic_context, args.repeat)
+    cloned = best(context.clone, args.repeat)
+    print(f"basic context : {built * 1e6:8.1f} us built, {cloned * 1e6:8.1f} us cloned")
+
+    compiler.lexer.input("class Main { main(): Int { 0 }; };")
+    compiler.parser.parse(compiler.lexer)
+    checker = COOL_CHECKER(basic_context=context)
+    checker.check_semantics(compiler.parser.result)
+    with building():
+        built = best(lambda: BASE_COOL_CIL_TRANSFORM(checker.context), args.repeat)
+    loaded = best(lambda: BASE_COOL_CIL_TRANSFORM(checker.context), args.repeat)
+    print(
+        f"basic CIL     : {built * 1e6:8.1f} us built, {loaded * 1e6:8.1f} us "
+        f"loaded ({built / loaded:5.1f}x)"
+    )
+
+    programs = []
+    for name in sorted(os.listdir(tests_dir)):
+        if name.endswith(".cl"):
+            with open(os.path.join(tests_dir, name)) as fd:
+                compiler.lexer.input(fd.read())
+            assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+            programs.append(compiler.parser.result)
+
+    def check_and_transform():
+        for program in programs:
+            checker = COOL_CHECKER(basic_context=context)
+            assert checker.check_semantics(program), checker.errors
+            COOL_TO_CIL_VISITOR(checker.context).visit(program)
+
+    built = loaded = float("inf")
+    for _ in range(max(args.repeat // 20, 1)):
+        with building():
+            built = min(built, best(check_and_transform, 1))
+        loaded = min(loaded, best(check_and_transform, 1))
+    print(
+        f"{len(programs)} programs   : {built * 1000:8.2f} ms built, "
+        f"{loaded * 1000:8.2f} ms loaded ({built / loaded:5.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
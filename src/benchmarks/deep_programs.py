@@ -0,0 +1,108 @@
+"""
+Deep programs benchmark: compile time of expressions nested many levels and
+of long inheritance chains, far deeper than the Python stack allows to
+recurse, and time of collecting the types of long chains and cycles with
+the union-find forest of the cyclic inheritance check against walking the
+chain of parents of every class with a list of the classes seen (the
+behaviour before, cubic in the length of a chain).
+
+    python -m benchmarks.deep_programs [--depths N...] [--classes N...]
+"""
+import argparse
+import time
+from unittest import mock
+
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.errors import SemanticError
+from cmp.cool_lang.semantics.type_collector import COOL_TYPE_COLLECTOR
+
+
+def nested(kind: str, depth: int):
+    if kind == "arith":
+        body = " + ".join(["1"] * depth)
+    else:
+        body = "x" if kind == "let" else "0"
+        for index in range(depth):
+            if kind == "let":
+                body = f"let x : Int <- {index} in {body}"
+            else:
+                body = f"if {index} < 3 then {index} else {body} fi"
+    return f"class Main {{\n    main(): Int {{ {body} }};\n}};\n"
+
+
+def chain(depth: int):
+    code = ["class C0 { f(): Int { 0 }; };\n"]
+    code += [f"class C{i} inherits C{i - 1} {{ }};\n" for i in range(1, depth)]
+    code.append(f"class Main inherits C{depth - 1} {{ main(): Int {{ f() }}; }};\n")
+    return "".join(code)
+
+
+def cycle(depth: int):
+    code = [f"class C{i} inherits C{(i + 1) % depth} {{ }};\n" for i in range(depth)]
+    code.append("class Main { main(): Int { 0 }; };\n")
+    return "".join(code)
+
+
+def check_cyclic(self, obj, parents):
+    stack = [obj.id]
+    while True:
+        parent = parents.get(stack[-1], None)
+        if parent is None:
+            break
+        if parent in stack:
+            self.errors.append(
+                SemanticError(
+                    obj.line,
+                    obj.column,
+                    f"Cyclic inheritance in the hierarchy of {obj.id}.",
+                )
+            )
+            break
+        stack.append(parent)
+
+
+def parsed(compiler: COOL_COMPILER, code: str):
+    compiler.lexer.input(code)
+    assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+    return compiler.parser.result
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--depths", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--classes", type=int, nargs="+", default=[250, 500, 1000])
+    args = parser.parse_args()
+
+    compiler = COOL_COMPILER()
+    for depth in args.depths:
+        times = []
+        for kind in ("let", "if", "arith"):
+            result, elapsed = timed(compiler.compile, nested(kind, depth))
+            assert result.ok, result.errors
+            times.append(f"{kind} {elapsed * 1000:8.2f} ms")
+        result, elapsed = timed(compiler.compile, chain(depth))
+        assert result.ok, result.errors
+        times.append(f"chain {elapsed * 1000:8.2f} ms")
+        print(f"depth {depth:6d}: " + ", ".join(times))
+
+    for classes in args.classes:
+        for name, generate in (("chain", chain), ("cycle", cycle)):
+            program = parsed(compiler, generate(classes))
+            with mock.patch.object(COOL_TYPE_COLLECTOR, "check_cyclic", check_cyclic):
+                walked = timed(COOL_TYPE_COLLECTOR().visit, program)[1]
+            program = parsed(compiler, generate(classes))
+            forest = timed(COOL_TYPE_COLLECTOR().visit, program)[1]
+            print(
+                f"{name} {classes:6d}: {walked * 1000:8.2f} ms walking, "
+                f"{forest * 1000:8.2f} ms with the forest ({walked / forest:6.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Import time benchmark: cumulative `python -X importtime` cost of the front
+end (everything `coolc.py run --check` needs) against the whole compiler
+including the CIL and MIPS backend.
+
+    python -m benchmarks.importtime [--repeat N] [--top N]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# Budget for importing the front end, the time is reported against it
+FRONTEND_BUDGET_MS = 200
+
+FRONTEND = "import cmp.compiler"
+FULL = "import cmp.compiler, cmp.cil"
+
+# Modules only the backend needs, tests/importtime_test.py checks that the
+# front end imports none of them
+BACKEND = ("cmp.cil", "tempfile", "shutil", "random", "lzma", "bz2")
+
+LINE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)$")
+
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(statement: str) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Self and cumulative import time (in microseconds) and nesting depth of
+    every module imported by `statement` in a fresh interpreter.
+    """
+    sp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        cwd=SRC,
+        check=True,
+    )
+    times = {}
+    for line in sp.stderr.decode().splitlines():
+        match = LINE.match(line)
+        if match:
+            depth = len(match.group(3)) - 1
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)), depth)
+    return times
+
+
+def total_ms(statement: str, repeat: int = 1):
+    """
+    Best of `repeat` runs of the cumulative time of the `cmp` modules
+    imported directly by `statement`.
+    """
+    best = None
+    for _ in range(repeat):
+        times = import_times(statement)
+        total = sum(
+            cumulative
+            for name, (_, cumulative, depth) in times.items()
+            if depth == 0 and name.split(".")[0] == "cmp"
+        )
+        best = total if best is None else min(best, total)
+    return best / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    frontend = total_ms(FRONTEND, args.repeat)
+    full = total_ms(FULL, args.repeat)
+    print(f"front end : {frontend:8.2f} ms (budget {FRONTEND_BUDGET_MS} ms)")
+    print(f"full      : {full:8.2f} ms")
+
+    print("\nslowest modules of the full compiler (self time):")
+    times = sorted(import_times(FULL).items(), key=lambda item: -item[1][0])
+    for name, (self_time, _, _) in times[: args.top]:
+        print(f"  {self_time / 1000:8.2f} ms {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Incremental build benchmark: time of a full build of a generated program
+against the incremental rebuild after editing a method body of a single
+class, near the start, the middle and the end of the program.
+
+    python -m benchmarks.incremental [--classes N] [--methods N]
+"""
+import argparse
+import time
+
+from cmp.compiler import COOL_COMPILER
+from cmp.incremental import IncrementalState
+from cmp.profiler import Profiler
+
+METHOD = """    m{0}(x: Int, y: String): Int {{
+        let z: Int <- x * {0} + 1 in {{
+            if z < {0} then out_string(y.concat("{0}")) else self fi;
+            while not z = 0 loop z <- z - 1 pool;
+            z;
+        }}
+    }};
+"""
+EDIT = "z <- z - 1 pool;"
+EDITED = 'z <- z - 1 pool; if z = 1 then out_string("edited") else self fi;'
+
+
+def generate(classes: int, methods: int):
+    code = []
+    for index in range(classes):
+        parent = "IO" if index % 10 == 0 else f"C{index - 1}"
+        body = "".join(
+            METHOD.format(index * methods + method) for method in range(methods)
+        )
+        code.append(f"class C{index} inherits {parent} {{\n{body}}};\n")
+    code.append("class Main {\n    main(): Int { 0 };\n};\n")
+    return "".join(code)
+
+
+def edit(code: str, index: int):
+    """
+    `code` with the first method of the class `C<index>` edited.
+    """
+    start = code.index(EDIT, code.index(f"class C{index} "))
+    return code[:start] + EDITED + code[start + len(EDIT) :]
+
+
+def timed(compile):
+    start = time.perf_counter()
+    result = compile()
+    assert result.ok, [str(error) for error in result.errors]
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--classes", type=int, default=100)
+    parser.add_argument("--methods", type=int, default=6)
+    args = parser.parse_args()
+
+    code = generate(args.classes, args.methods)
+    compiler = COOL_COMPILER()
+    full, _ = timed(lambda: compiler.compile(code))
+    state = IncrementalState()
+    cold, _ = timed(lambda: compiler.compile(code, incremental=state))
+
+    print(f"lines               : {code.count(chr(10)):8d}")
+    print(f"full build          : {full * 1000:8.1f} ms")
+    print(f"cold incremental    : {cold * 1000:8.1f} ms")
+    for where, index in (
+        ("start", 0),
+        ("middle", args.classes // 2),
+        ("end", args.classes - 1),
+    ):
+        edited = edit(code, index)
+        profiler = Profiler(memory=False)
+        elapsed, result = timed(
+            lambda: compiler.compile(edited, incremental=state, profiler=profiler)
+        )
+        assert result.mips == compiler.compile(edited).mips
+        counters = profiler.counters
+        print(
+            f"edit at the {where:<7}: {elapsed * 1000:8.1f} ms "
+            f"({counters['generated_pieces']} pieces generated, "
+            f"{counters['reused_pieces']} reused)"
+        )
+        # Back to the original program for the next edit
+        compiler.compile(code, incremental=state)
+
+
+if __name__ == "__main__":
+    main()
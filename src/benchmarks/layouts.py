@@ -0,0 +1,127 @@
+"""
+Class layouts benchmark: time of the CIL generation of programs whose
+deepest class refers to the attributes of its ancestors many times, for
+hierarchies of growing depth, with the memoized layouts against walking the
+ancestors on every call (the recursive `get_all_*` generators, and a scan
+of every attribute for each reference, the behaviour before the layouts).
+With the layouts the time still grows with the depth alone, the init
+function of every class sets the attributes of all its ancestors.
+
+    python -m benchmarks.layouts [--depths N...] [--references N]
+"""
+import argparse
+import time
+from unittest import mock
+
+from cmp.cil import COOL_TO_CIL_VISITOR
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER
+from cmp.cool_lang.semantics.semantic_utils import Type
+
+
+def generate(depth: int, references: int):
+    code = []
+    for index in range(depth):
+        parent = f" inherits C{index - 1}" if index else ""
+        body = f"    a{index} : Int <- {index};\n    b{index} : Int;\n"
+        code.append(f"class C{index}{parent} {{\n{body}}};\n")
+    uses = "".join(f"a{index % depth}; " for index in range(references))
+    code.append(
+        f"class Main inherits C{depth - 1} {{\n"
+        f"    main(): Int {{ {{ {uses}0; }} }};\n}};\n"
+    )
+    return "".join(code)
+
+
+def get_all_attributes(self):
+    if self.parent:
+        for attr in self.parent.get_all_attributes():
+            yield attr
+    for attr in self.attributes:
+        yield attr
+
+
+def get_all_methods(self):
+    done = set()
+    if self.parent:
+        for method, typex in self.parent.get_all_methods():
+            if method.name in self.methods:
+                done.add(method.name)
+                yield (self.methods[method.name], self)
+            else:
+                yield (method, typex)
+    for method in self.methods.values():
+        if method.name in done:
+            continue
+        yield (method, self)
+
+
+def get_all_features(self):
+    done = set()
+    if self.parent:
+        for feature in self.parent.get_all_features():
+            if isinstance(feature, tuple):
+                method, typex = feature
+                if method.name in self.methods:
+                    done.add(method.name)
+                    yield (self.methods[method.name], self)
+                else:
+                    yield (method, typex)
+            else:
+                yield feature
+    for attr in self.attributes:
+        yield attr
+    for method in self.methods.values():
+        if method.name in done:
+            continue
+        yield (method, self)
+
+
+def find_attribute(self, name):
+    return next(
+        (attr for attr in self.get_all_attributes() if attr.name == name), None
+    )
+
+
+def walking():
+    return mock.patch.multiple(
+        Type,
+        get_all_attributes=get_all_attributes,
+        get_all_methods=get_all_methods,
+        get_all_features=get_all_features,
+        find_attribute=find_attribute,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--depths", type=int, nargs="+", default=[25, 50, 100, 200])
+    parser.add_argument("--references", type=int, default=2000)
+    args = parser.parse_args()
+
+    compiler = COOL_COMPILER()
+    print(f"references: {args.references}")
+    for depth in args.depths:
+        compiler.lexer.input(generate(depth, args.references))
+        assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+        program = compiler.parser.result
+        checker = COOL_CHECKER(basic_context=compiler.basic_context)
+        assert checker.check_semantics(program), checker.errors
+
+        with walking():
+            start = time.perf_counter()
+            COOL_TO_CIL_VISITOR(checker.context).visit(program)
+            walked = time.perf_counter() - start
+        for typex in checker.context.types.values():
+            typex._layouts = None
+        start = time.perf_counter()
+        COOL_TO_CIL_VISITOR(checker.context).visit(program)
+        memoized = time.perf_counter() - start
+        print(
+            f"depth {depth:4d}: {walked * 1000:8.2f} ms walking, "
+            f"{memoized * 1000:8.2f} ms with layouts ({walked / memoized:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Lexer benchmark: throughput of the PLY based COOL_LEXER and of
+COOL_FAST_LEXER on generated comment heavy, string heavy and plain code
+inputs.
+
+    python -m benchmarks.lexer [--size N] [--repeat N]
+"""
+import argparse
+import time
+
+from cmp.cool_lang.lexer import COOL_FAST_LEXER, COOL_LEXER
+
+LINE_COMMENT = "-- " + "a line comment with some words in it " * 2 + "\n"
+BLOCK_COMMENT = "(* a block comment (* nested *) with * and ( inside\n   over two lines *)\n"
+STRING = '    s <- "a string literal with \\"escapes\\" and \\t tabs in it";\n'
+CODE = "    x <- if a < b then (a + b) * 2 else ~c fi;\n"
+
+
+def generate(kind: str, size: int):
+    if kind == "comments":
+        body = (LINE_COMMENT + BLOCK_COMMENT) * (size // 2)
+    elif kind == "strings":
+        body = STRING * size
+    else:
+        body = CODE * size
+    return "class Main {\n    main(): Object {{\n" + body + "    }};\n};\n"
+
+
+def best_of(lexer, code, repeat):
+    # The tokens are consumed as the parser does, without keeping them
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = sum(1 for _ in lexer.tokens_of(code, comments=True))
+        elapsed = time.perf_counter() - start
+        assert not lexer.errors, lexer.errors
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for engine, lexer in (("ply", COOL_LEXER()), ("fast", COOL_FAST_LEXER())):
+        lexer.build()
+        for kind in ("comments", "strings", "code"):
+            code = generate(kind, args.size)
+            elapsed, count = best_of(lexer, code, args.repeat)
+            print(
+                f"{engine:<4} {kind:<9}: {elapsed * 1000:9.2f} ms "
+                f"{len(code) / elapsed / 2 ** 20:7.2f} MiB/s "
+                f"{count / elapsed:11.0f} tokens/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+MIPS emission benchmark: peak memory and time of CIL_TO_MIPS plus writing
+the output file, streaming the `.text` section through a spooled file
+against keeping every instruction in a list and joining them at the end
+(the behaviour before the streaming emitter).
+
+    python -m benchmarks.mips_emission [--methods N] [--per-class N]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+from cmp.cil import CIL_TO_MIPS, COOL_TO_CIL_VISITOR
+from cmp.cil.utils.mips_syntax import Directive, Mips
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER
+
+
+class ListMips(Mips):
+    def __init__(self, zip_mode=False):
+        super().__init__(zip_mode)
+        self.TEXT: List[str] = []
+
+    def write_inst(self, instruction: str, tabs: int = 0):
+        tabstr = ""
+        for _ in range(tabs):
+            tabstr += "\t"
+        self.TEXT.append(f"{tabstr}{instruction}")
+
+    def write_to(self, fd):
+        fd.write(
+            "\n".join(
+                [Directive.data.value]
+                + self.DOTDATA
+                + [Directive.text.value]
+                + self.TEXT
+            )
+        )
+
+
+def generate_program(methods: int, per_class: int):
+    classes = []
+    for first in range(0, methods, per_class):
+        features = "\n".join(
+            f"    m{i}(x: Int): Int {{ x + {i} }};"
+            for i in range(first, min(first + per_class, methods))
+        )
+        classes.append(f"class C{first // per_class} {{\n{features}\n}};")
+    classes.append(
+        "class Main inherits IO {\n"
+        "    main(): Object { out_int((new C0).m0(1)) };\n"
+        "};"
+    )
+    return "\n".join(classes)
+
+
+def build_cil(code: str):
+    compiler = COOL_COMPILER()
+    assert compiler.lexer.tokenize(code), compiler.lexer.errors
+    assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+    checker = COOL_CHECKER(basic_context=compiler.basic_context)
+    assert checker.check_semantics(compiler.parser.result), checker.errors
+    return checker.context, COOL_TO_CIL_VISITOR(checker.context).visit(
+        compiler.parser.result
+    )
+
+
+def emit(context, cil_ast, mips_class, path):
+    ctm = CIL_TO_MIPS(context)
+    mips = mips_class()
+    mips.DOTDATA = ctm.mips.DOTDATA
+    ctm.mips.close()
+    ctm.mips = mips
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    ctm.visit(cil_ast)
+    with open(path, "w") as fd:
+        mips.write_to(fd)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    mips.close()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--methods", type=int, default=50000)
+    parser.add_argument("--per-class", type=int, default=100)
+    args = parser.parse_args()
+
+    context, cil_ast = build_cil(generate_program(args.methods, args.per_class))
+    with tempfile.TemporaryDirectory() as tmp:
+        joined = emit(context, cil_ast, ListMips, os.path.join(tmp, "joined.mips"))
+        streamed = emit(context, cil_ast, Mips, os.path.join(tmp, "streamed.mips"))
+        size = os.path.getsize(os.path.join(tmp, "streamed.mips"))
+        with open(os.path.join(tmp, "joined.mips")) as a:
+            with open(os.path.join(tmp, "streamed.mips")) as b:
+                assert a.read() == b.read()
+
+    print(f"methods             : {args.methods:8d}")
+    print(f"output size         : {size / 2 ** 20:8.2f} MiB")
+    print(f"joined   time / peak: {joined[0]:8.2f} s {joined[1] / 2 ** 20:8.2f} MiB")
+    print(f"streamed time / peak: {streamed[0]:8.2f} s {streamed[1] / 2 ** 20:8.2f} MiB")
+    print(f"memory reduction    : {joined[1] / streamed[1]:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
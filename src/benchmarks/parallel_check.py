@@ -0,0 +1,47 @@
+"""
+Parallel type checking benchmark: time to check the types of a generated
+program with thousands of methods in a single process and with worker
+processes (the merge of the static types included).
+
+    python -m benchmarks.parallel_check [--classes N] [--methods N] [--jobs N...]
+"""
+import argparse
+import os
+import time
+
+from benchmarks.incremental import generate
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--classes", type=int, default=300)
+    parser.add_argument("--methods", type=int, default=10)
+    parser.add_argument(
+        "--jobs", type=int, nargs="+", default=sorted({2, 4, os.cpu_count() or 1})
+    )
+    args = parser.parse_args()
+
+    compiler = COOL_COMPILER()
+    compiler.lexer.input(generate(args.classes, args.methods))
+    assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+    program = compiler.parser.result
+    checker = COOL_CHECKER(basic_context=compiler.basic_context)
+    assert checker.build_context(program), checker.errors
+
+    print(f"cores / methods : {os.cpu_count():8d} {args.classes * args.methods:8d}")
+    single = None
+    for jobs in [1] + [jobs for jobs in args.jobs if jobs > 1]:
+        checker.jobs = jobs
+        start = time.perf_counter()
+        checker.check_types(program.classes)
+        elapsed = time.perf_counter() - start
+        assert not checker.errors, checker.errors
+        single = single or elapsed
+        label = f"{jobs} job{'s' if jobs > 1 else ''}"
+        print(f"{label:<16}: {elapsed * 1000:8.2f} ms ({single / elapsed:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Parser benchmark: throughput of the PLY based COOL_PARSER and of
+COOL_DESCENT_PARSER on the programs of tests/codegen repeated `--copies`
+times. The tokens are scanned before the timing starts.
+
+    python -m benchmarks.parser [--copies N] [--repeat N]
+"""
+import argparse
+import os
+import time
+
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_DESCENT_PARSER, COOL_PARSER
+
+CORPUS = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "tests", "codegen"
+)
+
+
+def load_corpus():
+    code = []
+    for file in sorted(os.listdir(CORPUS)):
+        if file.endswith(".cl"):
+            with open(os.path.join(CORPUS, file), "r") as fd:
+                code.append(fd.read())
+    return "\n".join(code)
+
+
+def best_of(lexer, parser, code, repeat):
+    best = None
+    for _ in range(repeat):
+        lexer.tokenize(code)
+        start = time.perf_counter()
+        parsed = parser.parse(lexer)
+        elapsed = time.perf_counter() - start
+        assert parsed, parser.errors
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--copies", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    code = "\n".join([load_corpus()] * args.copies)
+    lexer = COOL_LEXER()
+    lexer.build()
+    lexer.tokenize(code)
+    tokens = sum(1 for token in lexer.result if token.type != "COMMENT")
+
+    for engine, cool_parser in (
+        ("ply", COOL_PARSER()),
+        ("descent", COOL_DESCENT_PARSER()),
+    ):
+        cool_parser.build()
+        elapsed = best_of(lexer, cool_parser, code, args.repeat)
+        print(
+            f"{engine:<7}: {elapsed * 1000:9.2f} ms "
+            f"{tokens / elapsed:11.0f} tokens/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
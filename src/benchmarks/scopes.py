@@ -0,0 +1,85 @@
+"""
+Scopes benchmark: time to open a level, define a variable, look up the
+variable of the outermost level and close the level again at every depth
+of a deep nesting, with the flat symbol table against the chains of scopes
+(one child scope per level, the lookups recursing to the parents and
+raising at every level, the behaviour before the flat table).
+
+    python -m benchmarks.scopes [--depth N] [--repeat N]
+"""
+import argparse
+import sys
+import time
+
+from cmp.cool_lang.semantics.semantic_utils import Scope, SemanticException, Var
+
+
+class ChainScope:
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.vars = {}
+
+    def define_var(self, name, typex):
+        if name in self.vars:
+            raise SemanticException(
+                f"Variable {name} already defined in current context."
+            )
+        var = self.vars[name] = Var(name, typex)
+        return var
+
+    def get_var(self, name):
+        try:
+            return self.vars[name]
+        except KeyError:
+            if self.parent is not None:
+                try:
+                    return self.parent.get_var(name)
+                except SemanticException as e:
+                    raise e
+            raise SemanticException(f"Variable {name} is not defined.")
+
+
+def chained(depth):
+    scope = ChainScope()
+    scope.define_var("self", None)
+    for index in range(depth):
+        scope = ChainScope(parent=scope)
+        scope.define_var(f"v{index}", None)
+        scope.get_var("self")
+
+
+def flat(depth):
+    scope = Scope()
+    scope.define_var("self", None)
+    for index in range(depth):
+        scope.enter()
+        scope.define_var(f"v{index}", None)
+        scope.get_var("self")
+    scope.exit(depth)
+
+
+def timed(function, depth, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(depth)
+    return (time.perf_counter() - start) * 1e6 / (depth * repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--depth", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    # The chained lookups recurse once per level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * args.depth + 100))
+
+    chain = timed(chained, args.depth, args.repeat)
+    table = timed(flat, args.depth, args.repeat)
+    print(f"depth          : {args.depth:8d}")
+    print(f"chained scopes : {chain:8.2f} us/level")
+    print(f"flat table     : {table:8.2f} us/level")
+    print(f"speedup        : {chain / table:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
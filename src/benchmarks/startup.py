@@ -0,0 +1,65 @@
+"""
+Startup benchmark: time needed to build COOL_LEXER and COOL_PARSER with the
+precomputed PLY tables against rebuilding the master regex and the LALR
+automaton from the rule definitions (the behaviour before the tables).
+
+    python -m benchmarks.startup [--repeat N]
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import ply.lex as lex
+import ply.yacc as yacc
+
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_PARSER
+
+
+def build_from_tables():
+    COOL_LEXER().build()
+    COOL_PARSER().build()
+
+
+def build_from_rules():
+    lex.lex(module=COOL_LEXER())
+    yacc.yacc(
+        module=COOL_PARSER(),
+        tabmodule="cmp.cool_lang.parser.__missing_parsetab__",
+        write_tables=False,
+        debug=False,
+        errorlog=yacc.NullLogger(),
+    )
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def process_startup(build, repeat):
+    code = f"from benchmarks.startup import {build.__name__}; {build.__name__}()"
+    return best_of(lambda: subprocess.run([sys.executable, "-c", code], check=True), repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rules = best_of(build_from_rules, args.repeat)
+    tables = best_of(build_from_tables, args.repeat)
+    print(f"build from rules    : {rules * 1000:8.2f} ms")
+    print(f"build from tables   : {tables * 1000:8.2f} ms")
+    print(f"speedup             : {rules / tables:8.2f}x")
+    print(f"process from rules  : {process_startup(build_from_rules, args.repeat) * 1000:8.2f} ms")
+    print(f"process from tables : {process_startup(build_from_tables, args.repeat) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
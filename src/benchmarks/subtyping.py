@@ -0,0 +1,101 @@
+"""
+Subtyping benchmark: time of `Type.is_subtype` and `find_common_ancestor`
+on random pairs of types of a deep and of a wide hierarchy, with the
+numbered hierarchy against walking the parent chains (the behaviour before
+`Context.compute_finish_time` numbered the types).
+
+    python -m benchmarks.subtyping [--depth N] [--width N] [--queries N]
+"""
+import argparse
+import random
+import time
+
+from cmp.cool_lang.semantics.semantic_utils import (
+    Context,
+    Type,
+    find_common_ancestor,
+)
+
+
+def build(parents):
+    """
+    A numbered context with the types T0, T1... where the parent of Ti is
+    the type `parents[i]` (Object when None).
+    """
+    context = Context()
+    root = context.create_type("Object")
+    types = [context.create_type(f"T{index}") for index in range(len(parents))]
+    for typex, parent in zip(types, parents):
+        typex.set_parent(root if parent is None else types[parent])
+    start = time.perf_counter()
+    context.compute_finish_time()
+    return [root] + types, time.perf_counter() - start
+
+
+def walk_is_subtype(typex, otype):
+    actual = typex
+    while True:
+        if actual == otype:
+            return True
+        if actual.parent is None:
+            return False
+        actual = actual.parent
+
+
+def walk_common_ancestor(type1, type2):
+    ancestor_t1 = []
+    actual = type1
+    while actual:
+        ancestor_t1.append(actual)
+        actual = actual.parent
+
+    actual = type2
+    while actual:
+        if actual in ancestor_t1:
+            return actual
+        actual = actual.parent
+
+
+def timed(function, pairs):
+    start = time.perf_counter()
+    results = [function(first, second) for first, second in pairs]
+    return (time.perf_counter() - start) * 1e6 / len(pairs), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--depth", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=20000)
+    args = parser.parse_args()
+    generator = random.Random(0)
+
+    hierarchies = (
+        ("deep", [None] + list(range(args.depth - 1))),
+        ("wide", [None] * args.width),
+        # Random trees are about 2 ln(n) levels deep
+        ("random", [None] + [generator.randrange(i) for i in range(1, args.width)]),
+    )
+    for name, parents in hierarchies:
+        types, numbering = build(parents)
+        pairs = [
+            (generator.choice(types), generator.choice(types))
+            for _ in range(args.queries)
+        ]
+        print(f"{name} hierarchy of {len(parents)} types")
+        print(f"  numbering              : {numbering * 1000:8.2f} ms")
+        for label, walk, fast in (
+            ("is_subtype", walk_is_subtype, Type.is_subtype),
+            ("find_common_ancestor", walk_common_ancestor, find_common_ancestor),
+        ):
+            walked, expected = timed(walk, pairs)
+            numbered, results = timed(fast, pairs)
+            assert results == expected
+            print(
+                f"  {label:<22} : {walked:8.2f} us walking, "
+                f"{numbered:6.2f} us numbered ({walked / numbered:7.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
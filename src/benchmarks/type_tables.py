@@ -0,0 +1,117 @@
+"""
+Type tables benchmark: time to look up every attribute and method of a
+deep hierarchy from its deepest type, with the frozen tables, walking the
+hierarchy (the lookups before `Context.freeze`) and with the recursive
+lookups raising an exception at every level (the behaviour before the
+tables), and the time and memory taken to build the tables.
+
+    python -m benchmarks.type_tables [--depth N] [--features N]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER
+from cmp.cool_lang.semantics.semantic_utils import SemanticException, Type
+
+
+def generate(depth: int, features: int):
+    code = []
+    for index in range(depth):
+        parent = f" inherits C{index - 1}" if index else ""
+        body = "".join(
+            f"    a{index}_{i} : Int;\n    m{index}_{i}(): Int {{ {i} }};\n"
+            for i in range(features)
+        )
+        code.append(f"class C{index}{parent} {{\n{body}}};\n")
+    code.append("class Main {\n    main(): Int { 0 };\n};\n")
+    return "".join(code)
+
+
+def legacy_get_attribute(typex, name):
+    try:
+        return next(attr for attr in typex.attributes if attr.name == name)
+    except StopIteration:
+        if typex.parent is None:
+            raise SemanticException(
+                f'Attribute "{name}" is not defined in type {typex.name}.'
+            )
+        try:
+            return legacy_get_attribute(typex.parent, name)
+        except SemanticException:
+            raise SemanticException(
+                f'Attribute "{name}" is not defined in type {typex.name}.'
+            )
+
+
+def legacy_get_method(typex, name):
+    try:
+        return typex.methods[name]
+    except KeyError:
+        if typex.parent is None:
+            raise SemanticException(
+                f'Method "{name}" is not defined in type {typex.name}.'
+            )
+        try:
+            return legacy_get_method(typex.parent, name)
+        except SemanticException:
+            raise SemanticException(
+                f'Method "{name}" is not defined in type {typex.name}.'
+            )
+
+
+def lookups(get_attribute, get_method, typex, attributes, methods):
+    start = time.perf_counter()
+    for name in attributes:
+        get_attribute(typex, name)
+    for name in methods:
+        get_method(typex, name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--depth", type=int, default=500)
+    parser.add_argument("--features", type=int, default=2)
+    args = parser.parse_args()
+    # The legacy lookups recurse once per level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * args.depth + 100))
+
+    compiler = COOL_COMPILER()
+    compiler.lexer.input(generate(args.depth, args.features))
+    assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+    checker = COOL_CHECKER(basic_context=compiler.basic_context)
+    assert checker.check_semantics(compiler.parser.result), checker.errors
+    context = checker.context
+
+    deepest = context.get_type(f"C{args.depth - 1}")
+    attributes = [attr.name for attr in deepest.get_all_attributes()]
+    methods = [method.name for method, _ in deepest.get_all_methods()]
+    frozen = lookups(Type.get_attribute, Type.get_method, deepest, attributes, methods)
+    legacy = lookups(
+        legacy_get_attribute, legacy_get_method, deepest, attributes, methods
+    )
+
+    for typex in context.types.values():
+        typex.invalidate()
+    walked = lookups(Type.get_attribute, Type.get_method, deepest, attributes, methods)
+    tracemalloc.start()
+    start = time.perf_counter()
+    context.freeze()
+    freeze = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    count = len(attributes) + len(methods)
+    print(f"depth / lookups     : {args.depth:8d} {count:8d}")
+    for name, elapsed in (("exceptions", legacy), ("walk", walked), ("tables", frozen)):
+        label = f"{name} lookups"
+        print(f"{label:<20}: {elapsed * 1e6 / count:8.2f} us/lookup")
+    print(f"speedup             : {legacy / frozen:8.1f}x")
+    print(f"freeze time / memory: {freeze * 1000:8.2f} ms {size / 2 ** 20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
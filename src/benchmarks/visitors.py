@@ -0,0 +1,123 @@
+"""
+Visitor dispatch benchmark: time of the type checker, the CIL generator and
+the MIPS generator over a generated program with every dispatch mode: the
+dispatcher scanning every target on a miss behind the `when` wrapper (the
+behaviour before the resolution cache), the cached dispatcher behind the
+wrapper, and the functions generated by `method_table`.
+
+    python -m benchmarks.visitors [--classes N] [--methods N] [--repeat N]
+"""
+import argparse
+import time
+
+from benchmarks.incremental import generate
+from cmp.cil import CIL_TO_MIPS, COOL_TO_CIL_VISITOR
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER
+from cmp.cool_lang.semantics.semantic_utils import Scope
+from cmp.cool_lang.semantics.type_checker import COOL_TYPE_CHECKER
+
+
+class LegacyDispatcher:
+    def __init__(self, dispatcher):
+        self.param_index = dispatcher.param_index
+        self.targets = dispatcher.targets
+        self.calls = 0
+
+    def __call__(self, *args, **kw):
+        self.calls += 1
+        typ = args[self.param_index].__class__
+        d = self.targets.get(typ)
+        if d is not None:
+            return d(*args, **kw)
+        else:
+            issub = issubclass
+            t = self.targets
+            ks = t.keys()
+            ans = [t[k](*args, **kw) for k in ks if issub(typ, k)]
+            if len(ans) == 1:
+                return ans.pop()
+            return ans
+
+
+def wrapped(visitor, dispatcher):
+    """
+    A subclass of `visitor` whose visits go through `dispatcher` behind a
+    wrapper, as `when` leaves them.
+    """
+
+    def ff(*args, **kw):
+        return dispatcher(*args, **kw)
+
+    return type(visitor.__name__, (visitor,), {"visit": ff})
+
+
+def timed(run, visitors, repeat):
+    """
+    Best time of `run` with every visitor, taking turns so that they all
+    run in the same conditions.
+    """
+    best = [float("inf")] * len(visitors)
+    for _ in range(repeat):
+        for index, visitor in enumerate(visitors):
+            start = time.perf_counter()
+            run(visitor)
+            best[index] = min(best[index], time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--classes", type=int, default=100)
+    parser.add_argument("--methods", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    compiler = COOL_COMPILER()
+    compiler.lexer.input(generate(args.classes, args.methods))
+    assert compiler.parser.parse(compiler.lexer), compiler.parser.errors
+    program = compiler.parser.result
+    checker = COOL_CHECKER(basic_context=compiler.basic_context)
+    assert checker.check_semantics(program), checker.errors
+    context = checker.context
+    cil_ast = COOL_TO_CIL_VISITOR(context).visit(program)
+
+    def check(visitor):
+        visitor(context, errors=[]).visit(program, Scope())
+
+    def to_cil(visitor):
+        visitor(context).visit(program)
+
+    def to_mips(visitor):
+        visitor(context).visit(cil_ast)
+
+    for name, run, visitor in (
+        ("COOL_TYPE_CHECKER", check, COOL_TYPE_CHECKER),
+        ("COOL_TO_CIL_VISITOR", to_cil, COOL_TO_CIL_VISITOR),
+        ("CIL_TO_MIPS", to_mips, CIL_TO_MIPS),
+    ):
+        dispatcher = visitor.visit.dispatcher
+        legacy = LegacyDispatcher(dispatcher)
+        run(wrapped(visitor, legacy))
+        visits = legacy.calls
+
+        scanning, cached, table = timed(
+            run,
+            [wrapped(visitor, legacy), wrapped(visitor, dispatcher), visitor],
+            args.repeat,
+        )
+        print(f"{name} ({visits} visits)")
+        for label, elapsed in (
+            ("scanning", scanning),
+            ("cached", cached),
+            ("method table", table),
+        ):
+            print(
+                f"  {label:<13}: {elapsed * 1000:8.2f} ms "
+                f"{elapsed * 1e9 / visits:8.0f} ns/visit "
+                f"({scanning / elapsed:4.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+__version__ = "0.1.0"
+
+__all__ = ["CompileResult", "compile_file", "compile_source"]
+
+
+def __getattr__(name):
+    # The compiler is only imported when the library API is used, so
+    # `import cmp.cache` stays cheap
+    if name in __all__:
+        from . import compiler
+
+        return getattr(compiler, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
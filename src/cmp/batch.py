@@ -0,0 +1,123 @@
+"""
+Batch compilation of many COOL files with a pool of warm compilers.
+
+Every worker process builds its own COOL_COMPILER once and then compiles
+every file it is given, results are yielded as soon as each file is done.
+"""
+import multiprocessing
+import os
+from typing import Iterable, List, Optional
+
+from .compiler import COOL_COMPILER
+from .cool_lang.errors import CompilationError
+from .server import handle_request
+
+_compiler: Optional[COOL_COMPILER] = None
+
+
+def collect_files(paths: Iterable[str]) -> List[str]:
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(
+                    os.path.join(root, name) for name in names if name.endswith(".cl")
+                )
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def output_path(
+    input_file: str, output_dir: Optional[str] = None, root: Optional[str] = None
+):
+    """
+    The MIPS file of `input_file`, next to it or in `output_dir` under its
+    path relative to the `root` folder (its own folder by default).
+    """
+    if input_file.endswith(".cl"):
+        output_file = input_file[:-2] + "mips"
+    else:
+        output_file = input_file + ".mips"
+    if output_dir is not None:
+        if root is None:
+            root = os.path.dirname(os.path.abspath(input_file))
+        relative = os.path.relpath(os.path.abspath(output_file), root)
+        output_file = os.path.join(output_dir, relative)
+    return output_file
+
+
+def output_paths(files: List[str], output_dir: Optional[str] = None) -> List[str]:
+    """
+    The MIPS files of `files`. In `output_dir` they keep their paths
+    relative to the deepest folder holding all of them, so files of
+    different folders with the same name do not share their output.
+    """
+    root = None
+    if output_dir is not None and files:
+        root = os.path.commonpath(
+            [os.path.dirname(os.path.abspath(file)) for file in files]
+        )
+    outputs = [output_path(file, output_dir, root) for file in files]
+    seen = set()
+    for output in outputs:
+        if output in seen:
+            raise ValueError(f"{output} is the output of more than one file")
+        seen.add(output)
+    return outputs
+
+
+def _init_worker(lexer: str = "ply", parser: str = "ply"):
+    global _compiler
+    _compiler = COOL_COMPILER(lexer, parser)
+
+
+def compile_job(job):
+    input_file, output_file, cil = job
+    if _compiler is None:
+        _init_worker()
+    request = {
+        "id": input_file,
+        "input": input_file,
+        "output": output_file,
+        "cil": cil,
+    }
+    try:
+        return handle_request(_compiler, request)
+    except Exception as e:  # a broken file must not stop the batch
+        return {
+            "id": input_file,
+            "ok": False,
+            "errors": [str(CompilationError(0, 0, f"{type(e).__name__}: {e}"))],
+        }
+
+
+def compile_batch(
+    files: Iterable[str],
+    jobs: Optional[int] = None,
+    cil: bool = False,
+    output_dir: Optional[str] = None,
+    lexer: str = "ply",
+    parser: str = "ply",
+):
+    """
+    Compile `files` with `jobs` worker processes (one per core by default)
+    and yield the response of every file in completion order.
+    """
+    files = list(files)
+    outputs = output_paths(files, output_dir)
+    if output_dir is not None:
+        for folder in sorted({os.path.dirname(output) for output in outputs}):
+            os.makedirs(folder, exist_ok=True)
+
+    batch = [(file, output, cil) for file, output in zip(files, outputs)]
+    jobs = min(jobs or os.cpu_count() or 1, len(batch))
+    if jobs <= 1:
+        _init_worker(lexer, parser)
+        yield from map(compile_job, batch)
+        return
+
+    with multiprocessing.Pool(
+        jobs, initializer=_init_worker, initargs=(lexer, parser)
+    ) as pool:
+        yield from pool.imap_unordered(compile_job, batch)
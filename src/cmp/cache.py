@@ -0,0 +1,184 @@
+"""
+Content addressed compilation cache.
+
+Entries are keyed by a hash of the source code, the compiler version, the
+compiler sources (which include the runtime prelude emitted by the code
+generator) and the compilation flags. Every entry is a JSON file written
+atomically, so several compiler processes can share the same directory.
+The hit, miss and eviction counters and the total size of the entries are
+kept in a small fixed size file updated under a lock, and the least
+recently used entries are evicted when that size grows over the limit.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from typing import Dict, Optional
+
+from . import __version__
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_fingerprint: Optional[str] = None
+
+
+def compiler_fingerprint():
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(__version__.encode())
+        package = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(package):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, package).encode())
+                    with open(path, "rb") as fd:
+                        digest.update(fd.read())
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+
+class CachedResult:
+    def __init__(self, errors, cil, mips):
+        self.errors = errors
+        self.cil = cil
+        self.mips = mips
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+class CompilationCache:
+    STATS = ("hits", "misses", "evictions")
+    COUNTERS = STATS + ("size",)
+    _counters = struct.Struct("<4q")
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self.counters_path = os.path.join(self.path, "counters")
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, code: str, cil: bool = False):
+        digest = hashlib.sha256(compiler_fingerprint().encode())
+        digest.update(b"cil" if cil else b"mips")
+        digest.update(code.encode())
+        return digest.hexdigest()
+
+    def entry_path(self, key: str):
+        return os.path.join(self.path, key[:2], key + ".json")
+
+    def get(self, code: str, cil: bool = False) -> Optional[CachedResult]:
+        path = self.entry_path(self.key(code, cil))
+        try:
+            with open(path, "r") as fd:
+                entry = json.load(fd)
+            os.utime(path)
+        except (OSError, ValueError):
+            # missing, evicted by another process or broken entry
+            self._update({"misses": 1})
+            return None
+        self._update({"hits": 1})
+        return CachedResult(entry["errors"], entry["cil"], entry["mips"])
+
+    def put(self, code: str, result, cil: bool = False):
+        path = self.entry_path(self.key(code, cil))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "errors": [str(error) for error in result.errors],
+            "cil": result.cil,
+            "mips": result.mips,
+        }
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_fd:
+                json.dump(entry, tmp_fd)
+            size = os.path.getsize(tmp)
+            try:
+                size -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+        # Only the tracked size is checked, the cache folder is walked when
+        # it has to be evicted
+        if self._update({"size": size})["size"] > self.max_size:
+            self.evict()
+
+    def entries(self):
+        for root, _, files in os.walk(self.path):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    yield stat.st_mtime, stat.st_size, path
+
+    def evict(self):
+        entries = sorted(self.entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        evictions = 0
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+                evictions += 1
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+        # The walk also corrects the tracked size when it drifted
+        self._update({"evictions": evictions}, size=size)
+
+    def clear(self):
+        for _, _, path in list(self.entries()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        try:
+            os.remove(self.counters_path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self):
+        stats = self._update({})
+        del stats["size"]
+        sizes = [size for _, size, _ in self.entries()]
+        stats["entries"] = len(sizes)
+        stats["size"] = sum(sizes)
+        return stats
+
+    def _update(self, deltas: Dict[str, int], size: Optional[int] = None):
+        # The counters are rewritten in place under an exclusive lock, so
+        # several processes sharing the cache never lose an update
+        fd = os.open(self.counters_path, os.O_RDWR | os.O_CREAT)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            data = os.pread(fd, self._counters.size, 0)
+            fresh = len(data) != self._counters.size
+            if fresh:
+                # New or broken counters, the size is taken from the entries
+                # already written, which include the one being counted
+                counters = dict.fromkeys(self.COUNTERS, 0)
+                counters["size"] = sum(entry[1] for entry in self.entries())
+                deltas = {name: deltas[name] for name in deltas if name != "size"}
+            else:
+                counters = dict(zip(self.COUNTERS, self._counters.unpack(data)))
+            for name, delta in deltas.items():
+                counters[name] += delta
+            if size is not None:
+                counters["size"] = size
+            if fresh or deltas or size is not None:
+                os.pwrite(fd, self._counters.pack(*counters.values()), 0)
+        finally:
+            os.close(fd)
+        return counters
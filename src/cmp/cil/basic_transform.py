@@ -1,5 +1,5 @@
 import re
-from typing import Any, Union, cast
+from typing import Any, Dict, Union, cast
 
 from ..cool_lang.semantics.semantic_utils import Attribute, Type
 from .ast import (
@@ -37,17 +37,44 @@ class VariableInfo:
         self.type = vtype
 
 
+class BasicsSnapshot:
+    """
+    The CIL of the basic types, the same for every program. The nodes are
+    shared by every transform loading it and never changed, a transform
+    copies the lists it appends the nodes of its program to.
+    """
+
+    def __init__(self, transform: "BASE_COOL_CIL_TRANSFORM"):
+        self.dottypes = tuple(transform.dottypes)
+        self.dotdata = tuple(transform.dotdata)
+        self.dotcode = tuple(transform.dotcode)
+        self.label_count = transform.label_count
+
+    def load(self, transform: "BASE_COOL_CIL_TRANSFORM"):
+        transform.dottypes = list(self.dottypes)
+        transform.dotdata = list(self.dotdata)
+        transform.data_nodes = {data.value: data for data in self.dotdata}
+        transform.dotcode = list(self.dotcode)
+        transform.label_count = self.label_count
+
+
+# The snapshot of every transform class, taken by its first instance
+_basics: Dict[type, BasicsSnapshot] = {}
+
+
 class BASE_COOL_CIL_TRANSFORM:
     def __init__(self, context):
         self.dottypes = []
         self.dotdata = []
+        # The data of every value, the names of all the classes are data
+        self.data_nodes = {}
         self.dotcode = []
         self.current_type = None
         self.current_method = None
         self.current_function = None
         self.context = context
         self.label_count = 0
-        self.build_basics()
+        self.load_basics()
 
     @property
     def params(self):
@@ -114,10 +141,14 @@ class BASE_COOL_CIL_TRANSFORM:
 
     def to_label_name(self, label_name):
         self.label_count += 1
-        return (
-            f"label_{label_name}{self.label_count}_at_{self.current_function.name[9:]}"
+        return self.label_name(
+            label_name, self.label_count, self.current_function.name[9:]
         )
 
+    @staticmethod
+    def label_name(label_name, count, function_name):
+        return f"label_{label_name}{count}_at_{function_name}"
+
     def register_function(self, function_name):
         function_node = FunctionNode(function_name, [], [], [])
         self.dotcode.append(function_node)
@@ -129,17 +160,25 @@ class BASE_COOL_CIL_TRANSFORM:
         return type_node
 
     def register_data(self, value):
-        data_node = None
-        for data in self.dotdata:
-            if data.value == value:
-                data_node = data
-                break
-        else:
+        data_node = self.data_nodes.get(value)
+        if data_node is None:
             vname = f"data_{len(self.dotdata)}"
-            data_node = DataNode(vname, value)
+            data_node = self.data_nodes[value] = DataNode(vname, value)
             self.dotdata.append(data_node)
         return data_node
 
+    def load_basics(self):
+        """
+        Start with the CIL of the basic types, built by the first transform
+        of the class in the process and loaded from its snapshot later on.
+        """
+        snapshot = _basics.get(type(self))
+        if snapshot is None:
+            self.build_basics()
+            _basics[type(self)] = BasicsSnapshot(self)
+        else:
+            snapshot.load(self)
+
     def build_basics(self):
         self.build_basic_object()
         self.build_basic_int()
@@ -49,7 +49,7 @@ from .ast import (
     TypeOfNode,
     VoidNode,
 )
-from .utils import TypeData, on, when
+from .utils import TypeData, method_table, on, when
 from .utils.mips_syntax import DATA_SIZE, Mips
 from .utils.mips_syntax import Register as Reg
 
@@ -68,6 +68,7 @@ def mips_comment(msg: str):
     return inner
 
 
+@method_table
 class CIL_TO_MIPS(object):
     def __init__(self, context=Context):
         self.types = []
@@ -210,11 +211,14 @@ class CIL_TO_MIPS(object):
 
         self.mips.exit()
 
-        for function in node.dotcode:
-            self.visit(function)
+        self.emit_code(node.dotcode)
 
         self.mips.empty()
 
+    def emit_code(self, dotcode):
+        for function in dotcode:
+            self.visit(function)
+
     @when(DataNode)
     def visit(self, node: DataNode):  # noqa: F811
         self.mips.data_label(node.name)
@@ -1,7 +1,7 @@
 from typing import List, Set
 
 from ..cool_lang import ast as cool
-from ..cool_lang.semantics.semantic_utils import Attribute, Type
+from ..cool_lang.semantics.semantic_utils import Type
 from .ast import (
     AllocateNode,
     ArgNode,
@@ -34,9 +34,10 @@ from .ast import (
     SetNode
 )
 from .basic_transform import BASE_COOL_CIL_TRANSFORM, VariableInfo
-from .utils import Scope, on, when
+from .utils import Scope, method_table, on, trampoline, when
 
 
+@method_table
 class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
     @on("node")
     def visit(self, node, scope: Scope):  # noqa:F811
@@ -76,16 +77,16 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
         return result
 
     def find_type_name(self, typex, func_name):
-        if func_name in typex.methods:
-            return typex.name
-        return self.find_type_name(typex.parent, func_name)
+        while func_name not in typex.methods:
+            typex = typex.parent
+        return typex.name
 
     def init_class_attr(self, scope: Scope, class_id, self_inst):
         attr_nodes = self.attr_init[class_id]
         for attr in attr_nodes:
-            attr_scope = Scope(parent=scope)
-            attr_scope.define_var("self", self_inst)
-            self.visit(attr, attr_scope, class_id)
+            with scope.enter():
+                scope.define_var("self", self_inst)
+                self.visit(attr, scope, class_id)
 
     def build_attr_init(self, node: cool.ProgramNode):
         self.attr_init = dict()
@@ -160,29 +161,24 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
             (method.name, self.to_function_name(method.name, typex.name))
             for method, typex in self.current_type.get_all_methods()
         ]
-        type_node.features = [
-            feature.name
-            if isinstance(feature, Attribute)
-            else (
-                feature[0].name,
-                self.to_function_name(feature[0].name, feature[1].name),
-            )
-            for feature in self.current_type.get_all_features()
-        ]
+        type_node.features = self.get_features()
 
+        self.build_methods(node, scope)
+
+        self.current_type = None
+
+    def build_methods(self, node: cool.ClassDeclarationNode, scope: Scope):
         for feature in node.features:
             if isinstance(feature, cool.FuncDeclarationNode):
                 self.visit(feature, scope)
 
-        self.current_type = None
-
     @when(cool.AttrDeclarationNode)
     def visit(  # noqa:F811
         self, node: cool.AttrDeclarationNode, scope: Scope, typex: str = None
     ):
         result = None
         if node.expression:
-            result = self.visit(node.expression, scope)
+            result = trampoline(self.visit, node.expression, scope)
         elif node.type == "String":
             result = self.register_data("").name
         else:
@@ -197,7 +193,7 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.FuncDeclarationNode)
     def visit(self, node: cool.FuncDeclarationNode, scope: Scope):  # noqa:F811
-        func_scope = Scope(parent=scope)
+        scope.enter()
         self.current_method = self.current_type.get_method(node.id)
         type_name = self.current_type.name
 
@@ -205,30 +201,30 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
             self.to_function_name(self.current_method.name, type_name)
         )
         self_local = self.register_param(VariableInfo("self", None))
-        func_scope.define_var("self", self_local)
+        scope.define_var("self", self_local)
         for param_name in self.current_method.param_names:
             param_local = self.register_param(VariableInfo(param_name, None))
-            func_scope.define_var(param_name, param_local)
+            scope.define_var(param_name, param_local)
 
-        body = self.visit(node.expression, func_scope)
+        body = trampoline(self.visit, node.expression, scope)
         self.register_instruction(ReturnNode(body))
+        scope.exit()
 
         self.current_method = self.current_function = None
 
     @when(cool.IfThenElseNode)
     def visit(self, node: cool.IfThenElseNode, scope: Scope):  # noqa:F811
-        if_scope = Scope(parent=scope)
-        cond_result = self.visit(node.condition, scope)
+        cond_result = yield node.condition, scope
         result = self.define_internal_local()
         true_label = self.to_label_name("if_true")
         end_label = self.to_label_name("end_if")
         # cond_result = self.unpack_type_by_value(cond_result, node.condition.static_type)
         self.register_instruction(GotoIfNode(cond_result, true_label))
-        false_result = self.visit(node.else_body, if_scope)
+        false_result = yield node.else_body, scope
         self.register_instruction(AssignNode(result, false_result))
         self.register_instruction(GotoNode(end_label))
         self.register_instruction(LabelNode(true_label))
-        true_result = self.visit(node.if_body, if_scope)
+        true_result = yield node.if_body, scope
         self.register_instruction(AssignNode(result, true_result))
         self.register_instruction(LabelNode(end_label))
 
@@ -236,17 +232,16 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.WhileLoopNode)
     def visit(self, node: cool.WhileLoopNode, scope: Scope):  # noqa:F811
-        while_scope = Scope(parent=scope)
         loop_label = self.to_label_name("loop")
         body_label = self.to_label_name("body")
         end_label = self.to_label_name("pool")
         self.register_instruction(LabelNode(loop_label))
-        condition = self.visit(node.condition, scope)
+        condition = yield node.condition, scope
         # condition_raw = self.unpack_type_by_value(condition, node.condition.static_type)
         self.register_instruction(GotoIfNode(condition, body_label))
         self.register_instruction(GotoNode(end_label))
         self.register_instruction(LabelNode(body_label))
-        self.visit(node.body, while_scope)
+        yield node.body, scope
         self.register_instruction(GotoNode(loop_label))
         self.register_instruction(LabelNode(end_label))
         zero = self.define_internal_local()
@@ -258,13 +253,13 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
         result = None
         assert node.expressions, "BlockNode empty"
         for expr in node.expressions:
-            result = self.visit(expr, scope)
+            result = yield expr, scope
         return result
 
     @when(cool.LetNode)
     def visit(self, node: cool.LetNode, scope: Scope):  # noqa:F811
         var_name = self.register_local(VariableInfo(node.id, None))
-        result = self.visit(node.expression, scope) if node.expression else 0
+        result = (yield node.expression, scope) if node.expression else 0
         if result == 0:
             typex = node.type
             # if typex in ["Int", "String", "Bool"]:
@@ -283,11 +278,11 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.LetInNode)
     def visit(self, node: cool.LetInNode, scope: Scope):  # noqa:F811
-        let_scope = Scope(parent=scope)
-        for let in node.let_body:
-            self.visit(let, let_scope)
+        with scope.enter():
+            for let in node.let_body:
+                yield let, scope
 
-        result = self.visit(node.in_body, let_scope)
+            result = yield node.in_body, scope
         return result
 
     @when(cool.CaseNode)
@@ -308,11 +303,11 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
         self.register_instruction(EqualNode(cond, typex, type_val))
         self.register_instruction(NotNode(not_cond, cond))
         self.register_instruction(GotoIfNode(not_cond, case_label))
-        case_scope = Scope(parent=scope)
         case_var = self.register_local(VariableInfo(node.id, None))
-        case_scope.define_var(node.id, case_var)
-        self.register_instruction(AssignNode(case_var, expr_inst))
-        case_result = self.visit(node.expression, case_scope)
+        with scope.enter():
+            scope.define_var(node.id, case_var)
+            self.register_instruction(AssignNode(case_var, expr_inst))
+            case_result = yield node.expression, scope
         self.register_instruction(AssignNode(result_inst, case_result))
         self.register_instruction(GotoNode(end_label))
         self.register_instruction(LabelNode(case_label))
@@ -325,12 +320,12 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
         result = self.define_internal_local()
         type_inst = self.define_internal_local()
         is_void = self.define_internal_local()
-        obj_inst = self.visit(node.expression, scope)
+        obj_inst = yield node.expression, scope
         self.register_instruction(IsVoidNode(is_void, obj_inst))
         self.register_instruction(GotoIfNode(is_void, error_label))
         self.register_instruction(TypeOfNode(obj_inst, type_inst))
         for case in order_cases:
-            self.visit(case, scope, type_inst, result, end_label, obj_inst)
+            yield case, scope, type_inst, result, end_label, obj_inst
         self.register_instruction(LabelNode(error_label))
         self.register_instruction(ErrorNode())
         self.register_instruction(LabelNode(end_label))
@@ -339,7 +334,7 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.AssignNode)
     def visit(self, node: cool.AssignNode, scope: Scope):  # noqa:F811
-        value = self.visit(node.expression, scope)
+        value = yield node.expression, scope
         pvar = scope.get_var(node.id)
         if not pvar:
             # value = self.unpack_type_by_value(value, node.expression.static_type)
@@ -363,7 +358,7 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
         result = self.define_internal_local()
         rev_args = []
         for arg in node.args:
-            arg_value = self.visit(arg, scope)
+            arg_value = yield arg, scope
             rev_args = [arg_value] + rev_args
         for arg_value in rev_args:
             self.register_instruction(ArgNode(arg_value))
@@ -383,11 +378,11 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
         result = self.define_internal_local()
         rev_args = []
         for arg in node.args:
-            arg_value = self.visit(arg, scope)
+            arg_value = yield arg, scope
             rev_args = [arg_value] + rev_args
         for arg_value in rev_args:
             self.register_instruction(ArgNode(arg_value))
-        obj_inst = self.visit(node.obj, scope)
+        obj_inst = yield node.obj, scope
         obj_inst = self.pack_type_by_value(obj_inst, node.obj.static_type)
         self.register_instruction(ArgNode(obj_inst))
         if func_name:
@@ -413,7 +408,7 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.IsVoidNode)
     def visit(self, node: cool.IsVoidNode, scope: Scope):  # noqa:F811
-        body = self.visit(node.expression, scope)
+        body = yield node.expression, scope
         result = self.define_internal_local()
         self.register_instruction(IsVoidNode(result, body))
         # result = self.pack_type_by_value(result, node.static_type)
@@ -421,7 +416,7 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.NotNode)
     def visit(self, node: cool.NotNode, scope: Scope):  # noqa:F811
-        value = self.visit(node.expression, scope)
+        value = yield node.expression, scope
         # value = self.unpack_type_by_value(value, node.expression.static_type)
         result = self.define_internal_local()
         self.register_instruction(NotNode(result, value))
@@ -430,7 +425,7 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.ComplementNode)
     def visit(self, node: cool.ComplementNode, scope: Scope):  # noqa:F811
-        value = self.visit(node.expression, scope)
+        value = yield node.expression, scope
         # value = self.unpack_type_by_value(value, node.expression.static_type)
         result = self.define_internal_local()
         self.register_instruction(ComplementNode(result, value))
@@ -439,8 +434,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.PlusNode)
     def visit(self, node: cool.PlusNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -450,8 +445,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.MinusNode)
     def visit(self, node: cool.MinusNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -461,8 +456,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.StarNode)
     def visit(self, node: cool.StarNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -472,8 +467,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.DivNode)
     def visit(self, node: cool.DivNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -483,8 +478,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.EqualNode)
     def visit(self, node: cool.EqualNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -497,8 +492,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.LessNode)
     def visit(self, node: cool.LessNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -508,8 +503,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
 
     @when(cool.LessEqualNode)
     def visit(self, node: cool.LessEqualNode, scope: Scope):  # noqa:F811
-        left = self.visit(node.left, scope)
-        right = self.visit(node.right, scope)
+        left = yield node.left, scope
+        right = yield node.right, scope
         # left = self.unpack_type_by_value(left, node.left.static_type)
         # right = self.unpack_type_by_value(right, node.right.static_type)
         result = self.define_internal_local()
@@ -526,13 +521,8 @@ class COOL_TO_CIL_VISITOR(BASE_COOL_CIL_TRANSFORM):
             self.register_instruction(
                 GetAttribNode(pvar, selfx, node.token, self.current_type.name)
             )
-            vattrbs = [
-                item
-                for item in self.current_type.get_all_attributes()
-                if item.name == node.token
-            ]
-            assert vattrbs, "IdNode: attributes is empty"
-            vattr: Attribute = vattrbs[0]
+            vattr = self.current_type.find_attribute(node.token)
+            assert vattr is not None, "IdNode: attributes is empty"
             # pvar = self.pack_type_by_value(pvar, vattr.type)
         else:
             pvar = pvar.local_name
@@ -1,3 +1,3 @@
 from .cil_scope import Scope  # noqa:F401
 from .type_data import TypeData  # noqa:F401
-from .visitor import on, when  # noqa:F401
+from .visitor import method_table, on, trampoline, when  # noqa:F401
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class Var:
@@ -14,30 +14,50 @@ class Var:
 
 
 class Scope:
-    def __init__(self, parent: Optional["Scope"] = None):
-        self.parent = parent
-        self.vars: Dict[str, Var] = {}
+    """
+    Flat symbol table. Every name maps to the stack of its bindings, the
+    innermost last, and `exit` pops the bindings defined since the matching
+    `enter`, so no lookup walks the enclosing levels.
+    """
 
-    def child(self):
-        return Scope(parent=self)
+    def __init__(self):
+        self.bindings: Dict[str, List[Var]] = {}
+        self.log: List[str] = []
+        self.marks: List[int] = []
+
+    def enter(self) -> "Scope":
+        self.marks.append(len(self.log))
+        return self
+
+    def exit(self):
+        mark = self.marks.pop()
+        log, bindings = self.log, self.bindings
+        while len(log) > mark:
+            name = log.pop()
+            stack = bindings[name]
+            stack.pop()
+            if not stack:
+                del bindings[name]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exit()
 
     def define_var(self, name: str, local_name: str) -> Var:
-        var = self.vars[name] = Var(name, local_name)
+        var = Var(name, local_name)
+        self.bindings.setdefault(name, []).append(var)
+        self.log.append(name)
         return var
 
     def get_var(self, name: str) -> Optional[Var]:
-        try:
-            return self.vars[name]
-        except KeyError:
-            if self.parent is not None:
-                return self.parent.get_var(name)
-            return None
+        stack = self.bindings.get(name)
+        return stack[-1] if stack else None
 
     def __str__(self):
-        cond = self.parent is None
-        result = "{\n"
-        result += "\t" if cond else "Parent:\n" + f"{self.parent}\n\t"
-        result += "\n\t".join(str(x) for x in self.vars.values())
+        result = "{\n\t"
+        result += "\n\t".join(str(stack[-1]) for stack in self.bindings.values())
         result += "\n}"
         return result
 
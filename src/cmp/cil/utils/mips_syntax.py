@@ -1,3 +1,5 @@
+import io
+import tempfile
 from enum import Enum
 from typing import List, Optional
 
@@ -93,28 +95,81 @@ def autowritedata(func):
 
 
 class Mips:
+    """
+    The `.text` section is streamed to a spooled temporary file every
+    `FLUSH_LINES` instructions, it only stays in memory while it is smaller
+    than `SPOOL_SIZE`. The `.data` entries are collected apart and both
+    sections are spliced by `write_to` (or `compile`).
+    """
+
+    SPOOL_SIZE = 1 << 20
+    CHUNK_SIZE = 1 << 16
+    FLUSH_LINES = 1024
+
     def __init__(self, zip_mode=False):
-        self.DOTTEXT: List[str] = []
+        self.DOTTEXT = tempfile.SpooledTemporaryFile(
+            max_size=self.SPOOL_SIZE, mode="w+", encoding="utf-8"
+        )
         self.DOTDATA: List[str] = []
         self.zip_mode = zip_mode
+        self.text_lines = 0
+        self.pending: List[str] = []
+
+    @property
+    def lines(self):
+        data_lines = sum(data.count("\n") + 1 for data in self.DOTDATA)
+        return data_lines + self.text_lines + len(self.pending) + 2
 
     def write_inst(self, instruction: str, tabs: int = 0):
-        tabstr = ""
-        for _ in range(tabs):
-            tabstr += "\t"
-        self.DOTTEXT.append(f"{tabstr}{instruction}")
+        self.pending.append("\t" * tabs + f"{instruction}")
+        if len(self.pending) >= self.FLUSH_LINES:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.text_lines += len(self.pending)
+            self.DOTTEXT.write("\n" + "\n".join(self.pending))
+            self.pending.clear()
+
+    def write_text(self, text: str):
+        """
+        Append `text`, the `.text` section of another emitter
+        """
+        self.flush()
+        self.text_lines += text.count("\n")
+        self.DOTTEXT.write(text)
+
+    def text(self) -> str:
+        self.flush()
+        self.DOTTEXT.seek(0)
+        text = self.DOTTEXT.read()
+        self.DOTTEXT.seek(0, io.SEEK_END)
+        return text
 
     def write_data(self, data: str, tabs: int = 0):
         self.DOTDATA.append(f"{data}")
 
+    def write_to(self, fd):
+        """
+        Write the whole program to the file object `fd`
+        """
+        fd.write(Directive.data.value)
+        for data in self.DOTDATA:
+            fd.write(f"\n{data}")
+        fd.write(f"\n{Directive.text.value}")
+        self.flush()
+        self.DOTTEXT.seek(0)
+        for chunk in iter(lambda: self.DOTTEXT.read(self.CHUNK_SIZE), ""):
+            fd.write(chunk)
+        self.DOTTEXT.seek(0, io.SEEK_END)
+
     def compile(self):
-        return "\n".join(
-            [Directive.data.value]
-            + self.DOTDATA
-            + []
-            + [Directive.text.value]
-            + self.DOTTEXT
-        )
+        buffer = io.StringIO()
+        self.write_to(buffer)
+        return buffer.getvalue()
+
+    def close(self):
+        self.DOTTEXT.close()
 
     def push(self, register: Register):
         self.addi(Reg.sp, Reg.sp, -DATA_SIZE)
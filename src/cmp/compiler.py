@@ -0,0 +1,222 @@
+import threading
+from typing import TYPE_CHECKING, List, Optional, TextIO
+
+from .cool_lang.ast import ProgramNode
+from .cool_lang.errors import Error
+from .cool_lang.lexer import COOL_FAST_LEXER, COOL_LEXER
+from .cool_lang.parser import COOL_DESCENT_PARSER, COOL_PARSER
+from .cool_lang.semantics import COOL_CHECKER, shared_basic_context
+from .profiler import NULL_PROFILER, count_nodes
+
+if TYPE_CHECKING:
+    from .cil.ast import ProgramNode as CILProgramNode
+    from .incremental import IncrementalState
+
+
+class CompileResult:
+    def __init__(self):
+        self.errors: List[Error] = []
+        self.cil_ast: Optional["CILProgramNode"] = None
+        self.cil: Optional[str] = None
+        self.mips: Optional[str] = None
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+LEXERS = {"ply": COOL_LEXER, "fast": COOL_FAST_LEXER}
+PARSERS = {"ply": COOL_PARSER, "descent": COOL_DESCENT_PARSER}
+
+
+class COOL_COMPILER:
+    """
+    Full compilation pipeline. The lexer and the parser are built once and
+    reused by every call to `compile`, the basic types context is shared by
+    every compiler of the process. `lexer` selects the scanner engine, one
+    of `LEXERS`, and `parser` the parser engine, one of `PARSERS`.
+    """
+
+    def __init__(self, lexer: str = "ply", parser: str = "ply"):
+        self.engines = (lexer, parser)
+        self.lexer = LEXERS[lexer]()
+        self.lexer.build()
+        self.parser = PARSERS[parser]()
+        self.parser.build()
+        self.basic_context = shared_basic_context()
+
+    def compile(
+        self,
+        code: str,
+        cil: bool = False,
+        verbose: bool = False,
+        profiler=NULL_PROFILER,
+        output: Optional[TextIO] = None,
+        check: bool = False,
+        incremental: Optional["IncrementalState"] = None,
+        check_jobs: Optional[int] = 1,
+    ):
+        """
+        Compile `code`. When an `output` file object is given the MIPS code
+        is streamed to it instead of being returned in `result.mips`. With
+        `check` the compilation stops after the semantic checks. With an
+        `incremental` state only the code of the classes changed since the
+        build that left it is generated again, see `cmp.incremental`.
+        `check_jobs` processes check the types of big programs (one per
+        core when None or 0), see `cmp.cool_lang.semantics.parallel_checker`.
+        """
+        result = CompileResult()
+
+        if profiler is NULL_PROFILER:
+            # The parser pulls the tokens from the lexer as it needs them
+            self.lexer.input(code)
+            parsed = self.parser.parse(self.lexer)
+            if not parsed:
+                self.lexer.drain()
+        else:
+            with profiler.stage("COOL_LEXER.tokenize"):
+                self.lexer.tokenize(code)
+            profiler.count("tokens", len(self.lexer.result))
+            if not self.lexer.errors:
+                with profiler.stage("COOL_PARSER.parse"):
+                    parsed = self.parser.parse(self.lexer)
+
+        # Lexical errors are reported before the syntactic ones, wherever
+        # they are in the file
+        if self.lexer.errors:
+            result.errors = list(self.lexer.errors)
+            return result
+        if not parsed:
+            result.errors = list(self.parser.errors)
+            return result
+
+        return self.compile_program(
+            self.parser.result,
+            cil=cil,
+            verbose=verbose,
+            profiler=profiler,
+            output=output,
+            check=check,
+            incremental=incremental,
+            check_jobs=check_jobs,
+        )
+
+    def compile_program(
+        self,
+        program: ProgramNode,
+        cil: bool = False,
+        verbose: bool = False,
+        profiler=NULL_PROFILER,
+        output: Optional[TextIO] = None,
+        check: bool = False,
+        incremental: Optional["IncrementalState"] = None,
+        check_jobs: Optional[int] = 1,
+    ):
+        """
+        Check and generate the code of an already parsed `program`, see
+        `compile`. The CIL code, the verbose output and a check alone always
+        take a full build.
+        """
+        result = CompileResult()
+
+        if profiler is not NULL_PROFILER:
+            profiler.count("ast_nodes", count_nodes(program))
+        checker = COOL_CHECKER(basic_context=self.basic_context, jobs=check_jobs)
+        if incremental is not None and not (cil or verbose or check):
+            from .incremental import compile_incremental
+
+            return compile_incremental(
+                checker, program, incremental, profiler=profiler, output=output
+            )
+        if not checker.check_semantics(program, verbose=verbose, profiler=profiler):
+            result.errors = list(checker.errors)
+            return result
+        if check:
+            return result
+
+        # The backend is only imported once a program reaches code generation
+        from .cil import CIL_FORMATTER, CIL_TO_MIPS, COOL_TO_CIL_VISITOR
+
+        with profiler.stage("COOL_TO_CIL_VISITOR"):
+            cil_ast = COOL_TO_CIL_VISITOR(checker.context).visit(program)
+        result.cil_ast = cil_ast
+        profiler.count("cil_types", len(cil_ast.dottypes))
+        profiler.count("cil_data", len(cil_ast.dotdata))
+        profiler.count("cil_functions", len(cil_ast.dotcode))
+        profiler.count(
+            "cil_instructions", sum(len(f.instructions) for f in cil_ast.dotcode)
+        )
+        profiler.count("cil_locals", sum(len(f.localvars) for f in cil_ast.dotcode))
+        if cil:
+            with profiler.stage("CIL_FORMATTER"):
+                result.cil = CIL_FORMATTER().visit(cil_ast)
+
+        ctm = CIL_TO_MIPS(checker.context)
+        try:
+            with profiler.stage("CIL_TO_MIPS"):
+                ctm.visit(cil_ast)
+            if output is None:
+                with profiler.stage("Mips.compile"):
+                    result.mips = ctm.mips.compile()
+            else:
+                with profiler.stage("Mips.write_to"):
+                    ctm.mips.write_to(output)
+            profiler.count("mips_lines", ctm.mips.lines)
+        finally:
+            ctm.mips.close()
+        return result
+
+    def compile_files(
+        self,
+        files: List[str],
+        jobs: Optional[int] = None,
+        profiler=NULL_PROFILER,
+        **kwargs,
+    ):
+        """
+        Compile the program made of the classes of all the `files`, parsed
+        by `jobs` worker processes (one per core by default). The errors
+        tell the file they were found in.
+        """
+        from .project import parse_files
+
+        with profiler.stage("parse_files"):
+            program, errors, sources = parse_files(files, jobs, *self.engines)
+        if errors:
+            result = CompileResult()
+            result.errors = errors
+            return result
+
+        result = self.compile_program(program, profiler=profiler, **kwargs)
+        for error in result.errors:
+            sources.relocate(error)
+        return result
+
+
+_local = threading.local()
+
+
+def _thread_compiler() -> COOL_COMPILER:
+    # The lexer and the parser keep state while they run, every thread gets
+    # its own warm compiler
+    compiler = getattr(_local, "compiler", None)
+    if compiler is None:
+        compiler = _local.compiler = COOL_COMPILER()
+    return compiler
+
+
+def compile_source(
+    code: str, *, emit_cil: bool = False, check: bool = False
+) -> CompileResult:
+    """
+    Compile the COOL program `code`. Errors are returned in the result,
+    nothing is printed and the process is never exited.
+    """
+    return _thread_compiler().compile(code, cil=emit_cil, check=check)
+
+
+def compile_file(
+    path: str, *, emit_cil: bool = False, check: bool = False
+) -> CompileResult:
+    with open(path, "r") as fd:
+        return compile_source(fd.read(), emit_cil=emit_cil, check=check)
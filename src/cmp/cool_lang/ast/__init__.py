@@ -1,3 +1,4 @@
+from .arena import NodeArena  # noqa:F401
 from .arithmetic_node import ArithmeticNode  # noqa:F401
 from .assign_node import AssignNode  # noqa:F401
 from .atomic_node import AtomicNode  # noqa:F401
@@ -27,11 +28,12 @@ from .let_node import LetNode  # noqa:F401
 from .member_call_node import MemberCallNode  # noqa:F401
 from .minus_node import MinusNode  # noqa:F401
 from .new_node import NewNode  # noqa:F401
-from .node import Node  # noqa:F401
+from .node import Node, node_fields  # noqa:F401
 from .not_node import NotNode  # noqa:F401
 from .param_declaration_node import ParamDeclarationNode  # noqa:F401
 from .plus_node import PlusNode  # noqa:F401
 from .program_node import ProgramNode  # noqa:F401
+from .serialization import dump_ast, load_ast  # noqa:F401
 from .star_node import StarNode  # noqa:F401
 from .string_node import StringNode  # noqa:F401
 from .unary_node import UnaryNode  # noqa:F401
@@ -0,0 +1,170 @@
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .class_declaration_node import ClassDeclarationNode
+from .node import Node, node_fields
+
+# How every field is stored in the arena, the fields missing here hold a
+# single child node (or None)
+LIST_FIELDS = {
+    "classes",
+    "features",
+    "params",
+    "expressions",
+    "let_body",
+    "cases",
+    "args",
+}
+STRING_FIELDS = {"id", "type", "token", "parent"}
+# Filled by the semantic passes, not kept in the arena
+SKIPPED_FIELDS = {"line", "column", "static_type", "_visited"}
+
+NODE, LIST, STRING = range(3)
+
+
+@lru_cache(maxsize=None)
+def node_kinds() -> Tuple[type, ...]:
+    kinds = []
+    pending = [Node]
+    while pending:
+        cls = pending.pop()
+        kinds.append(cls)
+        pending.extend(cls.__subclasses__())
+    return tuple(sorted(kinds, key=lambda cls: cls.__name__))
+
+
+@lru_cache(maxsize=None)
+def arena_fields(node_type: type) -> Tuple[Tuple[str, int], ...]:
+    fields = []
+    for name in node_fields(node_type):
+        if name in LIST_FIELDS:
+            fields.append((name, LIST))
+        elif name in STRING_FIELDS:
+            fields.append((name, STRING))
+        elif name not in SKIPPED_FIELDS:
+            fields.append((name, NODE))
+    return tuple(fields)
+
+
+class NodeArena:
+    """
+    Struct of arrays copy of an AST, for very large programs. Node `i` has
+    the class `node_kinds()[kinds[i]]`, its position in `lines[i]` and
+    `columns[i]`, and its fields are stored from `fields[first[i]]` on, in
+    the order of `node_fields`: the index of a child node, the index of a
+    string in `strings`, or the offset in `lists` of a list length followed
+    by the indices of its nodes. Missing values are -1.
+
+    The nodes are numbered breadth first, the root is node 0 and every node
+    comes before its children.
+    """
+
+    def __init__(self):
+        self.kinds = array("B")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.first = array("I")
+        self.fields = array("i")
+        self.lists = array("i")
+        self.strings: List[str] = []
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @property
+    def nbytes(self):
+        """
+        Size of the buffers, the strings are shared with the source AST.
+        """
+        buffers = (
+            self.kinds,
+            self.lines,
+            self.columns,
+            self.first,
+            self.fields,
+            self.lists,
+        )
+        return sum(buffer.itemsize * len(buffer) for buffer in buffers)
+
+    @classmethod
+    def from_ast(cls, root: Node) -> "NodeArena":
+        arena = cls()
+        kind_of = {kind: index for index, kind in enumerate(node_kinds())}
+        string_of: Dict[str, int] = {}
+        order = [root]
+        index = 0
+        while index < len(order):
+            node = order[index]
+            index += 1
+            arena.kinds.append(kind_of[type(node)])
+            arena.lines.append(node.line)
+            arena.columns.append(node.column)
+            arena.first.append(len(arena.fields))
+            for name, how in arena_fields(type(node)):
+                value = getattr(node, name)
+                if value is None:
+                    arena.fields.append(-1)
+                elif how == NODE:
+                    arena.fields.append(len(order))
+                    order.append(value)
+                elif how == LIST:
+                    arena.fields.append(len(arena.lists))
+                    arena.lists.append(len(value))
+                    for child in value:
+                        arena.lists.append(len(order))
+                        order.append(child)
+                else:
+                    if value not in string_of:
+                        string_of[value] = len(arena.strings)
+                        arena.strings.append(value)
+                    arena.fields.append(string_of[value])
+        return arena
+
+    def kind(self, index: int) -> type:
+        return node_kinds()[self.kinds[index]]
+
+    def children(self, index: int) -> Iterator[int]:
+        """
+        Indices of the child nodes of node `index`, in field order.
+        """
+        position = self.first[index]
+        for offset, (_, how) in enumerate(arena_fields(self.kind(index))):
+            value = self.fields[position + offset]
+            if value == -1 or how == STRING:
+                continue
+            if how == NODE:
+                yield value
+            else:
+                yield from self.lists[value + 1 : value + 1 + self.lists[value]]
+
+    def to_ast(self) -> Optional[Node]:
+        """
+        Rebuild the AST, without the semantic annotations.
+        """
+        kinds = node_kinds()
+        nodes: List[Optional[Node]] = [None] * len(self)
+        # Children are numbered after their parents
+        for index in reversed(range(len(self))):
+            node_type = kinds[self.kinds[index]]
+            node = node_type.__new__(node_type)
+            node.line = self.lines[index]
+            node.column = self.columns[index]
+            node.static_type = None
+            if node_type is ClassDeclarationNode:
+                node._visited = False
+            position = self.first[index]
+            for offset, (name, how) in enumerate(arena_fields(node_type)):
+                value = self.fields[position + offset]
+                if value == -1:
+                    value = None
+                elif how == NODE:
+                    value = nodes[value]
+                elif how == LIST:
+                    items = self.lists[value + 1 : value + 1 + self.lists[value]]
+                    value = [nodes[item] for item in items]
+                else:
+                    value = self.strings[value]
+                setattr(node, name, value)
+            nodes[index] = node
+        return nodes[0] if nodes else None
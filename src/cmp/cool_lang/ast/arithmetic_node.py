@@ -3,5 +3,7 @@ from .expresion_node import ExpressionNode
 
 
 class ArithmeticNode(BinaryNode):
+    __slots__ = ()
+
     def __init__(self, left: ExpressionNode, right: ExpressionNode, line: int, column: int):
         super(ArithmeticNode, self).__init__(left, right, line, column)
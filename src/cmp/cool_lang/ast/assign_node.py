@@ -2,6 +2,8 @@ from .expresion_node import ExpressionNode
 
 
 class AssignNode(ExpressionNode):
+    __slots__ = ("id", "expression")
+
     def __init__(self, idx: str, expression: ExpressionNode, line: int, column: int):
         super(AssignNode, self).__init__(line, column)
         self.id: str = idx
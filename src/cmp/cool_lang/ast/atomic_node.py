@@ -2,6 +2,8 @@ from .expresion_node import ExpressionNode
 
 
 class AtomicNode(ExpressionNode):
+    __slots__ = ("token",)
+
     def __init__(self, token: str, line: int, column: int):
         super(AtomicNode, self).__init__(line, column)
         self.token: str = token
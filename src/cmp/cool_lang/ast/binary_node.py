@@ -2,6 +2,8 @@ from .expresion_node import ExpressionNode
 
 
 class BinaryNode(ExpressionNode):
+    __slots__ = ("left", "right")
+
     def __init__(self, left: ExpressionNode, right: ExpressionNode, line: int, column: int):
         super(BinaryNode, self).__init__(line, column)
         self.left: ExpressionNode = left
@@ -3,6 +3,8 @@ from .expresion_node import ExpressionNode
 
 
 class BlockNode(ExpressionNode):
+    __slots__ = ("expressions",)
+
     def __init__(self, expressions: List[ExpressionNode], line: int, column: int):
         super(BlockNode, self).__init__(line, column)
         self.expressions: List[ExpressionNode] = expressions
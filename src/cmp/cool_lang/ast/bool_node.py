@@ -2,5 +2,7 @@ from .atomic_node import AtomicNode
 
 
 class BoolNode(AtomicNode):
+    __slots__ = ()
+
     def __init__(self, token: str, line: int, column: int):
         super(BoolNode, self).__init__(token, line, column)
@@ -4,6 +4,8 @@ from .expresion_node import ExpressionNode
 
 
 class CaseOfNode(ExpressionNode):
+    __slots__ = ("expression", "cases")
+
     def __init__(self, expression: ExpressionNode, cases: List[CaseNode], line: int, column: int):
         super(CaseOfNode, self).__init__(line, column)
         self.expression: ExpressionNode = expression
@@ -4,7 +4,10 @@ from .feature_declaration_node import FeatureDeclarationNode
 
 
 class ClassDeclarationNode(DeclarationNode):
+    __slots__ = ("parent", "features", "_visited")
+
     def __init__(self, idx: str, features: List[FeatureDeclarationNode], parent: 'ClassDeclarationNode', line: int, column: int):
         super(ClassDeclarationNode, self).__init__(idx, line, column)
         self.parent: 'ClassDeclarationNode' = parent
         self.features: List[FeatureDeclarationNode] = features
+        self._visited: bool = False
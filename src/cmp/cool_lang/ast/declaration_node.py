@@ -2,6 +2,8 @@ from .node import Node
 
 
 class DeclarationNode(Node):
+    __slots__ = ("id",)
+
     def __init__(self, idx: str, line: int, column: int):
         super(DeclarationNode, self).__init__(line, column)
         self.id: str = idx
@@ -3,5 +3,7 @@ from .expresion_node import ExpressionNode
 
 
 class DivNode(ArithmeticNode):
+    __slots__ = ()
+
     def __init__(self, left: ExpressionNode, right: ExpressionNode, line: int, column: int):
         super(DivNode, self).__init__(left, right, line, column)
@@ -1,6 +1,8 @@
 from .node import Node
 
 class ExpressionNode(Node):
+    __slots__ = ()
+
     def __init__(self, line: int, column: int):
         super(ExpressionNode, self).__init__(line, column)
 
@@ -3,6 +3,8 @@ from .expresion_node import ExpressionNode
 
 
 class FeatureDeclarationNode(DeclarationNode):
+    __slots__ = ("type", "expression")
+
     def __init__(self, idx: str, typex: str, expression: ExpressionNode, line: int, column: int):
         super(FeatureDeclarationNode, self).__init__(idx, line, column)
         self.type: str = typex
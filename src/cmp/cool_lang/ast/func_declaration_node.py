@@ -5,6 +5,8 @@ from .param_declaration_node import ParamDeclarationNode
 
 
 class FuncDeclarationNode(FeatureDeclarationNode):
+    __slots__ = ("params",)
+
     def __init__(self, idx: str, params: List[ParamDeclarationNode], typex: str, expression: ExpressionNode, line: int, column: int):
         super(FuncDeclarationNode, self).__init__(idx, typex, expression, line, column)
         self.params: List[ParamDeclarationNode] = params
@@ -3,6 +3,8 @@ from .expresion_node import ExpressionNode
 
 
 class FunctionCallNode(ExpressionNode):
+    __slots__ = ("obj", "id", "args", "type")
+
     def __init__(self, obj: ExpressionNode, idx: str, args: List[ExpressionNode], typex: str, line: int, column: int):
         super(FunctionCallNode, self).__init__(line, column)
         self.obj: ExpressionNode = obj
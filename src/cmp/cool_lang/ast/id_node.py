@@ -2,5 +2,7 @@ from .atomic_node import AtomicNode
 
 
 class IdNode(AtomicNode):
+    __slots__ = ()
+
     def __init__(self, token: str, line: int, column: int):
         super(IdNode, self).__init__(token, line, column)
@@ -2,6 +2,8 @@ from .expresion_node import ExpressionNode
 
 
 class IfThenElseNode(ExpressionNode):
+    __slots__ = ("condition", "if_body", "else_body")
+
     def __init__(self, condition: ExpressionNode, if_body: ExpressionNode, else_body: ExpressionNode, line: int, column: int):
         super(IfThenElseNode, self).__init__(line, column)
         self.condition: ExpressionNode = condition
@@ -4,6 +4,8 @@ from .let_node import LetNode
 
 
 class LetInNode(ExpressionNode):
+    __slots__ = ("let_body", "in_body")
+
     def __init__(self, let_body: List[LetNode], in_body: ExpressionNode, line: int, column: int):
         super(LetInNode, self).__init__(line, column)
         self.let_body: List[LetNode] = let_body
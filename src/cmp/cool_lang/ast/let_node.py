@@ -3,6 +3,8 @@ from .expresion_node import ExpressionNode
 
 
 class LetNode(DeclarationNode):
+    __slots__ = ("type", "expression")
+
     def __init__(
         self,
         idx: str,
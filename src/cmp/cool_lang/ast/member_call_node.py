@@ -3,6 +3,8 @@ from .expresion_node import ExpressionNode
 
 
 class MemberCallNode(ExpressionNode):
+    __slots__ = ("id", "args")
+
     def __init__(self, idx: str, args: List[ExpressionNode], line: int, column: int):
         super(MemberCallNode, self).__init__(line, column)
         self.id: str = idx
@@ -2,6 +2,8 @@ from .expresion_node import ExpressionNode
 
 
 class NewNode(ExpressionNode):
+    __slots__ = ("type",)
+
     def __init__(self, typex: str, line: int, column: int):
         super(NewNode, self).__init__(line, column)
         self.type: str = typex
@@ -1,8 +1,23 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Tuple
 
 
 class Node:
+    __slots__ = ("line", "column", "static_type")
+
     def __init__(self, line: int, column: int):
         self.line: int = line
         self.column: int = column
         self.static_type: Any = None  # type:ignore
+
+
+@lru_cache(maxsize=None)
+def node_fields(node_type: type) -> Tuple[str, ...]:
+    """
+    Names of the fields of a node class, the ones of its base classes first.
+    """
+    return tuple(
+        name
+        for cls in reversed(node_type.__mro__)
+        for name in cls.__dict__.get("__slots__", ())
+    )
@@ -3,5 +3,7 @@ from .unary_node import UnaryNode
 
 
 class NotNode(UnaryNode):
+    __slots__ = ()
+
     def __init__(self, expression: ExpressionNode, line: int = None, column: int = None):
         super(NotNode, self).__init__(expression, line, column)
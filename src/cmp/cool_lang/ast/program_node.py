@@ -4,6 +4,8 @@ from .node import Node
 
 
 class ProgramNode(Node):
+    __slots__ = ("classes",)
+
     def __init__(self, classes: List[ClassDeclarationNode], line: int, column: int):
         super(ProgramNode, self).__init__(line, column)
         self.classes: List[ClassDeclarationNode] = classes
@@ -0,0 +1,215 @@
+"""
+Versioned binary format of a COOL AST, without pickle.
+
+    MAGIC, version, flags
+    strings: count, then the length and the UTF-8 bytes of every string
+    kinds:   count, then the string of every node class name
+    nodes:   count, then every node breadth first
+
+Every number is an unsigned LEB128 varint. A node is its kind, line and
+column, the string of its static type when the AST is typed (flag 1), and
+its fields in the order of `node_fields`: a string (0 for None, else its
+index plus one), a child node (0 for None, 1 when it follows) or a list
+(its length). The children are stored after their parent in the order
+their fields are found, so the nodes are rebuilt in a single loop without
+recursion.
+"""
+from collections import deque
+from typing import Dict, List
+
+from .arena import LIST, NODE, arena_fields, node_kinds
+from .class_declaration_node import ClassDeclarationNode
+from .node import Node
+
+MAGIC = b"COOLAST"
+FORMAT_VERSION = 1
+TYPED = 1
+
+
+def write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def dump_ast(root: Node, typed: bool = False) -> bytes:
+    """
+    Serialize the AST under `root`. With `typed` the names of the static
+    types set by COOL_TYPE_CHECKER are kept too.
+    """
+    strings: Dict[str, int] = {}
+    kinds: Dict[type, int] = {}
+    nodes = bytearray()
+
+    def string(value):
+        # Strings are numbered from 1, 0 stands for None
+        if value is None:
+            return 0
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings) + 1
+        return index
+
+    order = deque([root])
+    count = 0
+    while order:
+        node = order.popleft()
+        count += 1
+        node_type = type(node)
+        kind = kinds.get(node_type)
+        if kind is None:
+            kind = kinds[node_type] = len(kinds)
+            string(node_type.__name__)
+        write_varint(nodes, kind)
+        write_varint(nodes, node.line)
+        write_varint(nodes, node.column)
+        if typed:
+            static_type = node.static_type
+            name = None if static_type is None else static_type.name
+            write_varint(nodes, string(name))
+        for name, how in arena_fields(node_type):
+            value = getattr(node, name)
+            if how == NODE:
+                write_varint(nodes, value is not None)
+                if value is not None:
+                    order.append(value)
+            elif how == LIST:
+                write_varint(nodes, len(value))
+                order.extend(value)
+            else:
+                write_varint(nodes, string(value))
+
+    out = bytearray(MAGIC)
+    out.append(FORMAT_VERSION)
+    out.append(TYPED if typed else 0)
+    write_varint(out, len(strings))
+    for value in strings:
+        encoded = value.encode("utf-8")
+        write_varint(out, len(encoded))
+        out.extend(encoded)
+    write_varint(out, len(kinds))
+    for node_type in kinds:
+        write_varint(out, strings[node_type.__name__] - 1)
+    write_varint(out, count)
+    out.extend(nodes)
+    return bytes(out)
+
+
+def load_ast(data: bytes, context=None) -> Node:
+    """
+    Rebuild an AST serialized by `dump_ast`. The static types of a typed
+    AST are looked up in `context` (an error or void type is created), and
+    left as type names without it.
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a serialized COOL AST.")
+    version, flags = data[len(MAGIC)], data[len(MAGIC) + 1]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported COOL AST format version {version}.")
+    try:
+        return _load(data, len(MAGIC) + 2, bool(flags & TYPED), context)
+    except (IndexError, KeyError, StopIteration, UnicodeDecodeError) as e:
+        raise ValueError("Truncated or corrupted COOL AST.") from e
+
+
+def _load(data: bytes, position: int, typed: bool, context) -> Node:
+    def varint():
+        nonlocal position
+        byte = data[position]
+        position += 1
+        if byte < 0x80:
+            return byte
+        value = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    strings: List = [None]
+    for _ in range(varint()):
+        length = varint()
+        strings.append(data[position : position + length].decode("utf-8"))
+        position += length
+    names = {kind.__name__: kind for kind in node_kinds()}
+    kinds = []
+    for _ in range(varint()):
+        node_type = names[strings[varint() + 1]]
+        kinds.append((node_type, arena_fields(node_type)))
+    count = varint()
+
+    types = [None] * len(strings)
+    if typed:
+        for index in range(1, len(strings)):
+            name = strings[index]
+            types[index] = name if context is None else resolve_type(context, name)
+
+    values = iter(read_varints(data, position))
+    value = values.__next__
+    root = None
+    # Where every pending child goes: its parent node and field, or a list
+    # and its index
+    pending: deque = deque()
+    for _ in range(count):
+        node_type, fields = kinds[value()]
+        node = node_type.__new__(node_type)
+        node.line = value()
+        node.column = value()
+        node.static_type = types[value()] if typed else None
+        if node_type is ClassDeclarationNode:
+            node._visited = False
+        if pending:
+            parent, key = pending.popleft()
+            if isinstance(parent, list):
+                parent[key] = node
+            else:
+                setattr(parent, key, node)
+        else:
+            root = node
+        for name, how in fields:
+            if how == NODE:
+                setattr(node, name, None)
+                if value():
+                    pending.append((node, name))
+            elif how == LIST:
+                items = [None] * value()
+                setattr(node, name, items)
+                pending.extend((items, index) for index in range(len(items)))
+            else:
+                setattr(node, name, strings[value()])
+    if pending or next(values, None) is not None:
+        raise ValueError("Truncated or corrupted COOL AST.")
+    return root
+
+
+def read_varints(data: bytes, position: int) -> List[int]:
+    """
+    Every varint from `position` to the end of `data`.
+    """
+    values = []
+    append = values.append
+    value = shift = 0
+    for byte in data[position:]:
+        if byte < 0x80:
+            append(value | byte << shift)
+            value = shift = 0
+        else:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+    if shift:
+        raise IndexError("varint cut at the end of the data")
+    return values
+
+
+def resolve_type(context, name):
+    from ..semantics.semantic_utils import ErrorType, VoidType
+
+    if name == "<error>":
+        return ErrorType()
+    if name == "<void>":
+        return VoidType()
+    return context.types.get(name)
@@ -2,6 +2,8 @@ from .expresion_node import ExpressionNode
 
 
 class WhileLoopNode(ExpressionNode):
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: ExpressionNode, body: ExpressionNode, line: int, column: int):
         super(WhileLoopNode, self).__init__(line, column)
         self.condition: ExpressionNode = condition
@@ -12,9 +12,14 @@ class LocalizedError(Error):
         Error.__init__(self, error_name, description)
         self.row = row
         self.column = column
+        # Source file of the error, only set in programs made of many files
+        self.file = None
 
     def __str__(self):
-        return f'({self.row}, {self.column}) - {self.error_name}: {self.description}'
+        location = f'({self.row}, {self.column})'
+        if self.file is not None:
+            location = f'{self.file}:{location}'
+        return f'{location} - {self.error_name}: {self.description}'
 
 
 class LexicographicError(LocalizedError):
@@ -1,2 +1,3 @@
 from .cllexer import COOL_LEXER
 from .cllexer import tokens as COOL_TOKENS
+from .fastlexer import COOL_FAST_LEXER
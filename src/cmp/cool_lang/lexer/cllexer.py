@@ -1,6 +1,13 @@
+import hashlib
+import importlib
+import os
+import sys
+
 import ply.lex as lex
 from ..errors import LexicographicError
-from ..utils import find_column
+from ..utils import LineIndex
+
+LEXTAB = 'cmp.cool_lang.lexer.lextab'
 
 
 keywords = [
@@ -121,7 +128,7 @@ class COOL_LEXER(object):
         t.lexer.lineno += len(t.value)
 
     def t_error(self, t):
-        self.errors.append(LexicographicError(t.lineno, find_column(self.code, t.lexpos), f'Invalid character "{t.value[0]}".'))
+        self.errors.append(LexicographicError(t.lineno, self.line_index.column(t.lexpos), f'Invalid character "{t.value[0]}".'))
 
     # Lexer simple comment state methods
 
@@ -138,6 +145,11 @@ class COOL_LEXER(object):
         t.lexer.begin('INITIAL')
         return t
 
+    def t_simpleComment_text(self, t):
+        r'[^\n]+'
+        # Whole runs of the comment are consumed at once, the value of the
+        # comment is sliced from the source when it ends
+
     def t_simpleComment_eof(self, t):
         t.value = t.lexer.lexdata[t.lexer.simpleComment_first: t.lexer.lexpos - 1]
         t.type = 'COMMENT'
@@ -172,11 +184,15 @@ class COOL_LEXER(object):
         r'\n+'
         t.lexer.lineno += len(t.value)
 
+    def t_multiComment_text(self, t):
+        r'(?:[^(*\n]|\((?!\*)|\*(?!\)))+'
+        # Everything but newlines and the "(*" and "*)" delimiters
+
     def t_multiComment_error(self, t):
         t.lexer.skip(1)
 
     def t_multiComment_eof(self, t):
-        self.errors.append(LexicographicError(t.lexer.lineno, find_column(self.code, t.lexpos), f'EOF in comment.'))
+        self.errors.append(LexicographicError(t.lexer.lineno, self.line_index.column(t.lexpos), f'EOF in comment.'))
 
     # Lexer string state methods
 
@@ -193,45 +209,131 @@ class COOL_LEXER(object):
             t.lexer.begin('INITIAL')
             return t
 
+    def t_string_text(self, t):
+        r'[^"\n\0\b\t\f]+'
+        # Ordinary characters, escape sequences are looked up by position so
+        # backslashes can be part of the run
+
     def t_string_eof(self, t):
-        self.errors.append(LexicographicError(t.lineno, find_column(self.code, t.lexpos), f'Unexpected EOF.'))
+        self.errors.append(LexicographicError(t.lineno, self.line_index.column(t.lexpos), f'Unexpected EOF.'))
 
     def t_string_error(self, t):
         val = t.value[0]
         if val in '\b\t\0\f':
             char = '\\f' if val == '\f' else '\\b' if val == '\b' else '\\t' if val == '\t' else 'null'
-            self.errors.append(LexicographicError(t.lineno, find_column(self.code, t.lexpos), f'Invalid character "{char}" in a string.'))
+            self.errors.append(LexicographicError(t.lineno, self.line_index.column(t.lexpos), f'Invalid character "{char}" in a string.'))
         elif val == '\n':
             if t.lexer.lexdata[t.lexer.lexpos - 1] != '\\':
-                self.errors.append(LexicographicError(t.lineno, find_column(self.code, t.lexpos), f'Invalid character "\\n" in a string.'))
+                self.errors.append(LexicographicError(t.lineno, self.line_index.column(t.lexpos), f'Invalid character "\\n" in a string.'))
             else:
                 t.lexer.lineno += 1
         t.lexer.skip(1)
 
     # Non lexer methods
+    def signature(self):
+        rules = []
+        for name in dir(self):
+            if name.startswith('t_'):
+                rule = getattr(self, name)
+                if callable(rule):
+                    rules.append((rule.__code__.co_firstlineno, name, rule.__doc__))
+                else:
+                    rules.append((0, name, rule))
+        spec = repr((lex.__version__, self.tokens, self.states, [rule[1:] for rule in sorted(rules)]))
+        return hashlib.sha256(spec.encode()).hexdigest()
+
     def build(self, **kwargs):
+        signature = self.signature()
+        try:
+            lextab = importlib.import_module(LEXTAB)
+        except ImportError:
+            lextab = None
+        if getattr(lextab, '_lexsignature', None) == signature:
+            self.lexer = lex.lex(module=self, optimize=True, lextab=LEXTAB, **kwargs)
+            return
         self.lexer = lex.lex(module=self, **kwargs)
-
-    def tokenize(self, data):
+        self.write_table(signature)
+
+    def write_table(self, signature):
+        # Tables are written under a temporary name and renamed into place so
+        # that concurrent compilers never import a half written lextab module
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+        basename = LEXTAB.split('.')[-1]
+        tmpname = f'{basename}_{os.getpid()}'
+        tmpfile = os.path.join(outputdir, tmpname + '.py')
+        try:
+            self.lexer.writetab(tmpname, outputdir)
+            with open(tmpfile, 'r') as fd:
+                table = fd.read()
+            # PLY names the module it writes in the header of the table
+            table = table.replace(f'# {tmpname}.py', f'# {basename}.py', 1)
+            with open(tmpfile, 'w') as fd:
+                fd.write(table)
+                fd.write(f'_lexsignature = {signature!r}\n')
+            os.replace(tmpfile, os.path.join(outputdir, basename + '.py'))
+        except OSError:
+            if os.path.exists(tmpfile):
+                os.remove(tmpfile)
+            return
+        sys.modules.pop(LEXTAB, None)
+
+    def reset(self):
+        self.errors = []
+        self.result = []
+        self.stream = None
+        self.code = None
+        self.line_index = None
+        self.index = 0
+        if self.lexer is not None:
+            self.lexer.lineno = 1
+            self.lexer.begin('INITIAL')
+
+    def tokens_of(self, data, comments=False):
+        """
+        Generator of the tokens of `data`, comments are dropped unless asked
+        for. It stops at the first lexical error, which is left in `errors`.
+        """
+        self.reset()
         self.code = data
+        self.line_index = LineIndex(data)
         if self.lexer is None:
             self.build()
         self.lexer.input(data)
+        return self._tokens(comments)
+
+    def _tokens(self, comments):
         while True:
             try:
                 token = self.lexer.token()
-                if self.errors:
-                    return False
-                if not token:
-                    break
             except lex.LexError:
-                return False
-            self.result.append(token)
-        return True
+                return
+            if self.errors or not token:
+                return
+            if comments or token.type != 'COMMENT':
+                yield token
+
+    def input(self, data):
+        # Tokens are produced as the parser pulls them through `token`
+        self.stream = self.tokens_of(data)
+
+    def drain(self):
+        """
+        Run the lexer over the rest of the input, without keeping the tokens,
+        to find out whether there is a lexical error further on.
+        """
+        if self.stream is not None:
+            for _ in self.stream:
+                pass
+        return not self.errors
+
+    def tokenize(self, data):
+        result = list(self.tokens_of(data, comments=True))
+        self.result = result
+        return not self.errors
 
     def token(self):
-        if self.index >= len(self.result):
-            return None
+        if self.stream is not None:
+            return next(self.stream, None)
         result = None
         while True:
             if self.index >= len(self.result):
@@ -0,0 +1,179 @@
+import re
+
+from ply.lex import LexToken
+
+from ..errors import LexicographicError
+from ..utils import LineIndex
+from .cllexer import COOL_LEXER, keywords
+
+KEYWORDS = {keyword.lower(): keyword for keyword in keywords}
+BOOLS = {'true', 'false'}
+
+OPERATORS = {
+    '+': 'PLUS',
+    '-': 'MINUS',
+    '*': 'STAR',
+    '/': 'DIV',
+    ':': 'COLON',
+    ';': 'SEMICOLON',
+    '(': 'OPAR',
+    ')': 'CPAR',
+    '{': 'OBRA',
+    '}': 'CBRA',
+    '@': 'ARROB',
+    '.': 'DOT',
+    ',': 'COMMA',
+    '=>': 'ACTION',
+    '<-': 'ASSIGN',
+    '<=': 'LESSEQUAL',
+    '<': 'LESS',
+    '=': 'EQUAL',
+    '~': 'INT_COMPLEMENT',
+}
+
+# The alternatives keep the priorities of the PLY master regex of
+# COOL_LEXER: function rules first and then string rules, longest first
+MASTER = re.compile(r'''
+    [ \t]*
+    (?:
+    (?P<TYPE>[A-Z][A-Za-z0-9_]*)
+  | (?P<ID>[a-z][A-Za-z0-9_]*)
+  | (?P<newline>\n+)
+  | (?P<simpleComment>--)
+  | (?P<multiComment>\(\*)
+  | (?P<string>")
+  | (?P<NUMBER>[0-9]+)
+  | (?P<operator>=>|<-|<=|[-+*/:;(){}@.,<=~])
+    )?
+''', re.VERBOSE)
+
+MULTI_COMMENT = re.compile(r'\(\*|\*\)|\n')
+STRING = re.compile(r'["\n\0\b\t\f]')
+STRING_CHARS = {'\b': '\\b', '\t': '\\t', '\0': 'null', '\f': '\\f'}
+
+
+class Token(LexToken):
+    __slots__ = ('type', 'value', 'lineno', 'lexpos')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+
+class COOL_FAST_LEXER(COOL_LEXER):
+    """
+    Scanner producing the same tokens and errors as COOL_LEXER from a single
+    master regex. Keywords are found with a dict lookup and strings and
+    comments are scanned by searching for their delimiters.
+    """
+
+    def build(self, **kwargs):
+        pass
+
+    def tokens_of(self, data, comments=False):
+        self.reset()
+        self.code = data
+        self.line_index = LineIndex(data)
+        return self._tokens(comments)
+
+    def _tokens(self, comments):
+        # Like COOL_LEXER, a token found after a lexical error is dropped and
+        # the stream ends
+        data = self.code
+        errors = self.errors
+        column = self.line_index.column
+        length = len(data)
+        lineno = 1
+        pos = 0
+        while True:
+            # Comments and strings are scanned apart, the matching restarts
+            # right after them
+            for m in MASTER.finditer(data, pos):
+                kind = m.lastgroup
+                if kind == 'ID':
+                    value = m.group(kind)
+                    lower = value.lower()
+                    if lower in KEYWORDS:
+                        yield Token(KEYWORDS[lower], value, lineno, m.start(kind))
+                    elif lower in BOOLS:
+                        yield Token('BOOL', value, lineno, m.start(kind))
+                    else:
+                        yield Token('ID', value, lineno, m.start(kind))
+                elif kind == 'operator':
+                    value = m.group(kind)
+                    yield Token(OPERATORS[value], value, lineno, m.start(kind))
+                elif kind == 'newline':
+                    lineno += m.end() - m.start(kind)
+                elif kind == 'TYPE':
+                    value = m.group(kind)
+                    yield Token(KEYWORDS.get(value.lower(), 'TYPE'), value, lineno, m.start(kind))
+                elif kind == 'NUMBER':
+                    yield Token('NUMBER', m.group(kind), lineno, m.start(kind))
+                elif kind is None:
+                    # Only the leading blanks matched
+                    pos = m.end()
+                    if pos < length:
+                        errors.append(LexicographicError(lineno, column(pos), f'Invalid character "{data[pos]}".'))
+                    return
+                else:
+                    pos = m.end()
+                    break
+            else:
+                return
+
+            if kind == 'simpleComment':
+                end = data.find('\n', pos)
+                if end == -1:
+                    token = Token('COMMENT', data[pos: length - 1], lineno, length)
+                    pos = length
+                else:
+                    token = Token('COMMENT', data[pos: end], lineno, end)
+                    lineno += 1
+                    pos = end + 1
+                if comments:
+                    yield token
+            elif kind == 'multiComment':
+                level = 1
+                for delimiter in MULTI_COMMENT.finditer(data, pos):
+                    value = delimiter.group()
+                    if value == '\n':
+                        lineno += 1
+                    elif value == '(*':
+                        level += 1
+                    else:
+                        level -= 1
+                        if level == 0:
+                            token = Token('COMMENT', data[pos: delimiter.start()], lineno, delimiter.start())
+                            pos = delimiter.end()
+                            break
+                else:
+                    errors.append(LexicographicError(lineno, column(length), 'EOF in comment.'))
+                    return
+                if comments:
+                    yield token
+            else:
+                start = pos - 1
+                token = None
+                while token is None:
+                    special = STRING.search(data, pos)
+                    if special is None:
+                        errors.append(LexicographicError(lineno, column(length), 'Unexpected EOF.'))
+                        return
+                    char = special.group()
+                    index = special.start()
+                    pos = index + 1
+                    if char == '"':
+                        if data[index - 1] != '\\':
+                            token = Token('STRING', data[start: pos], lineno, index)
+                    elif char == '\n':
+                        if data[index - 1] != '\\':
+                            errors.append(LexicographicError(lineno, column(index), 'Invalid character "\\n" in a string.'))
+                        else:
+                            lineno += 1
+                    else:
+                        errors.append(LexicographicError(lineno, column(index), f'Invalid character "{STRING_CHARS[char]}" in a string.'))
+                if errors:
+                    return
+                yield token
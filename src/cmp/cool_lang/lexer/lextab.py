@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ACTION', 'ARROB', 'ASSIGN', 'BOOL', 'CASE', 'CBRA', 'CLASS', 'COLON', 'COMMA', 'COMMENT', 'CPAR', 'DIV', 'DOT', 'ELSE', 'EQUAL', 'ESAC', 'FI', 'ID', 'IF', 'IN', 'INHERITS', 'INT_COMPLEMENT', 'ISVOID', 'LESS', 'LESSEQUAL', 'LET', 'LOOP', 'MINUS', 'NEW', 'NOT', 'NUMBER', 'OBRA', 'OF', 'OPAR', 'PLUS', 'POOL', 'SEMICOLON', 'STAR', 'STRING', 'THEN', 'TYPE', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'string': 'exclusive', 'simpleComment': 'exclusive', 'multiComment': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_TYPE>[A-Z][A-Za-z0-9_]*)|(?P<t_ID>[a-z][A-Za-z0-9_]*)|(?P<t_newline>\\n+)|(?P<t_simpleComment>--)|(?P<t_multiComment>\\(\\*)|(?P<t_string>")|(?P<t_NUMBER>[0-9]+)|(?P<t_ACTION>=>)|(?P<t_ARROB>\\@)|(?P<t_ASSIGN><-)|(?P<t_CBRA>\\})|(?P<t_COLON>\\:)|(?P<t_COMMA>\\,)|(?P<t_CPAR>\\))|(?P<t_DIV>\\/)|(?P<t_DOT>\\.)|(?P<t_LESSEQUAL><=)|(?P<t_MINUS>\\-)|(?P<t_OBRA>\\{)|(?P<t_OPAR>\\()|(?P<t_PLUS>\\+)|(?P<t_SEMICOLON>\\;)|(?P<t_STAR>\\*)|(?P<t_EQUAL>=)|(?P<t_INT_COMPLEMENT>~)|(?P<t_LESS><)', [None, ('t_TYPE', 'TYPE'), ('t_ID', 'ID'), ('t_newline', 'newline'), ('t_simpleComment', 'simpleComment'), ('t_multiComment', 'multiComment'), ('t_string', 'string'), (None, 'NUMBER'), (None, 'ACTION'), (None, 'ARROB'), (None, 'ASSIGN'), (None, 'CBRA'), (None, 'COLON'), (None, 'COMMA'), (None, 'CPAR'), (None, 'DIV'), (None, 'DOT'), (None, 'LESSEQUAL'), (None, 'MINUS'), (None, 'OBRA'), (None, 'OPAR'), (None, 'PLUS'), (None, 'SEMICOLON'), (None, 'STAR'), (None, 'EQUAL'), (None, 'INT_COMPLEMENT'), (None, 'LESS')])], 'string': [('(?P<t_string_end>")|(?P<t_string_text>[^"\\n\\0\\b\\t\\f]+)', [None, ('t_string_end', 'end'), ('t_string_text', 'text')])], 'simpleComment': [('(?P<t_simpleComment_end>\\n)|(?P<t_simpleComment_text>[^\\n]+)', [None, ('t_simpleComment_end', 'end'), ('t_simpleComment_text', 'text')])], 'multiComment': [('(?P<t_multiComment_lbrace>\\(\\*)|(?P<t_multiComment_rbrace>\\*\\))|(?P<t_multiComment_newline>\\n+)|(?P<t_multiComment_text>(?:[^(*\\n]|\\((?!\\*)|\\*(?!\\)))+)', [None, ('t_multiComment_lbrace', 'lbrace'), ('t_multiComment_rbrace', 'rbrace'), ('t_multiComment_newline', 'newline'), ('t_multiComment_text', 'text')])]}
+_lexstateignore = {'INITIAL': ' \t', 'multiComment': '', 'simpleComment': '', 'string': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'multiComment': 't_multiComment_error', 'simpleComment': 't_simpleComment_error', 'string': 't_string_error'}
+_lexstateeoff = {'multiComment': 't_multiComment_eof', 'simpleComment': 't_simpleComment_eof', 'string': 't_string_eof'}
+_lexsignature = '9def6eda29a805ec5e406d4d67e51fe9159b3cdbe9260636b1a03e214adc7146'
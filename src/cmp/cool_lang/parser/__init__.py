@@ -1 +1,2 @@
 from .clparser import COOL_PARSER
+from .descentparser import COOL_DESCENT_PARSER
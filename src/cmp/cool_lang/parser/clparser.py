@@ -1,3 +1,7 @@
+import importlib
+import os
+import sys
+
 import ply.yacc as yacc
 
 from ..ast import (
@@ -34,7 +38,8 @@ from ..ast import (
 )
 from ..errors import SyntacticError
 from ..lexer import COOL_TOKENS
-from ..utils import find_column
+
+PARSETAB = "cmp.cool_lang.parser.parsetab"
 
 
 class COOL_PARSER:
@@ -43,6 +48,7 @@ class COOL_PARSER:
         self.tokens = COOL_TOKENS
         self.parser = None
         self.code = None
+        self.line_index = None
         self.result = None
         self.errors = []
 
@@ -79,13 +85,13 @@ class COOL_PARSER:
     def p_def_class(self, p):
         "def_class : CLASS TYPE OBRA feature_list CBRA SEMICOLON"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = ClassDeclarationNode(p[2], p[4], None, line, column)  # type:ignore
 
     def p_def_class_heritance(self, p):
         "def_class : CLASS TYPE INHERITS TYPE OBRA feature_list CBRA SEMICOLON"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = ClassDeclarationNode(p[2], p[6], p[4], line, column)
 
     def p_feature_list(self, p):
@@ -99,25 +105,25 @@ class COOL_PARSER:
     def p_feature_declaration(self, p):
         "feature : ID COLON TYPE SEMICOLON"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = AttrDeclarationNode(p[1], p[3], None, line, column)  # type:ignore
 
     def p_feature_assign(self, p):
         "feature : ID COLON TYPE ASSIGN expr SEMICOLON"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = AttrDeclarationNode(p[1], p[3], p[5], line, column)
 
     def p_feature_function(self, p):
         "feature : ID OPAR CPAR COLON TYPE OBRA expr CBRA SEMICOLON"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = FuncDeclarationNode(p[1], [], p[5], p[7], line, column)
 
     def p_feature_function_params(self, p):
         "feature : ID OPAR params_list CPAR COLON TYPE OBRA expr CBRA SEMICOLON"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = FuncDeclarationNode(p[1], p[3], p[6], p[8], line, column)
 
     def p_params_list_simple(self, p):
@@ -131,7 +137,7 @@ class COOL_PARSER:
     def p_param(self, p):
         "param : ID COLON TYPE"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = ParamDeclarationNode(p[1], p[3], line=line, column=column)
 
     def p_expr_list_simple(self, p):
@@ -145,37 +151,37 @@ class COOL_PARSER:
     def p_let_list_declaration_simple(self, p):
         "let_list : ID COLON TYPE"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = [LetNode(p[1], p[3], None, line=line, column=column)]  # type:ignore
 
     def p_let_list_declaration_multi(self, p):
         "let_list : ID COLON TYPE COMMA let_list"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = [LetNode(p[1], p[3], None, line, column)] + p[5]  # type:ignore
 
     def p_let_list_assign_simple(self, p):
         "let_list : ID COLON TYPE ASSIGN expr"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = [LetNode(p[1], p[3], p[5], line=line, column=column)]
 
     def p_let_list_assign_multi(self, p):
         "let_list : ID COLON TYPE ASSIGN expr COMMA let_list"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = [LetNode(p[1], p[3], p[5], line=line, column=column)] + p[7]
 
     def p_case_list_simple(self, p):
         "case_list : ID COLON TYPE ACTION expr SEMICOLON"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = [CaseNode(p[1], p[3], p[5], line, column)]
 
     def p_case_list_multi(self, p):
         "case_list : ID COLON TYPE ACTION expr SEMICOLON case_list"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = [CaseNode(p[1], p[3], p[5], line, column)] + p[7]
 
     def p_expr(self, p):
@@ -185,19 +191,19 @@ class COOL_PARSER:
     def p_comp_expr_le(self, p):
         "comp_expr : comp_expr LESSEQUAL not_arith"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = LessEqualNode(p[1], p[3], line, column)
 
     def p_comp_expr_e(self, p):
         "comp_expr : comp_expr EQUAL not_arith"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = EqualNode(p[1], p[3], line, column)
 
     def p_comp_expr_l(self, p):
         "comp_expr : comp_expr LESS not_arith"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = LessNode(p[1], p[3], line, column)
 
     def p_comp_expr_s(self, p):
@@ -215,13 +221,13 @@ class COOL_PARSER:
     def p_arith_plus(self, p):
         "arith : arith PLUS term"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = PlusNode(p[1], p[3], line, column)
 
     def p_arith_minus(self, p):
         "arith : arith MINUS term"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = MinusNode(p[1], p[3], line, column)
 
     def p_arith_simple(self, p):
@@ -231,13 +237,13 @@ class COOL_PARSER:
     def p_term_star(self, p):
         "term : term STAR vfactor"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = StarNode(p[1], p[3], line, column)
 
     def p_term_div(self, p):
         "term : term DIV vfactor"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = DivNode(p[1], p[3], line, column)
 
     def p_term_simple(self, p):
@@ -263,37 +269,37 @@ class COOL_PARSER:
     def p_atom_if_else(self, p):
         "atom : IF expr THEN expr ELSE expr FI"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = IfThenElseNode(p[2], p[4], p[6], line, column)
 
     def p_atom_while(self, p):
         "atom : WHILE expr LOOP expr POOL"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = WhileLoopNode(p[2], p[4], line, column)
 
     def p_atom_multi(self, p):
         "atom : OBRA expr_list CBRA"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = BlockNode(p[2], line, column)
 
     def p_atom_let_in(self, p):
         "atom : LET let_list IN expr"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = LetInNode(p[2], p[4], line, column)
 
     def p_atom_case(self, p):
         "atom : CASE expr OF case_list ESAC"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = CaseOfNode(p[2], p[4], line, column)
 
     def p_atom_assign(self, p):
         "atom : ID ASSIGN expr"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = AssignNode(p[1], p[3], line, column)
 
     def p_atom_func_call(self, p):
@@ -309,7 +315,7 @@ class COOL_PARSER:
     def p_atom_new(self, p):
         "atom : NEW TYPE"
         line = p.lineno(2)
-        column = find_column(self.code, p.lexpos(2))
+        column = self.line_index.column(p.lexpos(2))
         p[0] = NewNode(p[2], line, column)
 
     def p_atom_par(self, p):
@@ -319,25 +325,25 @@ class COOL_PARSER:
     def p_atom_var(self, p):
         "atom : ID"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = IdNode(p[1], line, column)
 
     def p_atom_int(self, p):
         "atom : NUMBER"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = IntegerNode(p[1], line, column)
 
     def p_atom_bool(self, p):
         "atom : BOOL"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = BoolNode(p[1], line, column)
 
     def p_atom_str(self, p):
         "atom : STRING"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = StringNode(p[1], line, column)
 
     def p_func_call_simple(self, p):
@@ -367,18 +373,21 @@ class COOL_PARSER:
     def p_member_call_simple(self, p):
         "member_call : ID OPAR CPAR"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = MemberCallNode(p[1], [], line, column)
 
     def p_member_call_multi(self, p):
         "member_call : ID OPAR arg_list CPAR"
         line = p.lineno(1)
-        column = find_column(self.code, p.lexpos(1))
+        column = self.line_index.column(p.lexpos(1))
         p[0] = MemberCallNode(p[1], p[3], line, column)
 
     def p_error(self, p):
+        if p is None:
+            self.errors.append(SyntacticError(0, 0, "ERROR at or near EOF"))
+            raise SyntaxError(self.errors[-1])
         line = p.lineno
-        column = find_column(self.code, p.lexpos)
+        column = self.line_index.column(p.lexpos)
         self.errors.append(
             SyntacticError(line, column, f"Syntactic error!!! in token: {p}")
         )
@@ -388,11 +397,65 @@ class COOL_PARSER:
 
     # Non parser related methods
 
+    def signature(self):
+        """
+        Signature of the grammar, as stored by PLY in the parsetab module.
+        """
+        pinfo = yacc.ParserReflect({name: getattr(self, name) for name in dir(self)})
+        pinfo.get_all()
+        return pinfo.signature()
+
     def build(self, **kwargs):
-        self.parser = yacc.yacc(module=self, write_tables=False)
+        signature = self.signature()
+        try:
+            parsetab = importlib.import_module(PARSETAB)
+        except ImportError:
+            parsetab = None
+        if getattr(parsetab, "_lr_signature", None) == signature:
+            self.parser = yacc.yacc(
+                module=self,
+                tabmodule=PARSETAB,
+                write_tables=False,
+                debug=False,
+                **kwargs,
+            )
+            return
+        self.write_table(**kwargs)
+
+    def write_table(self, **kwargs):
+        # PLY writes the LALR tables in place, they are generated under a
+        # temporary module name and renamed into place so that concurrent
+        # compilers never import a half written parsetab module
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+        basename = PARSETAB.split(".")[-1]
+        tmpname = f"{basename}_{os.getpid()}"
+        tmpfile = os.path.join(outputdir, tmpname + ".py")
+        self.parser = yacc.yacc(
+            module=self,
+            tabmodule=PARSETAB[: -len(basename)] + tmpname,
+            outputdir=outputdir,
+            debug=False,
+            **kwargs,
+        )
+        try:
+            with open(tmpfile, "r") as fd:
+                table = fd.read()
+            # PLY names the module it writes in the header of the table
+            table = table.replace(f"# {tmpname}.py", f"# {basename}.py", 1)
+            with open(tmpfile, "w") as fd:
+                fd.write(table)
+            os.replace(tmpfile, os.path.join(outputdir, basename + ".py"))
+        except OSError:
+            if os.path.exists(tmpfile):
+                os.remove(tmpfile)
+            return
+        sys.modules.pop(PARSETAB, None)
 
     def parse(self, lexer):
+        self.errors = []
+        self.result = None
         self.code = lexer.code
+        self.line_index = lexer.line_index
         if self.parser is None:
             self.build()
         try:
@@ -0,0 +1,334 @@
+from ..ast import (
+    AssignNode,
+    AttrDeclarationNode,
+    BlockNode,
+    BoolNode,
+    CaseNode,
+    CaseOfNode,
+    ClassDeclarationNode,
+    ComplementNode,
+    DivNode,
+    EqualNode,
+    FuncDeclarationNode,
+    FunctionCallNode,
+    IdNode,
+    IfThenElseNode,
+    IntegerNode,
+    IsVoidNode,
+    LessEqualNode,
+    LessNode,
+    LetInNode,
+    LetNode,
+    MemberCallNode,
+    MinusNode,
+    NewNode,
+    NotNode,
+    ParamDeclarationNode,
+    PlusNode,
+    ProgramNode,
+    StarNode,
+    StringNode,
+    WhileLoopNode,
+)
+from ..errors import SyntacticError
+from .clparser import COOL_PARSER
+
+# Binding power of the operators, from the precedence table of COOL_PARSER
+PRECEDENCE = {
+    token: level
+    for level, (_, *names) in enumerate(COOL_PARSER().precedence, 1)
+    for token in names
+}
+COMPARISON = PRECEDENCE["LESS"]
+
+BINARY = {
+    "LESSEQUAL": LessEqualNode,
+    "EQUAL": EqualNode,
+    "LESS": LessNode,
+    "PLUS": PlusNode,
+    "MINUS": MinusNode,
+    "STAR": StarNode,
+    "DIV": DivNode,
+}
+LITERALS = {"NUMBER": IntegerNode, "BOOL": BoolNode, "STRING": StringNode}
+
+
+class COOL_DESCENT_PARSER:
+    """
+    Recursive descent parser producing the same AST as COOL_PARSER. The
+    binary operators are parsed by precedence climbing over the levels of
+    its precedence table, and the prefix constructs ending in an expression
+    (assignments, let, not) extend as far to the right as in the LALR
+    parser, so the first syntactic error is found on the same token.
+    """
+
+    def __init__(self):
+        self.lexer = None
+        self.code = None
+        self.line_index = None
+        self.token = None
+        self.kind = None
+        self.result = None
+        self.errors = []
+
+    def build(self, **kwargs):
+        pass
+
+    def parse(self, lexer):
+        self.errors = []
+        self.result = None
+        self.lexer = lexer
+        self.code = lexer.code
+        self.line_index = lexer.line_index
+        try:
+            self.advance()
+            self.result = self.program()
+        except SyntaxError:
+            return False
+        finally:
+            self.lexer = self.token = None
+        return True
+
+    # Token handling
+
+    def advance(self):
+        token = self.token
+        self.token = self.lexer.token()
+        self.kind = None if self.token is None else self.token.type
+        return token
+
+    def expect(self, kind):
+        if self.kind != kind:
+            self.error()
+        return self.advance()
+
+    def error(self):
+        token = self.token
+        if token is None:
+            self.errors.append(SyntacticError(0, 0, "ERROR at or near EOF"))
+        else:
+            line = token.lineno
+            column = self.line_index.column(token.lexpos)
+            self.errors.append(
+                SyntacticError(line, column, f"Syntactic error!!! in token: {token}")
+            )
+        raise SyntaxError(self.errors[-1])
+
+    def position(self, token):
+        return token.lineno, self.line_index.column(token.lexpos)
+
+    # Declarations
+
+    def program(self):
+        classes = [self.def_class()]
+        while self.kind is not None:
+            classes.append(self.def_class())
+        return ProgramNode(classes, classes[0].line, classes[0].column)
+
+    def def_class(self):
+        self.expect("CLASS")
+        name = self.expect("TYPE")
+        parent = None
+        if self.kind == "INHERITS":
+            self.advance()
+            parent = self.expect("TYPE").value
+        self.expect("OBRA")
+        features = []
+        while self.kind != "CBRA":
+            features.append(self.feature())
+        self.advance()
+        self.expect("SEMICOLON")
+        return ClassDeclarationNode(name.value, features, parent, *self.position(name))
+
+    def feature(self):
+        name = self.expect("ID")
+        line, column = self.position(name)
+        if self.kind != "OPAR":
+            self.expect("COLON")
+            typex = self.expect("TYPE").value
+            expression = None
+            if self.kind == "ASSIGN":
+                self.advance()
+                expression = self.expression()
+            self.expect("SEMICOLON")
+            return AttrDeclarationNode(name.value, typex, expression, line, column)
+
+        self.advance()
+        params = []
+        if self.kind != "CPAR":
+            while True:
+                param = self.expect("ID")
+                self.expect("COLON")
+                typex = self.expect("TYPE").value
+                params.append(
+                    ParamDeclarationNode(param.value, typex, *self.position(param))
+                )
+                if self.kind != "COMMA":
+                    break
+                self.advance()
+        self.expect("CPAR")
+        self.expect("COLON")
+        typex = self.expect("TYPE").value
+        self.expect("OBRA")
+        body = self.expression()
+        self.expect("CBRA")
+        self.expect("SEMICOLON")
+        return FuncDeclarationNode(name.value, params, typex, body, line, column)
+
+    # Expressions
+
+    def expression(self, level=COMPARISON):
+        """
+        Expression made of the operators binding at least as tight as
+        `level`.
+        """
+        if self.kind == "NOT" and level <= COMPARISON + 1:
+            # A not takes a whole comparison, it is only found where an
+            # expression or an operand of a comparison is expected
+            self.advance()
+            return NotNode(self.expression(COMPARISON))
+
+        if self.kind == "ISVOID":
+            self.advance()
+            if self.kind == "INT_COMPLEMENT":
+                self.advance()
+                left = IsVoidNode(ComplementNode(self.atom()))
+            else:
+                left = IsVoidNode(self.atom())
+        elif self.kind == "INT_COMPLEMENT":
+            self.advance()
+            left = ComplementNode(self.atom())
+        else:
+            left = self.atom()
+
+        while self.kind in BINARY:
+            operator = PRECEDENCE[self.kind]
+            if operator < level:
+                break
+            token = self.advance()
+            # Every binary operator is left associative
+            right = self.expression(operator + 1)
+            left = BINARY[token.type](left, right, *self.position(token))
+        return left
+
+    def atom(self):
+        token = self.token
+        kind = self.kind
+        if kind == "ID":
+            self.advance()
+            if self.kind == "ASSIGN":
+                self.advance()
+                node = AssignNode(
+                    token.value, self.expression(), *self.position(token)
+                )
+            elif self.kind == "OPAR":
+                self.advance()
+                node = MemberCallNode(
+                    token.value, self.arguments(), *self.position(token)
+                )
+            else:
+                node = IdNode(token.value, *self.position(token))
+        elif kind in LITERALS:
+            self.advance()
+            node = LITERALS[kind](token.value, *self.position(token))
+        elif kind == "OPAR":
+            self.advance()
+            node = self.expression()
+            self.expect("CPAR")
+        elif kind == "IF":
+            self.advance()
+            condition = self.expression()
+            self.expect("THEN")
+            if_body = self.expression()
+            self.expect("ELSE")
+            else_body = self.expression()
+            self.expect("FI")
+            node = IfThenElseNode(
+                condition, if_body, else_body, *self.position(token)
+            )
+        elif kind == "WHILE":
+            self.advance()
+            condition = self.expression()
+            self.expect("LOOP")
+            body = self.expression()
+            self.expect("POOL")
+            node = WhileLoopNode(condition, body, *self.position(token))
+        elif kind == "OBRA":
+            self.advance()
+            expressions = []
+            while True:
+                expressions.append(self.expression())
+                self.expect("SEMICOLON")
+                if self.kind == "CBRA":
+                    break
+            self.advance()
+            node = BlockNode(expressions, *self.position(token))
+        elif kind == "LET":
+            self.advance()
+            let_body = []
+            while True:
+                name = self.expect("ID")
+                self.expect("COLON")
+                typex = self.expect("TYPE").value
+                expression = None
+                if self.kind == "ASSIGN":
+                    self.advance()
+                    expression = self.expression()
+                let_body.append(
+                    LetNode(name.value, typex, expression, *self.position(name))
+                )
+                if self.kind != "COMMA":
+                    break
+                self.advance()
+            self.expect("IN")
+            node = LetInNode(let_body, self.expression(), *self.position(token))
+        elif kind == "CASE":
+            self.advance()
+            expression = self.expression()
+            self.expect("OF")
+            cases = []
+            while True:
+                name = self.expect("ID")
+                self.expect("COLON")
+                typex = self.expect("TYPE").value
+                self.expect("ACTION")
+                cases.append(
+                    CaseNode(
+                        name.value, typex, self.expression(), *self.position(name)
+                    )
+                )
+                self.expect("SEMICOLON")
+                if self.kind == "ESAC":
+                    break
+            self.advance()
+            node = CaseOfNode(expression, cases, *self.position(token))
+        elif kind == "NEW":
+            self.advance()
+            typex = self.expect("TYPE")
+            node = NewNode(typex.value, *self.position(typex))
+        else:
+            self.error()
+
+        # Dispatches bind tighter than any other operator
+        while self.kind == "DOT" or self.kind == "ARROB":
+            typex = None
+            if self.advance().type == "ARROB":
+                typex = self.expect("TYPE").value
+                self.expect("DOT")
+            name = self.expect("ID").value
+            self.expect("OPAR")
+            node = FunctionCallNode(
+                node, name, self.arguments(), typex, node.line, node.column
+            )
+        return node
+
+    def arguments(self):
+        # The opening parenthesis is already consumed
+        args = []
+        if self.kind != "CPAR":
+            args.append(self.expression())
+            while self.kind == "COMMA":
+                self.advance()
+                args.append(self.expression())
+        self.expect("CPAR")
+        return args
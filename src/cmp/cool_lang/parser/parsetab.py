@@ -0,0 +1,92 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'programrightASSIGNrightNOTnonassocLESSEQUALEQUALLESSleftPLUSMINUSleftSTARDIVrightISVOIDrightINT_COMPLEMENTleftARROBleftDOTACTION ARROB ASSIGN BOOL CASE CBRA CLASS COLON COMMA COMMENT CPAR DIV DOT ELSE EQUAL ESAC FI ID IF IN INHERITS INT_COMPLEMENT ISVOID LESS LESSEQUAL LET LOOP MINUS NEW NOT NUMBER OBRA OF OPAR PLUS POOL SEMICOLON STAR STRING THEN TYPE WHILEempty :program : class_listclass_list : def_classclass_list : def_class class_listdef_class : CLASS TYPE OBRA feature_list CBRA SEMICOLONdef_class : CLASS TYPE INHERITS TYPE OBRA feature_list CBRA SEMICOLONfeature_list : feature feature_listfeature_list : emptyfeature : ID COLON TYPE SEMICOLONfeature : ID COLON TYPE ASSIGN expr SEMICOLONfeature : ID OPAR CPAR COLON TYPE OBRA expr CBRA SEMICOLONfeature : ID OPAR params_list CPAR COLON TYPE OBRA expr CBRA SEMICOLONparams_list : paramparams_list : param COMMA params_listparam : ID COLON TYPEexpr_list : expr SEMICOLONexpr_list : expr SEMICOLON expr_listlet_list : ID COLON TYPElet_list : ID COLON TYPE COMMA let_listlet_list : ID COLON TYPE ASSIGN exprlet_list : ID COLON TYPE ASSIGN expr COMMA let_listcase_list : ID COLON TYPE ACTION expr SEMICOLONcase_list : ID COLON TYPE ACTION expr SEMICOLON case_listexpr : comp_exprcomp_expr : comp_expr LESSEQUAL not_arithcomp_expr : comp_expr EQUAL not_arithcomp_expr : comp_expr LESS not_arithcomp_expr : not_arithnot_arith : NOT comp_exprnot_arith : aritharith : arith PLUS termarith : arith MINUS termarith : termterm : term STAR vfactorterm : term DIV vfactorterm : vfactorvfactor : ISVOID factorvfactor : factorfactor : INT_COMPLEMENT atomfactor : atomatom : IF expr THEN expr ELSE expr FIatom : WHILE expr LOOP expr POOLatom : OBRA expr_list CBRAatom : LET let_list IN expratom : CASE expr OF case_list ESACatom : ID ASSIGN expratom : atom func_callatom : member_callatom : NEW TYPEatom : OPAR expr CPARatom : IDatom : NUMBERatom : BOOLatom : STRINGfunc_call : DOT ID OPAR CPARfunc_call : DOT ID OPAR arg_list CPARfunc_call : ARROB TYPE DOT ID OPAR CPARfunc_call : ARROB TYPE DOT ID OPAR arg_list CPARarg_list : exprarg_list : expr COMMA arg_listmember_call : ID OPAR CPARmember_call : ID OPAR arg_list CPAR'
+    
+_lr_action_items = {'CLASS':([0,3,19,60,],[4,4,-5,-6,]),'$end':([1,2,3,5,19,60,],[0,-2,-3,-4,-5,-6,]),'TYPE':([4,8,16,28,29,51,58,76,106,133,],[6,13,20,56,57,84,87,100,119,141,]),'OBRA':([6,13,27,37,41,43,45,46,47,49,52,57,61,62,64,65,66,68,69,70,71,86,87,101,102,104,105,110,112,113,128,131,137,147,],[7,18,47,47,47,47,47,47,47,47,47,86,47,47,47,47,47,47,47,47,47,47,110,47,47,47,47,47,47,47,47,47,47,47,]),'INHERITS':([6,],[8,]),'ID':([7,10,17,18,26,27,31,37,41,43,45,46,47,48,49,52,61,62,63,64,65,66,68,69,70,71,75,86,101,102,104,105,107,110,112,113,114,128,130,131,134,137,142,146,147,151,],[12,12,21,12,-9,33,21,33,33,33,33,33,33,82,33,33,33,33,-10,33,33,33,33,33,33,33,99,33,33,33,33,33,121,33,33,33,127,33,82,33,-11,33,-12,82,33,121,]),'CBRA':([7,9,10,11,15,18,25,26,33,35,36,38,39,40,42,44,50,53,54,55,63,67,72,73,74,79,84,88,89,92,93,94,95,96,97,98,103,104,108,109,111,117,118,123,125,129,132,134,136,142,143,145,148,],[-1,14,-1,-8,-7,-1,32,-9,-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-10,-29,-37,-39,-47,103,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-16,-50,122,-62,-17,-44,135,-55,-42,-45,-11,-56,-12,-57,-41,-58,]),'COLON':([12,21,22,30,82,121,],[16,28,29,58,106,133,]),'OPAR':([12,27,33,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,99,101,102,104,105,110,112,113,127,128,131,137,147,],[17,52,62,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,113,52,52,52,52,52,52,52,137,52,52,52,52,]),'SEMICOLON':([14,20,32,33,34,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,80,84,88,89,92,93,94,95,96,97,98,103,108,111,118,122,125,129,132,135,136,143,145,148,150,],[19,26,60,-51,63,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,104,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,134,-55,-42,-45,142,-56,-57,-41,-58,151,]),'CPAR':([17,23,24,33,35,36,38,39,40,42,44,50,53,54,55,56,59,62,67,72,73,74,84,85,88,89,90,91,92,93,94,95,96,97,98,103,108,111,113,118,124,125,126,129,132,136,137,143,144,145,148,],[22,30,-13,-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-15,-14,89,-29,-37,-39,-47,-49,108,-46,-61,111,-59,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,125,-44,-60,-55,136,-42,-45,-56,143,-57,148,-41,-58,]),'ASSIGN':([20,33,119,],[27,61,131,]),'COMMA':([24,33,35,36,38,39,40,42,44,50,53,54,55,56,67,72,73,74,84,88,89,91,92,93,94,95,96,97,98,103,108,111,118,119,125,129,132,136,140,143,145,148,],[31,-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-15,-29,-37,-39,-47,-49,-46,-61,112,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,130,-55,-42,-45,-56,146,-57,-41,-58,]),'NOT':([27,37,45,46,47,49,52,61,62,64,65,66,86,101,102,104,105,110,112,113,128,131,137,147,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'ISVOID':([27,37,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'INT_COMPLEMENT':([27,37,41,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'IF':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'WHILE':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'LET':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'CASE':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'NEW':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'NUMBER':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'BOOL':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'STRING':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'DOT':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,100,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,75,-48,-52,-53,-54,-29,-37,75,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,114,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'ARROB':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,76,-48,-52,-53,-54,-29,-37,76,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'STAR':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,70,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,70,70,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'DIV':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,71,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,71,71,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'PLUS':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,68,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'MINUS':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,69,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'LESSEQUAL':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,64,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,64,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'EQUAL':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,65,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,65,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'LESS':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,66,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,66,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'THEN':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,77,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,101,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'LOOP':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,78,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,102,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'OF':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,83,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,107,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,-57,-41,-58,]),'ELSE':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,115,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,128,-44,-55,-42,-45,-56,-57,-41,-58,]),'POOL':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,116,118,125,129,132,136,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,129,-44,-55,-42,-45,-56,-57,-41,-58,]),'FI':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,84,88,89,92,93,94,95,96,97,98,103,108,111,118,125,129,132,136,138,143,145,148,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-55,-42,-45,-56,145,-57,-41,-58,]),'IN':([33,35,36,38,39,40,42,44,50,53,54,55,67,72,73,74,81,84,88,89,92,93,94,95,96,97,98,103,108,111,118,119,125,129,132,136,139,140,143,145,148,149,],[-51,-24,-28,-30,-33,-36,-38,-40,-48,-52,-53,-54,-29,-37,-39,-47,105,-49,-46,-61,-25,-26,-27,-31,-32,-34,-35,-43,-50,-62,-44,-18,-55,-42,-45,-56,-19,-20,-57,-41,-58,-21,]),'ESAC':([120,151,152,],[132,-22,-23,]),'ACTION':([141,],[147,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'program':([0,],[1,]),'class_list':([0,3,],[2,5,]),'def_class':([0,3,],[3,3,]),'feature_list':([7,10,18,],[9,15,25,]),'feature':([7,10,18,],[10,10,10,]),'empty':([7,10,18,],[11,11,11,]),'params_list':([17,31,],[23,59,]),'param':([17,31,],[24,24,]),'expr':([27,45,46,47,49,52,61,62,86,101,102,104,105,110,112,113,128,131,137,147,],[34,77,78,80,83,85,88,91,109,115,116,80,118,123,91,91,138,140,91,150,]),'comp_expr':([27,37,45,46,47,49,52,61,62,86,101,102,104,105,110,112,113,128,131,137,147,],[35,67,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'not_arith':([27,37,45,46,47,49,52,61,62,64,65,66,86,101,102,104,105,110,112,113,128,131,137,147,],[36,36,36,36,36,36,36,36,36,92,93,94,36,36,36,36,36,36,36,36,36,36,36,36,]),'arith':([27,37,45,46,47,49,52,61,62,64,65,66,86,101,102,104,105,110,112,113,128,131,137,147,],[38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,]),'term':([27,37,45,46,47,49,52,61,62,64,65,66,68,69,86,101,102,104,105,110,112,113,128,131,137,147,],[39,39,39,39,39,39,39,39,39,39,39,39,95,96,39,39,39,39,39,39,39,39,39,39,39,39,]),'vfactor':([27,37,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[40,40,40,40,40,40,40,40,40,40,40,40,40,40,97,98,40,40,40,40,40,40,40,40,40,40,40,40,]),'factor':([27,37,41,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[42,42,72,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'atom':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[44,44,44,73,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'member_call':([27,37,41,43,45,46,47,49,52,61,62,64,65,66,68,69,70,71,86,101,102,104,105,110,112,113,128,131,137,147,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'func_call':([44,73,],[74,74,]),'expr_list':([47,104,],[79,117,]),'let_list':([48,130,146,],[81,139,149,]),'arg_list':([62,112,113,137,],[90,124,126,144,]),'case_list':([107,151,],[120,152,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> program","S'",1,None,None,None),
+  ('empty -> <empty>','empty',0,'p_empty','clparser.py',70),
+  ('program -> class_list','program',1,'p_program','clparser.py',74),
+  ('class_list -> def_class','class_list',1,'p_class_list_simple','clparser.py',78),
+  ('class_list -> def_class class_list','class_list',2,'p_class_list_multi','clparser.py',82),
+  ('def_class -> CLASS TYPE OBRA feature_list CBRA SEMICOLON','def_class',6,'p_def_class','clparser.py',86),
+  ('def_class -> CLASS TYPE INHERITS TYPE OBRA feature_list CBRA SEMICOLON','def_class',8,'p_def_class_heritance','clparser.py',92),
+  ('feature_list -> feature feature_list','feature_list',2,'p_feature_list','clparser.py',98),
+  ('feature_list -> empty','feature_list',1,'p_feature_list_empty','clparser.py',102),
+  ('feature -> ID COLON TYPE SEMICOLON','feature',4,'p_feature_declaration','clparser.py',106),
+  ('feature -> ID COLON TYPE ASSIGN expr SEMICOLON','feature',6,'p_feature_assign','clparser.py',112),
+  ('feature -> ID OPAR CPAR COLON TYPE OBRA expr CBRA SEMICOLON','feature',9,'p_feature_function','clparser.py',118),
+  ('feature -> ID OPAR params_list CPAR COLON TYPE OBRA expr CBRA SEMICOLON','feature',10,'p_feature_function_params','clparser.py',124),
+  ('params_list -> param','params_list',1,'p_params_list_simple','clparser.py',130),
+  ('params_list -> param COMMA params_list','params_list',3,'p_params_list_multi','clparser.py',134),
+  ('param -> ID COLON TYPE','param',3,'p_param','clparser.py',138),
+  ('expr_list -> expr SEMICOLON','expr_list',2,'p_expr_list_simple','clparser.py',144),
+  ('expr_list -> expr SEMICOLON expr_list','expr_list',3,'p_expr_list_multi','clparser.py',148),
+  ('let_list -> ID COLON TYPE','let_list',3,'p_let_list_declaration_simple','clparser.py',152),
+  ('let_list -> ID COLON TYPE COMMA let_list','let_list',5,'p_let_list_declaration_multi','clparser.py',158),
+  ('let_list -> ID COLON TYPE ASSIGN expr','let_list',5,'p_let_list_assign_simple','clparser.py',164),
+  ('let_list -> ID COLON TYPE ASSIGN expr COMMA let_list','let_list',7,'p_let_list_assign_multi','clparser.py',170),
+  ('case_list -> ID COLON TYPE ACTION expr SEMICOLON','case_list',6,'p_case_list_simple','clparser.py',176),
+  ('case_list -> ID COLON TYPE ACTION expr SEMICOLON case_list','case_list',7,'p_case_list_multi','clparser.py',182),
+  ('expr -> comp_expr','expr',1,'p_expr','clparser.py',188),
+  ('comp_expr -> comp_expr LESSEQUAL not_arith','comp_expr',3,'p_comp_expr_le','clparser.py',192),
+  ('comp_expr -> comp_expr EQUAL not_arith','comp_expr',3,'p_comp_expr_e','clparser.py',198),
+  ('comp_expr -> comp_expr LESS not_arith','comp_expr',3,'p_comp_expr_l','clparser.py',204),
+  ('comp_expr -> not_arith','comp_expr',1,'p_comp_expr_s','clparser.py',210),
+  ('not_arith -> NOT comp_expr','not_arith',2,'p_not_arith_not','clparser.py',214),
+  ('not_arith -> arith','not_arith',1,'p_not_arith','clparser.py',218),
+  ('arith -> arith PLUS term','arith',3,'p_arith_plus','clparser.py',222),
+  ('arith -> arith MINUS term','arith',3,'p_arith_minus','clparser.py',228),
+  ('arith -> term','arith',1,'p_arith_simple','clparser.py',234),
+  ('term -> term STAR vfactor','term',3,'p_term_star','clparser.py',238),
+  ('term -> term DIV vfactor','term',3,'p_term_div','clparser.py',244),
+  ('term -> vfactor','term',1,'p_term_simple','clparser.py',250),
+  ('vfactor -> ISVOID factor','vfactor',2,'p_vfactor_is','clparser.py',254),
+  ('vfactor -> factor','vfactor',1,'p_vfactor','clparser.py',258),
+  ('factor -> INT_COMPLEMENT atom','factor',2,'p_factor_int_comp','clparser.py',262),
+  ('factor -> atom','factor',1,'p_factor_atom','clparser.py',266),
+  ('atom -> IF expr THEN expr ELSE expr FI','atom',7,'p_atom_if_else','clparser.py',270),
+  ('atom -> WHILE expr LOOP expr POOL','atom',5,'p_atom_while','clparser.py',276),
+  ('atom -> OBRA expr_list CBRA','atom',3,'p_atom_multi','clparser.py',282),
+  ('atom -> LET let_list IN expr','atom',4,'p_atom_let_in','clparser.py',288),
+  ('atom -> CASE expr OF case_list ESAC','atom',5,'p_atom_case','clparser.py',294),
+  ('atom -> ID ASSIGN expr','atom',3,'p_atom_assign','clparser.py',300),
+  ('atom -> atom func_call','atom',2,'p_atom_func_call','clparser.py',306),
+  ('atom -> member_call','atom',1,'p_atom_member_call','clparser.py',312),
+  ('atom -> NEW TYPE','atom',2,'p_atom_new','clparser.py',316),
+  ('atom -> OPAR expr CPAR','atom',3,'p_atom_par','clparser.py',322),
+  ('atom -> ID','atom',1,'p_atom_var','clparser.py',326),
+  ('atom -> NUMBER','atom',1,'p_atom_int','clparser.py',332),
+  ('atom -> BOOL','atom',1,'p_atom_bool','clparser.py',338),
+  ('atom -> STRING','atom',1,'p_atom_str','clparser.py',344),
+  ('func_call -> DOT ID OPAR CPAR','func_call',4,'p_func_call_simple','clparser.py',350),
+  ('func_call -> DOT ID OPAR arg_list CPAR','func_call',5,'p_func_call_multi','clparser.py',354),
+  ('func_call -> ARROB TYPE DOT ID OPAR CPAR','func_call',6,'p_func_call_simple_at','clparser.py',358),
+  ('func_call -> ARROB TYPE DOT ID OPAR arg_list CPAR','func_call',7,'p_func_call_multi_at','clparser.py',362),
+  ('arg_list -> expr','arg_list',1,'p_arg_list_simple','clparser.py',366),
+  ('arg_list -> expr COMMA arg_list','arg_list',3,'p_arg_list_multi','clparser.py',370),
+  ('member_call -> ID OPAR CPAR','member_call',3,'p_member_call_simple','clparser.py',374),
+  ('member_call -> ID OPAR arg_list CPAR','member_call',4,'p_member_call_multi','clparser.py',380),
+]
@@ -1,26 +1,85 @@
+from functools import lru_cache
+
+from ...profiler import NULL_PROFILER
 from .formatter import COOL_FORMATTER
 from .type_builder import COOL_TYPE_BUILDER
 from .type_checker import COOL_TYPE_CHECKER
+from .semantic_utils import Context, Scope
 from .type_collector import COOL_TYPE_COLLECTOR
 
 
+def build_basic_context():
+    collector = COOL_TYPE_COLLECTOR(errors=[])
+    collector.context = Context()
+    collector.define_basic_types()
+    COOL_TYPE_BUILDER(context=collector.context, errors=[]).build_basic_types()
+    return collector.context
+
+
+@lru_cache(maxsize=None)
+def shared_basic_context():
+    """
+    The basic types context of the process, built once. It is never
+    changed, every compilation collects its types in a clone of it.
+    """
+    return build_basic_context()
+
+
 class COOL_CHECKER:
-    def __init__(self):
+    def __init__(self, basic_context=None, jobs=1):
         self.context = None
+        self.basic_context = basic_context
         self.errors = []
+        # Processes checking the features, see `parallel_checker`
+        self.jobs = jobs
 
-    def check_semantics(self, program, verbose=False):
-        self.errors.clear()
+    def check_semantics(self, program, verbose=False, profiler=NULL_PROFILER):
         # All semantics checks here
         if verbose:
             print(COOL_FORMATTER().visit(program, tabs=0))
-        self.context = COOL_TYPE_COLLECTOR(errors=self.errors).visit(program)
-        if len(self.errors) == 0:
+        if self.build_context(program, profiler):
+            self.check_types(program.classes, profiler)
+        if verbose:
+            print(self.context)
+        return not len(self.errors) > 0
+
+    def build_context(self, program, profiler=NULL_PROFILER):
+        """
+        Collect and build the types of `program`. False when the types
+        could not be collected, the bodies are not worth checking then.
+        """
+        self.errors.clear()
+        with profiler.stage("COOL_TYPE_COLLECTOR"):
+            self.context = COOL_TYPE_COLLECTOR(
+                errors=self.errors,
+                context=self.basic_context,
+            ).visit(program)
+        if len(self.errors) > 0:
+            return False
+        with profiler.stage("COOL_TYPE_BUILDER"):
             COOL_TYPE_BUILDER(
                 context=self.context,
                 errors=self.errors,
+                build_basics=self.basic_context is None,
             ).visit(program)
-            COOL_TYPE_CHECKER(self.context, errors=self.errors).visit(program)
-        if verbose:
-            print(self.context)
-        return not len(self.errors) > 0
+        return True
+
+    def check_types(self, classes, profiler=NULL_PROFILER):
+        """
+        Check the features of the `classes` of a program whose context is
+        already built. With more than one job, in worker processes when the
+        program is big enough.
+        """
+        with profiler.stage("COOL_TYPE_CHECKER"):
+            if self.jobs != 1:
+                from .parallel_checker import check_parallel, parallel_jobs
+
+                jobs = parallel_jobs(classes, self.jobs)
+                if jobs > 1:
+                    profiler.count("check_jobs", jobs)
+                    check_parallel(self.context, classes, jobs, self.errors)
+                    return
+            checker = COOL_TYPE_CHECKER(self.context, errors=self.errors)
+            scope = Scope()
+            for node in classes:
+                checker.visit(node, scope)
@@ -0,0 +1,156 @@
+"""
+Type checking of the features of a program in worker processes.
+
+Once the context is built every attribute initializer and method body can
+be checked on its own. The features of the classes are split in runs of
+consecutive features and every worker checks a run with its own copy of
+the context and of the classes, inherited when the pool is forked. The
+workers send back their errors and the name of the static type of every
+node, in the order the nodes are walked, and they are merged back in the
+order of the runs, so the errors come in the same order as checking in a
+single process.
+"""
+import multiprocessing
+import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from ..ast import ClassDeclarationNode, Node
+from ..ast.arena import LIST, NODE, arena_fields
+from .semantic_utils import Context, ErrorType, Scope, VoidType
+from .type_checker import COOL_TYPE_CHECKER
+
+# Features worth a worker process, fewer are checked in the caller
+MIN_FEATURES = 64
+# Runs given to every process, the more the better they are balanced
+RUNS_PER_JOB = 4
+
+# (index of the class, first feature, end of the features)
+Run = Tuple[int, int, int]
+
+_worker: Optional[Tuple[Context, List[ClassDeclarationNode]]] = None
+
+
+@lru_cache(maxsize=None)
+def child_fields(node_type: type) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Fields of a node class holding a node and holding a list of nodes.
+    """
+    fields = arena_fields(node_type)
+    return (
+        tuple(name for name, how in fields if how == NODE),
+        tuple(name for name, how in fields if how == LIST),
+    )
+
+
+def walk(nodes: List[Node]) -> List[Node]:
+    """
+    Every node under `nodes`, in the same order in every process.
+    """
+    result = []
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if node is None:
+            continue
+        result.append(node)
+        node_names, list_names = child_fields(node.__class__)
+        for name in node_names:
+            pending.append(getattr(node, name))
+        for name in list_names:
+            pending.extend(getattr(node, name))
+    return result
+
+
+def parallel_jobs(classes: List[ClassDeclarationNode], jobs: Optional[int]) -> int:
+    """
+    The processes worth checking `classes` with, up to `jobs` (one per core
+    when None or 0). Only 1 where processes cannot be forked.
+    """
+    # The workers get the context and the classes by forking, they would
+    # have to be pickled (and deep ASTs cannot be) with other start methods
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    features = sum(len(node.features) for node in classes)
+    return min(jobs or os.cpu_count() or 1, features // MIN_FEATURES)
+
+
+def split(classes: List[ClassDeclarationNode], parts: int) -> List[List[Run]]:
+    """
+    The features of `classes` split in up to `parts` lists of runs of about
+    the same length. Classes without features get an empty run.
+    """
+    size = -(-sum(max(len(node.features), 1) for node in classes) // parts)
+    chunks: List[List[Run]] = [[]]
+    room = size
+    for index, node in enumerate(classes):
+        count, start = len(node.features), 0
+        while True:
+            end = min(count, start + room)
+            chunks[-1].append((index, start, end))
+            room -= max(end - start, 1)
+            start = end
+            if room <= 0:
+                chunks.append([])
+                room = size
+            if start >= count:
+                break
+    return [chunk for chunk in chunks if chunk]
+
+
+def _init_worker(context: Context, classes: List[ClassDeclarationNode]):
+    global _worker
+    _worker = context, classes
+
+
+def check_job(chunk: List[Run]):
+    """
+    The errors of the runs of `chunk` and the names of the static types of
+    their nodes.
+    """
+    context, classes = _worker
+    errors: list = []
+    checker = COOL_TYPE_CHECKER(context, errors=errors)
+    scope = Scope()
+    names = []
+    for index, start, end in chunk:
+        node = classes[index]
+        features = node.features[start:end]
+        checker.check_features(node, features, scope, report=start == 0)
+        for child in walk(features):
+            typex = child.static_type
+            names.append(None if typex is None else typex.name)
+    return errors, names
+
+
+def check_parallel(
+    context: Context,
+    classes: List[ClassDeclarationNode],
+    jobs: int,
+    errors: list,
+):
+    """
+    Check `classes` with `jobs` worker processes, appending their errors to
+    `errors` and setting the static types of their nodes.
+    """
+    chunks = split(classes, jobs * RUNS_PER_JOB)
+    types = dict(context.types)
+    types[None] = None
+    with multiprocessing.get_context("fork").Pool(
+        jobs, initializer=_init_worker, initargs=(context, classes)
+    ) as pool:
+        results = pool.imap(check_job, chunks)
+        for chunk in chunks:
+            # The nodes of a chunk are found while the workers check it
+            nodes = [
+                node
+                for index, start, end in chunk
+                for node in walk(classes[index].features[start:end])
+            ]
+            chunk_errors, names = next(results)
+            errors.extend(chunk_errors)
+            for node, name in zip(nodes, names):
+                try:
+                    node.static_type = types[name]
+                except KeyError:
+                    node.static_type = ErrorType() if name == "<error>" else VoidType()
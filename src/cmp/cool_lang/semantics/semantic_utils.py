@@ -1,3 +1,6 @@
+from typing import Dict, List, Optional, Tuple
+
+
 class SemanticException(Exception):
     @property
     def text(self):
@@ -58,12 +61,21 @@ class Type:
         self.children = []
         self.finish_time = 0
         self._visited = False
-
-    def compute_finish_time_recursively(self, ref_int):
-        for child in self.children:
-            child.compute_finish_time_recursively(ref_int)
-        self.finish_time = ref_int["value"]
-        ref_int["value"] += 1
+        # Preorder number of the type in the hierarchy, the finish time is
+        # the postorder one, and its ancestors 1, 2, 4, 8... levels above.
+        # Set by `Context.compute_finish_time`, None before
+        self._order: Optional[int] = None
+        self._jumps: List["Type"] = []
+        # Every attribute and method of the type by name, the inherited ones
+        # included. Built by `freeze` and dropped by `invalidate` when the
+        # type or one of its ancestors changes, the lookups walk the
+        # hierarchy in the meantime
+        self._attribute_table: Optional[Dict[str, Attribute]] = None
+        self._method_table: Optional[Dict[str, Method]] = None
+        # Every attribute, method (with the type defining it) and feature of
+        # the type in layout order, the inherited ones first. Built the first
+        # time they are needed and dropped by `invalidate` as well
+        self._layouts: Optional[Tuple[tuple, tuple, tuple]] = None
 
     def set_parent(self, parent):
         if self.parent is not None:
@@ -71,59 +83,112 @@ class Type:
         if parent.name in ["Int", "String", "Bool"]:
             raise SemanticException(f"Cannot inherit from basic type {parent.name}.")
         self.parent = parent
-        if all(map(lambda x: x.name != self.name, parent.children)):
-            parent.children.append(self)
+        # The parent is only set once, the type is not among the children
+        # yet. Looking for it made wide hierarchies quadratic
+        parent.children.append(self)
+        self.invalidate()
+        if self._order is not None:
+            # A numbered hierarchy moves below another type
+            pending = [self]
+            while pending:
+                typex = pending.pop()
+                typex._order = None
+                typex._jumps = []
+                pending.extend(typex.children)
+
+    def freeze(self):
+        """
+        Build the tables of the type, and of its ancestors first.
+        """
+        chain = []
+        actual = self
+        while actual is not None and actual._method_table is None:
+            chain.append(actual)
+            actual = actual.parent
+        for typex in reversed(chain):
+            parent = typex.parent
+            attributes = {} if parent is None else parent._attribute_table
+            methods = {} if parent is None else parent._method_table
+            # A type without features of its own shares the tables of its
+            # parent, the tables are never changed once built
+            if typex.attributes:
+                attributes = dict(attributes)
+                for attr in reversed(typex.attributes):
+                    attributes[attr.name] = attr
+            if typex.methods:
+                methods = {**methods, **typex.methods}
+            typex._attribute_table = attributes
+            typex._method_table = methods
+
+    def invalidate(self):
+        """
+        Drop the tables of the type and of every type inheriting from it.
+        """
+        pending = [self]
+        while pending:
+            typex = pending.pop()
+            # The tables and the layouts are built for the ancestors first,
+            # the descendants of a type without them have none either
+            if typex._method_table is not None or typex._layouts is not None:
+                typex._attribute_table = typex._method_table = None
+                typex._layouts = None
+                pending.extend(typex.children)
+
+    def find_attribute(self, name: str) -> Optional[Attribute]:
+        table = self._attribute_table
+        if table is not None:
+            return table.get(name)
+        actual = self
+        while actual is not None:
+            for attr in actual.attributes:
+                if attr.name == name:
+                    return attr
+            actual = actual.parent
+        return None
 
     def get_attribute(self, name: str):
-        try:
-            return next(attr for attr in self.attributes if attr.name == name)
-        except StopIteration:
-            if self.parent is None:
-                raise SemanticException(
-                    f'Attribute "{name}" is not defined in type {self.name}.'
-                )
-            try:
-                return self.parent.get_attribute(name)
-            except SemanticException:
-                raise SemanticException(
-                    f'Attribute "{name}" is not defined in type {self.name}.'
-                )
+        attribute = self.find_attribute(name)
+        if attribute is None:
+            raise SemanticException(
+                f'Attribute "{name}" is not defined in type {self.name}.'
+            )
+        return attribute
 
     def define_attribute(self, name: str, typex):
-        try:
-            self.get_attribute(name)
-        except SemanticException:
-            attribute = Attribute(name, typex)
-            self.attributes.append(attribute)
-            return attribute
-        else:
+        if self.find_attribute(name) is not None:
             raise SemanticException(
                 f'Attribute "{name}" is already defined in type {self.name}.'
             )
+        attribute = Attribute(name, typex)
+        self.attributes.append(attribute)
+        self.invalidate()
+        return attribute
+
+    def find_method(self, name: str) -> Optional[Method]:
+        table = self._method_table
+        if table is not None:
+            return table.get(name)
+        actual = self
+        while actual is not None:
+            method = actual.methods.get(name)
+            if method is not None:
+                return method
+            actual = actual.parent
+        return None
 
     def get_method(self, name: str):
-        try:
-            return self.methods[name]
-        except KeyError:
-            if self.parent is None:
-                raise SemanticException(
-                    f'Method "{name}" is not defined in type {self.name}.'
-                )
-            try:
-                return self.parent.get_method(name)
-            except SemanticException:
-                raise SemanticException(
-                    f'Method "{name}" is not defined in type {self.name}.'
-                )
+        method = self.find_method(name)
+        if method is None:
+            raise SemanticException(
+                f'Method "{name}" is not defined in type {self.name}.'
+            )
+        return method
 
     def define_method(
         self, name: str, param_names: list, param_types: list, return_type
     ):
-        try:
-            method = self.get_method(name)
-        except SemanticException:
-            pass
-        else:
+        method = self.find_method(name)
+        if method is not None:
             if name in self.methods.keys():  # duplicate?
                 raise SemanticException(
                     f'Method "{name}" already defined in type {self.name}.'
@@ -140,50 +205,65 @@ class Type:
         method = self.methods[name] = Method(
             name, param_names, param_types, return_type
         )
+        self.invalidate()
         return method
 
+    def layouts(self):
+        """
+        The attributes, methods and features of the type, see `_layouts`,
+        built for its ancestors first.
+        """
+        chain = []
+        actual = self
+        while actual is not None and actual._layouts is None:
+            chain.append(actual)
+            actual = actual.parent
+        for typex in reversed(chain):
+            if typex.parent is None:
+                attributes, methods, features = (), (), ()
+            else:
+                attributes, methods, features = typex.parent._layouts
+            own = typex.methods
+            if typex.attributes or own:
+                # An overridden method keeps the place of the inherited one
+                inherited = {method.name for method, _ in methods}
+                methods = tuple(
+                    (own[method.name], typex) if method.name in own else (method, owner)
+                    for method, owner in methods
+                )
+                features = tuple(
+                    (own[feature[0].name], typex)
+                    if not isinstance(feature, Attribute) and feature[0].name in own
+                    else feature
+                    for feature in features
+                )
+                added = tuple(
+                    (method, typex)
+                    for method in own.values()
+                    if method.name not in inherited
+                )
+                own_attributes = tuple(typex.attributes)
+                attributes += own_attributes
+                methods += added
+                features += own_attributes + added
+            typex._layouts = (attributes, methods, features)
+        return self._layouts
+
     def get_all_attributes(self):
-        if self.parent:
-            for attr in self.parent.get_all_attributes():
-                yield attr
-        for attr in self.attributes:
-            yield attr
+        return self.layouts()[0]
 
     def get_all_methods(self):
-        done = set()
-        if self.parent:
-            for method, typex in self.parent.get_all_methods():
-                if method.name in self.methods:
-                    done.add(method.name)
-                    yield (self.methods[method.name], self)
-                else:
-                    yield (method, typex)
-        for method in self.methods.values():
-            if method.name in done:
-                continue
-            yield (method, self)
+        return self.layouts()[1]
 
     def get_all_features(self):
-        done = set()
-        if self.parent:
-            for feature in self.parent.get_all_features():
-                if not isinstance(feature, Attribute):
-                    method, typex = feature
-                    if method.name in self.methods:
-                        done.add(method.name)
-                        yield (self.methods[method.name], self)
-                    else:
-                        yield (method, typex)
-                else:
-                    yield feature
-        for attr in self.attributes:
-            yield attr
-        for method in self.methods.values():
-            if method.name in done:
-                continue
-            yield (method, self)
+        return self.layouts()[2]
 
     def is_subtype(self, otype):  # check if self is subtype of otype
+        if self._order is not None and otype._order is not None:
+            # The numbers of a type enclose the ones of its descendants
+            return (
+                otype._order <= self._order and self.finish_time <= otype.finish_time
+            )
         actual = self
         while True:
             if actual == otype:
@@ -232,6 +312,22 @@ def find_common_ancestor(type1: Type, type2: Type):
     if type1 is ErrorType or type2 is ErrorType:
         return ErrorType()
 
+    if type1._order is not None and type2._order is not None:
+        # Climb from type1 to the highest ancestor that is not an ancestor of
+        # type2, in jumps of decreasing powers of two. The ancestors of type2
+        # are the types whose numbers enclose its ones
+        order, finish_time = type2._order, type2.finish_time
+        actual = type1
+        if actual._order <= order and finish_time <= actual.finish_time:
+            return actual
+        for level in reversed(range(len(type1._jumps))):
+            jumps = actual._jumps
+            if level < len(jumps):
+                jump = jumps[level]
+                if not (jump._order <= order and finish_time <= jump.finish_time):
+                    actual = jump
+        return actual.parent
+
     ancestor_t1 = []
     actual = type1
     while actual:
@@ -263,9 +359,68 @@ class Context:
         except KeyError:
             raise SemanticException(f'Type "{name}" is not defined.')
 
+    def clone(self):
+        clone = Context()
+        for name in self.types:
+            clone.types[name] = Type(name)
+
+        def mapped(typex):
+            return clone.types.get(typex.name, typex)
+
+        for name, typex in self.types.items():
+            new_type = clone.types[name]
+            new_type.parent = None if typex.parent is None else mapped(typex.parent)
+            new_type.children = [mapped(child) for child in typex.children]
+            new_type.finish_time = typex.finish_time
+            new_type.attributes = [
+                Attribute(attr.name, mapped(attr.type)) for attr in typex.attributes
+            ]
+            new_type.methods = {
+                name: Method(
+                    method.name,
+                    list(method.param_names),
+                    [mapped(ptype) for ptype in method.param_types],
+                    mapped(method.return_type),
+                )
+                for name, method in typex.methods.items()
+            }
+        return clone
+
+    def freeze(self):
+        """
+        Build the attribute and method tables of every type, once the
+        hierarchy and the features of all of them are known.
+        """
+        for typex in self.types.values():
+            typex.freeze()
+
     def compute_finish_time(self):
-        root = self.types["Object"]
-        root.compute_finish_time_recursively({"value": 0})
+        """
+        Number the types below Object in preorder and in postorder (their
+        finish time) and link every type to its ancestors 2^k levels above,
+        for `Type.is_subtype` and `find_common_ancestor`.
+        """
+        for typex in self.types.values():
+            typex._order = None
+            typex._jumps = []
+        preorder = postorder = 0
+        # Every type is pushed twice, it is finished the second time
+        pending = [(self.types["Object"], False)]
+        while pending:
+            typex, finished = pending.pop()
+            if finished:
+                typex.finish_time = postorder
+                postorder += 1
+                continue
+            typex._order = preorder
+            preorder += 1
+            jumps = typex._jumps
+            if typex.parent is not None:
+                jumps.append(typex.parent)
+                while len(jumps[-1]._jumps) >= len(jumps):
+                    jumps.append(jumps[-1]._jumps[len(jumps) - 1])
+            pending.append((typex, True))
+            pending.extend((child, False) for child in reversed(typex.children))
 
     def __str__(self):
         return (
@@ -291,34 +446,64 @@ class Var:
 
 
 class Scope:
-    def __init__(self, parent=None):
-        self.parent = parent
-        self.vars = {}
+    """
+    Flat symbol table. Every name maps to the stack of its bindings, the
+    innermost last, and every level remembers where its definitions start
+    in the log, so defining, looking up and leaving a level do not walk
+    the enclosing levels.
+    """
+
+    def __init__(self):
+        self.bindings: Dict[str, List[tuple]] = {}
+        self.log: List[str] = []
+        self.marks: List[int] = []
+
+    def enter(self):
+        """
+        Open a level, closed by `exit` or when used as a context manager.
+        """
+        self.marks.append(len(self.log))
+        return self
+
+    def exit(self, levels=1):
+        mark = self.marks[-levels]
+        del self.marks[-levels:]
+        log, bindings = self.log, self.bindings
+        while len(log) > mark:
+            name = log.pop()
+            stack = bindings[name]
+            stack.pop()
+            if not stack:
+                del bindings[name]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exit()
 
     def define_var(self, name, typex):
-        if name in self.vars:
+        depth = len(self.marks)
+        stack = self.bindings.setdefault(name, [])
+        if stack and stack[-1][0] == depth:
             raise SemanticException(
                 f"Variable {name} already defined in current context."
             )
-        var = self.vars[name] = Var(name, typex)
+        var = Var(name, typex)
+        stack.append((depth, var))
+        self.log.append(name)
         return var
 
     def get_var(self, name):
         try:
-            return self.vars[name]
+            return self.bindings[name][-1][1]
         except KeyError:
-            if self.parent is not None:
-                try:
-                    return self.parent.get_var(name)
-                except SemanticException as e:
-                    raise e
             raise SemanticException(f"Variable {name} is not defined.")
 
     def __str__(self):
         return (
-            "{\n"
-            + ("\t" if self.parent is None else "Parent:\n" + f"{self.parent}\n\t")
-            + "\n\t".join(str(x) for x in self.vars.values())
+            "{\n\t"
+            + "\n\t".join(str(stack[-1][1]) for stack in self.bindings.values())
             + "\n}"
         )
 
@@ -10,10 +10,11 @@ from .semantic_utils import Context, ErrorType, SemanticException, VoidType
 
 
 class COOL_TYPE_BUILDER(object):
-    def __init__(self, context: Context, errors=[]):
+    def __init__(self, context: Context, errors=None, build_basics=True):
         self.context = context
         self.current_type = None
-        self.errors = errors
+        self.errors = [] if errors is None else errors
+        self.build_basics = build_basics
 
     def build_basic_types(self):
         strt = self.context.get_type("String")
@@ -49,10 +50,12 @@ class COOL_TYPE_BUILDER(object):
 
     @when(ProgramNode)
     def visit(self, node: ProgramNode):  # noqa:F811
-        self.build_basic_types()
+        if self.build_basics:
+            self.build_basic_types()
         for class_def in node.classes:
             self.visit(class_def)
         self.context.compute_finish_time()
+        self.context.freeze()
         try:
             self.context.get_type("Main")
             try:
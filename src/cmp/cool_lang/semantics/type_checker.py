@@ -27,7 +27,7 @@ from ..ast import (
     WhileLoopNode,
 )
 from ..errors import CAttributeError, CNameError, CTypeError, SemanticError
-from ..utils import on, when
+from ..utils import method_table, on, trampoline, when
 from .semantic_utils import (
     Context,
     ErrorType,
@@ -38,11 +38,12 @@ from .semantic_utils import (
 )
 
 
+@method_table
 class COOL_TYPE_CHECKER(object):
-    def __init__(self, context: Context, errors=[]):
+    def __init__(self, context: Context, errors=None):
         self.current_type: Type = None  # type:ignore
         self.context: Context = context
-        self.errors = errors
+        self.errors = [] if errors is None else errors
 
         self.type_int = self.context.get_type("Int")
         self.type_str = self.context.get_type("String")
@@ -65,17 +66,20 @@ class COOL_TYPE_CHECKER(object):
 
     @when(ClassDeclarationNode)
     def visit(self, node: ClassDeclarationNode, scope: Scope):  # noqa:F811
-        self.current_type = self.context.get_type(node.id)
+        self.check_features(node, node.features, scope)
 
-        attrs = []
-        actual = self.current_type
-        while actual:
-            attrs += actual.attributes
-            actual = actual.parent
+    def check_features(self, node: ClassDeclarationNode, features, scope, report=True):
+        """
+        Check `features`, some of the features of the class `node`. The
+        errors of the class itself are reported only with `report`.
+        """
+        self.current_type = self.context.get_type(node.id)
 
-        class_scope = Scope(parent=scope)
-        for attr in attrs:
+        scope.enter()
+        for attr in self.current_type.get_all_attributes():
             if attr.name == "self":
+                if not report:
+                    continue
                 line, column = [
                     (attrib.line, attrib.column)
                     for attrib in node.features
@@ -89,20 +93,18 @@ class COOL_TYPE_CHECKER(object):
                     )
                 )
                 continue
-            class_scope.define_var(attr.name, attr.type)
+            scope.define_var(attr.name, attr.type)
 
-        for feature_node in node.features:
-            self.visit(
-                feature_node,
-                scope if feature_node is AttrDeclarationNode else class_scope,
-            )  # Ensures an attribute cannot be defined from another one
+        for feature_node in features:
+            self.visit(feature_node, scope)
+        scope.exit()
 
     @when(AttrDeclarationNode)
     def visit(self, node: AttrDeclarationNode, scope: Scope):  # noqa:F811
         if node.expression:
-            new_scope = Scope(parent=scope)
-            new_scope.define_var("self", self.current_type)
-            self.visit(node.expression, new_scope)
+            with scope.enter():
+                scope.define_var("self", self.current_type)
+                trampoline(self.visit, node.expression, scope)
 
             attr_type = self.context.get_type(node.type)
 
@@ -119,14 +121,14 @@ class COOL_TYPE_CHECKER(object):
 
     @when(FuncDeclarationNode)
     def visit(self, node: FuncDeclarationNode, scope: Scope):  # noqa:F811
-        func_scope = Scope(parent=scope)
-        func_scope.define_var("self", self.current_type)
+        scope.enter()
+        scope.define_var("self", self.current_type)
 
         func = self.current_type.get_method(node.id)
 
         for param, param_type in zip(node.params, func.param_types):
             try:
-                func_scope.define_var(param.id, param_type)
+                scope.define_var(param.id, param_type)
             except SemanticException:  # Check if params names are differnt
                 self.errors.append(
                     SemanticError(
@@ -136,7 +138,8 @@ class COOL_TYPE_CHECKER(object):
                     )
                 )
 
-        self.visit(node.expression, func_scope)
+        trampoline(self.visit, node.expression, scope)
+        scope.exit()
 
         ret_type = func.return_type
         if not node.expression.static_type.is_subtype(ret_type):
@@ -152,7 +155,7 @@ class COOL_TYPE_CHECKER(object):
 
     @when(IfThenElseNode)
     def visit(self, node: IfThenElseNode, scope: Scope):  # noqa:F811
-        self.visit(node.condition, scope)
+        yield node.condition, scope
         if not node.condition.static_type == self.type_bool:
             self.errors.append(
                 CTypeError(
@@ -164,8 +167,8 @@ class COOL_TYPE_CHECKER(object):
                 )
             )
 
-        self.visit(node.if_body, Scope(parent=scope))
-        self.visit(node.else_body, Scope(parent=scope))
+        yield node.if_body, scope
+        yield node.else_body, scope
 
         node.static_type = find_common_ancestor(
             node.if_body.static_type, node.else_body.static_type
@@ -173,7 +176,7 @@ class COOL_TYPE_CHECKER(object):
 
     @when(WhileLoopNode)
     def visit(self, node: WhileLoopNode, scope: Scope):  # noqa:F811
-        self.visit(node.condition, scope)
+        yield node.condition, scope
         if not node.condition.static_type == self.type_bool:
             self.errors.append(
                 CTypeError(
@@ -185,14 +188,13 @@ class COOL_TYPE_CHECKER(object):
                 )
             )
 
-        self.visit(node.body, Scope(parent=scope))
+        yield node.body, scope
         node.static_type = self.type_obj
 
     @when(BlockNode)
     def visit(self, node: BlockNode, scope: Scope):  # noqa:F811
-        block_scope = Scope(parent=scope)
         for expr in node.expressions:
-            self.visit(expr, block_scope)
+            yield expr, scope
 
         node.static_type = node.expressions[-1].static_type
 
@@ -205,7 +207,7 @@ class COOL_TYPE_CHECKER(object):
             self.errors.append(CTypeError(node.line, node.column, e.text))
 
         if node.expression:
-            self.visit(node.expression, scope)
+            yield node.expression, scope
             if not node.expression.static_type.is_subtype(node_type):
                 self.errors.append(
                     CTypeError(
@@ -228,36 +230,37 @@ class COOL_TYPE_CHECKER(object):
 
     @when(LetInNode)
     def visit(self, node: LetInNode, scope: Scope):  # noqa:F811
-        letin_scope = scope
+        # One level for each binding, a name can be bound again
         for letnode in node.let_body:
-            letin_scope = Scope(parent=letin_scope)
-            self.visit(letnode, letin_scope)
+            scope.enter()
+            yield letnode, scope
 
-        self.visit(node.in_body, letin_scope)
+        yield node.in_body, scope
+        scope.exit(len(node.let_body))
         node.static_type = node.in_body.static_type
 
     @when(CaseNode)
     def visit(self, node: CaseNode, scope: Scope):  # noqa:F811
-        case_scope = Scope(parent=scope)
         node_type = ErrorType()
         try:
             node_type = self.context.get_type(node.type)
         except SemanticException as e:
             self.errors.append(CTypeError(node.line, node.column, e.text))
 
-        case_scope.define_var(node.id, node_type)
-        self.visit(node.expression, case_scope)
+        with scope.enter():
+            scope.define_var(node.id, node_type)
+            yield node.expression, scope
 
         node.static_type = node.expression.static_type
 
     @when(CaseOfNode)
     def visit(self, node: CaseOfNode, scope: Scope):  # noqa:F811
-        self.visit(node.expression, scope)
+        yield node.expression, scope
 
         node_type = None
         cases_types = set()
         for case in node.cases:
-            self.visit(case, scope)
+            yield case, scope
             try:
                 case_type = self.context.get_type(case.type)
                 if case_type in cases_types:
@@ -291,7 +294,7 @@ class COOL_TYPE_CHECKER(object):
         except SemanticException as e:
             self.errors.append(SemanticError(node.line, node.column, e.text))
 
-        self.visit(node.expression, scope)
+        yield node.expression, scope
         if not node.expression.static_type.is_subtype(var_type):
             self.errors.append(
                 CTypeError(
@@ -330,7 +333,7 @@ class COOL_TYPE_CHECKER(object):
                 for pname, ptype, expr in zip(
                     method.param_names, method.param_types, node.args
                 ):
-                    self.visit(expr, scope)
+                    yield expr, scope
                     expected_type = ptype
                     if not expr.static_type.is_subtype(expected_type):
                         self.errors.append(
@@ -349,7 +352,7 @@ class COOL_TYPE_CHECKER(object):
     def visit(self, node: FunctionCallNode, scope: Scope):  # noqa:F811
         obj_type = None
 
-        self.visit(node.obj, scope)
+        yield node.obj, scope
         if node.type:
             cast_type = ErrorType()
             try:
@@ -393,7 +396,7 @@ class COOL_TYPE_CHECKER(object):
                 for pname, ptype, expr in zip(
                     method.param_names, method.param_types, node.args
                 ):
-                    self.visit(expr, scope)
+                    yield expr, scope
                     expected_type = ptype
                     if not expr.static_type.is_subtype(expected_type):
                         self.errors.append(
@@ -419,12 +422,12 @@ class COOL_TYPE_CHECKER(object):
 
     @when(IsVoidNode)
     def visit(self, node: IsVoidNode, scope: Scope):  # noqa:F811
-        self.visit(node.expression, scope)
+        yield node.expression, scope
         node.static_type = self.type_bool
 
     @when(NotNode)
     def visit(self, node: NotNode, scope: Scope):  # noqa:F811
-        self.visit(node.expression, scope)
+        yield node.expression, scope
         if not node.expression.static_type == self.type_bool:
             self.errors.append(
                 CTypeError(
@@ -438,7 +441,7 @@ class COOL_TYPE_CHECKER(object):
 
     @when(ComplementNode)
     def visit(self, node: ComplementNode, scope: Scope):  # noqa:F811
-        self.visit(node.expression, scope)
+        yield node.expression, scope
         if not node.expression.static_type == self.type_int:
             self.errors.append(
                 CTypeError(
@@ -452,8 +455,8 @@ class COOL_TYPE_CHECKER(object):
 
     @when(ArithmeticNode)
     def visit(self, node: ArithmeticNode, scope: Scope):  # noqa:F811
-        self.visit(node.left, scope)
-        self.visit(node.right, scope)
+        yield node.left, scope
+        yield node.right, scope
         if not (
             node.left.static_type == self.type_int
             and node.right.static_type == self.type_int
@@ -471,8 +474,8 @@ class COOL_TYPE_CHECKER(object):
 
     @when(EqualNode)
     def visit(self, node: EqualNode, scope: Scope):  # noqa:F811
-        self.visit(node.left, scope)
-        self.visit(node.right, scope)
+        yield node.left, scope
+        yield node.right, scope
         if self.is_basic(node.left.static_type) or self.is_basic(
             node.right.static_type
         ):
@@ -490,8 +493,8 @@ class COOL_TYPE_CHECKER(object):
 
     @when(LessEqualNode)
     def visit(self, node: LessEqualNode, scope: Scope):  # noqa:F811
-        self.visit(node.left, scope)
-        self.visit(node.right, scope)
+        yield node.left, scope
+        yield node.right, scope
         if not (
             node.left.static_type == self.type_int
             and node.right.static_type == self.type_int
@@ -509,8 +512,8 @@ class COOL_TYPE_CHECKER(object):
 
     @when(LessNode)
     def visit(self, node: LessNode, scope: Scope):  # noqa:F811
-        self.visit(node.left, scope)
-        self.visit(node.right, scope)
+        yield node.left, scope
+        yield node.right, scope
         if not (
             node.left.static_type == self.type_int
             and node.right.static_type == self.type_int
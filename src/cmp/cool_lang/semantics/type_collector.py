@@ -5,41 +5,65 @@ from .semantic_utils import Context, SemanticException
 
 
 class COOL_TYPE_COLLECTOR(object):
-    def __init__(self, errors=[]):
+    def __init__(self, errors=None, context=None):
         self.context = None
-        self.errors = errors
+        self.basic_context = context
+        self.errors = [] if errors is None else errors
         self._mapper = dict()
         self._graph = dict()
         self._to = []
+        self._roots = dict()
+        self._cyclic = set()
 
     def _order(self, actual):
+        """
+        Append `actual` to the order after the classes it depends on, with
+        an explicit stack so a deep hierarchy does not exhaust the Python
+        stack.
+        """
         actual._visited = True
-        for son in self._graph[actual.id]:
-            son_node = self._mapper[son]
-            if son_node._visited:
-                continue
-            self._order(son_node)
-        self._to.append(actual)
+        pending = [(actual, iter(self._graph[actual.id]))]
+        while pending:
+            node, sons = pending[-1]
+            for son in sons:
+                son_node = self._mapper[son]
+                if not son_node._visited:
+                    son_node._visited = True
+                    pending.append((son_node, iter(self._graph[son])))
+                    break
+            else:
+                pending.pop()
+                self._to.append(node)
 
     def check_cyclic(self, obj, parents):
-        stack = [obj.id]
-        while True:
-            actual = stack[-1]
-            parent = parents.get(actual, None)
-            if parent is None:
-                break
-            else:
-                if parent in stack:
-                    self.errors.append(
-                        SemanticError(
-                            obj.line,
-                            obj.column,
-                            f"Cyclic inheritance in the hierarchy of {obj.id}.",
-                        )
-                    )
-                    break
-                else:
-                    stack.append(parent)
+        """
+        Report `obj` if its chain of parents, among the classes in
+        `parents`, ends in a cycle. The classes must be added to `parents`
+        and checked one at a time: every chain is kept in a union-find
+        forest whose roots are the last class of the chain, marked when the
+        chain is cyclic, so checking all the classes takes linear time.
+        """
+        roots = self._roots
+        parent = parents.get(obj.id, None)
+        if parent is None:
+            return
+        # Find the last class of the chain of the parent, halving the path
+        root = parent
+        while roots.get(root, root) != root:
+            roots[root] = roots.get(roots[root], roots[root])
+            root = roots[root]
+        if root == obj.id:
+            self._cyclic.add(root)
+        else:
+            roots[obj.id] = root
+        if root in self._cyclic:
+            self.errors.append(
+                SemanticError(
+                    obj.line,
+                    obj.column,
+                    f"Cyclic inheritance in the hierarchy of {obj.id}.",
+                )
+            )
 
     def define_basic_types(self):
         self.context.create_type("Object")
@@ -54,10 +78,13 @@ class COOL_TYPE_COLLECTOR(object):
 
     @when(ProgramNode)
     def visit(self, node: ProgramNode):  # noqa:F811
-        self.context = Context()
-        self.define_basic_types()
+        if self.basic_context is None:
+            self.context = Context()
+            self.define_basic_types()
+        else:
+            self.context = self.basic_context.clone()
         for class_def in node.classes:
-            class_def._visited = False  # type:ignore
+            class_def._visited = False
             self._graph[class_def.id] = []
             self.visit(class_def)
 
@@ -70,7 +97,7 @@ class COOL_TYPE_COLLECTOR(object):
                     self._graph[class_def.id].append(class_def.parent)
 
             for class_def in node.classes:
-                if class_def._visited:  # type:ignore
+                if class_def._visited:
                     continue
                 else:
                     self._order(class_def)
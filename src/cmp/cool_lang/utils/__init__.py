@@ -1,3 +1,4 @@
 from .attribute_dict import AttributeDict
 from .find_column import find_column
-from .visitor import on, when
+from .line_index import LineIndex
+from .visitor import method_table, on, trampoline, when
@@ -0,0 +1,32 @@
+from bisect import bisect_right
+
+
+class LineIndex:
+    '''
+    Offsets where every line of a source starts, built the first time a
+    position is resolved. `column` gives the same result as `find_column`
+    with a binary search instead of a scan back to the start of the line.
+    '''
+
+    def __init__(self, code):
+        self.code = code
+        self._starts = None
+
+    @property
+    def starts(self):
+        if self._starts is None:
+            starts = [0]
+            code = self.code
+            index = code.find('\n')
+            while index != -1:
+                starts.append(index + 1)
+                index = code.find('\n', index + 1)
+            self._starts = starts
+        return self._starts
+
+    def line(self, lexpos):
+        return bisect_right(self.starts, lexpos)
+
+    def column(self, lexpos):
+        starts = self.starts
+        return lexpos - starts[bisect_right(starts, lexpos) - 1] + 1
@@ -21,8 +21,9 @@
 # THE SOFTWARE.
 
 import inspect
+from types import GeneratorType
 
-__all__ = ['on', 'when']
+__all__ = ['on', 'when', 'method_table', 'trampoline']
 
 def on(param_name):
   def f(fn):
@@ -46,6 +47,44 @@ def when(param_type):
   return f
 
 
+def method_table(cls):
+  '''
+  Class decorator, replaces every dispatcher of `cls` with a function
+  generated by `Dispatcher.generate`.
+  '''
+  for name, value in list(vars(cls).items()):
+    dispatcher = getattr(value, 'dispatcher', value)
+    if isinstance(dispatcher, Dispatcher):
+      setattr(cls, name, dispatcher.generate(name))
+  return cls
+
+
+def trampoline(visit, *args):
+  '''
+  The result of `visit(*args)`. The visits may be generators that yield
+  the arguments of the visits they need, `value = yield child, scope`:
+  they are driven with an explicit stack of the visits in progress, so
+  the depth of the tree does not grow the Python stack.
+  '''
+  result = visit(*args)
+  if type(result) is not GeneratorType:
+    return result
+  pending = [result]
+  result = None
+  while pending:
+    try:
+      request = pending[-1].send(result)
+    except StopIteration as stop:
+      pending.pop()
+      result = stop.value
+      continue
+    result = visit(*request)
+    if type(result) is GeneratorType:
+      pending.append(result)
+      result = None
+  return result
+
+
 class Dispatcher(object):
   def __init__(self, param_name, fn):
     frame = inspect.currentframe().f_back.f_back
@@ -53,23 +92,61 @@ class Dispatcher(object):
     self.param_index = self.__argspec(fn).args.index(param_name)
     self.param_name = param_name
     self.targets = {}
+    self.cache = {}
 
   def __call__(self, *args, **kw):
     typ = args[self.param_index].__class__
-    d = self.targets.get(typ)
-    if d is not None:
-      return d(*args, **kw)
-    else:
+    try:
+      target = self.cache[typ]
+    except KeyError:
+      target = self.resolve(typ)
+    return target(*args, **kw)
+
+  def resolve(self, typ):
+    '''
+    The function that visits the instances of `typ`: its own target or,
+    when it has none, the targets of every base class registered (the
+    visit gives the list of their results unless there is exactly one).
+    '''
+    target = self.targets.get(typ)
+    if target is None:
       issub = issubclass
       t = self.targets
-      ks = t.keys()
-      ans = [t[k](*args, **kw) for k in ks if issub(typ, k)]
-      if len(ans) == 1:
-        return ans.pop()
-      return ans
+      matches = [t[k] for k in t.keys() if issub(typ, k)]
+      if len(matches) == 1:
+        target = matches[0]
+      else:
+        def visit_all(*args, **kw):
+          return [match(*args, **kw) for match in matches]
+        target = visit_all
+    self.cache[typ] = target
+    return target
 
   def add_target(self, typ, target):
     self.targets[typ] = target
+    self.cache.clear()
+
+  def generate(self, name):
+    '''
+    A plain function that looks the target up in the method table of
+    the dispatcher and calls it, without the dispatcher frames.
+    '''
+    params = ', '.join(f'arg{index}' for index in range(self.param_index + 1))
+    node = f'arg{self.param_index}'
+    namespace = {}
+    exec(
+      f"def {name}({params}, *args, **kw):\n"
+      f"    try:\n"
+      f"        target = cache[{node}.__class__]\n"
+      f"    except KeyError:\n"
+      f"        target = resolve({node}.__class__)\n"
+      f"    return target({params}, *args, **kw)\n",
+      {'cache': self.cache, 'resolve': self.resolve},
+      namespace,
+    )
+    function = namespace[name]
+    function.dispatcher = self
+    return function
 
   @staticmethod
   def __argspec(fn):
@@ -0,0 +1,433 @@
+"""
+Class-granular incremental builds.
+
+The code of every class is made of two pieces: its `init_<class>` function,
+which inlines the attribute initializers of its ancestors, and the functions
+of its methods. Every piece is keyed by a hash of the interface of the
+program (the name, parent, attributes and method signatures of every class,
+in order, as found in its `Type`) and of the AST of the features it is made
+of, without their positions:
+
+    init_<class>:    the attributes of the class and of its ancestors
+    methods_<class>: the methods of the class
+
+A build only checks the classes of the pieces whose key changed, generates
+their CIL and MIPS, and copies the MIPS of every other piece from the
+previous build, so an edit inside a method body costs the generation of a
+single piece. Changing a signature changes every key, as the offsets and the
+type numbers in the code of every class may move.
+
+The output is the same as the one of a full build. The counters numbering
+the labels and the data of the program run through the cached pieces as if
+they were generated again: the data of a cached piece is registered again,
+and its labels and data are renamed when the pieces before it moved them.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Dict, List, Optional, Set, TextIO, Tuple
+
+from .cache import compiler_fingerprint
+from .cil import CIL_TO_MIPS, COOL_TO_CIL_VISITOR
+from .cil.utils.mips_syntax import Mips
+from .compiler import CompileResult
+from .cool_lang.ast import (
+    AttrDeclarationNode,
+    ClassDeclarationNode,
+    FuncDeclarationNode,
+    Node,
+    ProgramNode,
+)
+from .cool_lang.ast.arena import LIST, NODE, arena_fields
+from .cool_lang.semantics import COOL_CHECKER
+from .profiler import NULL_PROFILER
+
+# The names a piece is relocated by, split apart from the rest of its code
+RELOCATABLE = re.compile(r"\b(mip_label_\d+|data_\d+|label_\w+)\b")
+
+
+class CodePiece:
+    """
+    The MIPS code of some functions generated together, with what it takes
+    to place it in another build: the data it registers, the labels it
+    numbers and the counters it started from.
+    """
+
+    __slots__ = (
+        "key",
+        "data",
+        "labels",
+        "cil_base",
+        "mips_base",
+        "mips_labels",
+        "parts",
+        "functions",
+        "cil_start",
+    )
+
+    def __init__(self, key: str):
+        self.key = key
+        self.data: List[str] = []
+        # Name and function of every CIL label, numbered from `cil_base + 1`
+        self.labels: List[Tuple[str, str]] = []
+        self.cil_base = 0
+        self.mips_base = -1
+        self.mips_labels = 0
+        # The code of the piece, every odd part is a relocatable name
+        self.parts: List[str] = []
+        # The CIL functions of a piece generated by this build, and the
+        # CIL label count it starts at
+        self.functions = None
+        self.cil_start = 0
+
+    def relocate(self, mips_base: int, data_names: Dict[str, str]):
+        cil_shift = self.cil_start - self.cil_base
+        mips_shift = mips_base - self.mips_base
+        if cil_shift or mips_shift or data_names:
+            names = {}
+            if cil_shift:
+                label_name = COOL_TO_CIL_VISITOR.label_name
+                for count, (name, function) in enumerate(
+                    self.labels, self.cil_base + 1
+                ):
+                    names[label_name(name, count, function)] = label_name(
+                        name, count + cil_shift, function
+                    )
+            if mips_shift:
+                for count in range(
+                    self.mips_base + 1, self.mips_base + self.mips_labels + 1
+                ):
+                    names[f"mip_label_{count}"] = f"mip_label_{count + mips_shift}"
+            names = {**data_names, **names}
+            self.parts[1::2] = [names.get(name, name) for name in self.parts[1::2]]
+        self.cil_base = self.cil_start
+        self.mips_base = mips_base
+
+    def to_json(self):
+        return {
+            "key": self.key,
+            "data": self.data,
+            "labels": self.labels,
+            "cil_base": self.cil_base,
+            "mips_base": self.mips_base,
+            "mips_labels": self.mips_labels,
+            "parts": self.parts,
+        }
+
+    @classmethod
+    def from_json(cls, entry):
+        piece = cls(entry["key"])
+        piece.data = entry["data"]
+        piece.labels = [tuple(label) for label in entry["labels"]]
+        piece.cil_base = entry["cil_base"]
+        piece.mips_base = entry["mips_base"]
+        piece.mips_labels = entry["mips_labels"]
+        piece.parts = entry["parts"]
+        return piece
+
+
+class IncrementalState:
+    """
+    What a build leaves for the next one: the pieces of every class and the
+    data of the program, whose names the code of the pieces refers to.
+    A state is saved as a JSON file, tied to the compiler sources.
+    """
+
+    def __init__(self):
+        self.data: List[str] = []
+        self.pieces: Dict[str, CodePiece] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalState":
+        """
+        The state saved at `path`, or an empty one when it is missing,
+        broken or saved by another compiler.
+        """
+        state = cls()
+        try:
+            with open(path, "r") as fd:
+                entry = json.load(fd)
+            if entry["compiler"] == compiler_fingerprint():
+                state.data = entry["data"]
+                state.pieces = {
+                    name: CodePiece.from_json(piece)
+                    for name, piece in entry["pieces"].items()
+                }
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return state
+
+    def save(self, path: str):
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        entry = {
+            "compiler": compiler_fingerprint(),
+            "data": self.data,
+            "pieces": {name: piece.to_json() for name, piece in self.pieces.items()},
+        }
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_fd:
+                json.dump(entry, tmp_fd)
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+
+def state_path(folder: str, input_file: str) -> str:
+    """
+    Where the state of the builds of `input_file` is kept in `folder`.
+    """
+    name = hashlib.sha256(os.path.abspath(input_file).encode()).hexdigest()
+    return os.path.join(folder, name + ".json")
+
+
+def digest_nodes(digest, nodes: List[Node]):
+    """
+    Feed `digest` with the kind and the fields of every node under `nodes`,
+    but not with their positions.
+    """
+    pending = list(reversed(nodes))
+    while pending:
+        node = pending.pop()
+        if node is None:
+            digest.update(b"\x00")
+            continue
+        node_type = type(node)
+        digest.update(node_type.__name__.encode() + b"(")
+        children = []
+        for name, how in arena_fields(node_type):
+            value = getattr(node, name)
+            if how == NODE:
+                children.append(value)
+            elif how == LIST:
+                digest.update(b"[%d]" % len(value))
+                children.extend(value)
+            else:
+                digest.update(repr(value).encode() + b",")
+        pending.extend(reversed(children))
+
+
+def piece_keys(context, program: ProgramNode) -> Dict[str, str]:
+    """
+    The key of every piece of the classes of a checked `program`.
+    """
+    interface = hashlib.sha256()
+    for node in program.classes:
+        interface.update(str(context.get_type(node.id)).encode())
+    interface = interface.digest()
+
+    nodes = {node.id: node for node in program.classes}
+    attributes = {}
+    keys = {}
+    for node in program.classes:
+        attrs = hashlib.sha256(interface)
+        digest_nodes(
+            attrs, [f for f in node.features if type(f) is AttrDeclarationNode]
+        )
+        attributes[node.id] = attrs.digest()
+        methods = hashlib.sha256(interface)
+        digest_nodes(
+            methods, [f for f in node.features if type(f) is FuncDeclarationNode]
+        )
+        keys[f"methods_{node.id}"] = methods.hexdigest()
+
+    for node in program.classes:
+        init = hashlib.sha256(interface)
+        ancestor = node
+        while ancestor is not None:
+            init.update(attributes[ancestor.id])
+            ancestor = nodes.get(ancestor.parent)
+        keys[f"init_{node.id}"] = init.hexdigest()
+    return keys
+
+
+def classes_to_check(
+    program: ProgramNode, keys: Dict[str, str], state: IncrementalState
+) -> List[ClassDeclarationNode]:
+    """
+    The classes whose code is generated again, they are checked again to
+    annotate their nodes with static types. The init function of a class
+    inlines the attributes of its ancestors, those are checked too.
+    """
+    nodes = {node.id: node for node in program.classes}
+    selected: Set[str] = set()
+    inlined: Set[str] = set()
+    for node in program.classes:
+        cached = state.pieces.get(f"methods_{node.id}")
+        if cached is None or cached.key != keys[f"methods_{node.id}"]:
+            selected.add(node.id)
+        cached = state.pieces.get(f"init_{node.id}")
+        if cached is None or cached.key != keys[f"init_{node.id}"]:
+            ancestor = node
+            while ancestor is not None and ancestor.id not in inlined:
+                inlined.add(ancestor.id)
+                ancestor = nodes.get(ancestor.parent)
+    selected |= inlined
+    return [node for node in program.classes if node.id in selected]
+
+
+class INCREMENTAL_COOL_TO_CIL(COOL_TO_CIL_VISITOR):
+    """
+    Places a `CodePiece` in `dotcode` for the init function and for the
+    methods of every class: the cached one when its key did not change,
+    a new one holding the generated functions otherwise.
+    """
+
+    def __init__(self, context, keys: Dict[str, str], cached: Dict[str, CodePiece]):
+        self.keys = keys
+        self.cached = cached
+        self.pieces: Dict[str, CodePiece] = {}
+        self.piece: Optional[CodePiece] = None
+        self.piece_data: Dict[str, None] = {}
+        super().__init__(context)
+
+    def build_init_type_func(self, typex):
+        self.build_piece(f"init_{typex}", super().build_init_type_func, typex)
+
+    def build_methods(self, node: ClassDeclarationNode, scope):
+        self.build_piece(f"methods_{node.id}", super().build_methods, node, scope)
+
+    def build_piece(self, name, build, *args):
+        key = self.keys.get(name)
+        if key is None:
+            # The code of the basic types is always generated
+            build(*args)
+            return
+
+        piece = self.cached.get(name)
+        if piece is not None and piece.key == key:
+            for value in piece.data:
+                self.register_data(value)
+            piece.cil_start = self.label_count
+            self.label_count += len(piece.labels)
+        else:
+            piece = CodePiece(key)
+            piece.cil_base = piece.cil_start = self.label_count
+            start = len(self.dotcode)
+            self.piece = piece
+            try:
+                build(*args)
+            finally:
+                self.piece = None
+            piece.functions = self.dotcode[start:]
+            del self.dotcode[start:]
+            piece.data = list(self.piece_data)
+            self.piece_data.clear()
+        self.pieces[name] = piece
+        self.dotcode.append(piece)
+
+    def to_label_name(self, label_name):
+        label = super().to_label_name(label_name)
+        if self.piece is not None:
+            self.piece.labels.append((label_name, self.current_function.name[9:]))
+        return label
+
+    def register_data(self, value):
+        if self.piece is not None:
+            self.piece_data[value] = None
+        return super().register_data(value)
+
+
+class INCREMENTAL_CIL_TO_MIPS(CIL_TO_MIPS):
+    """
+    Emits the functions of the new pieces, keeping their code, and copies
+    the code of the cached ones renamed with `data_names`, the new names of
+    the data of the previous build.
+    """
+
+    def __init__(self, context, data_names: Dict[str, str]):
+        super().__init__(context)
+        self.data_names = data_names
+
+    def emit_code(self, dotcode):
+        for function in dotcode:
+            if isinstance(function, CodePiece):
+                self.emit_piece(function)
+            else:
+                self.visit(function)
+
+    def emit_piece(self, piece: CodePiece):
+        if piece.functions is None:
+            piece.relocate(self.label_count, self.data_names)
+            self.label_count += piece.mips_labels
+        else:
+            piece.mips_base = self.label_count
+            mips = self.mips
+            self.mips = Mips(zip_mode=mips.zip_mode)
+            try:
+                for function in piece.functions:
+                    self.visit(function)
+                piece.parts = RELOCATABLE.split(self.mips.text())
+            finally:
+                self.mips.close()
+                self.mips = mips
+            piece.mips_labels = self.label_count - piece.mips_base
+            piece.functions = None
+        self.mips.write_text("".join(piece.parts))
+
+
+def compile_incremental(
+    checker: COOL_CHECKER,
+    program: ProgramNode,
+    state: IncrementalState,
+    profiler=NULL_PROFILER,
+    output: Optional[TextIO] = None,
+) -> CompileResult:
+    """
+    Check and generate the code of `program` reusing the pieces of `state`,
+    which is updated when the program compiles.
+    """
+    result = CompileResult()
+
+    if not checker.build_context(program, profiler):
+        result.errors = list(checker.errors)
+        return result
+    with profiler.stage("piece_keys"):
+        keys = piece_keys(checker.context, program)
+    if checker.errors:
+        # The errors found building the types are reported with the ones
+        # of every class, as a full build does
+        classes = program.classes
+    else:
+        classes = classes_to_check(program, keys, state)
+    profiler.count("checked_classes", len(classes))
+    checker.check_types(classes, profiler)
+    if checker.errors:
+        result.errors = list(checker.errors)
+        return result
+
+    with profiler.stage("INCREMENTAL_COOL_TO_CIL"):
+        visitor = INCREMENTAL_COOL_TO_CIL(checker.context, keys, state.pieces)
+        cil_ast = visitor.visit(program)
+    generated = [piece for piece in visitor.pieces.values() if piece.functions]
+    profiler.count("generated_pieces", len(generated))
+    profiler.count("reused_pieces", len(visitor.pieces) - len(generated))
+
+    names = {data.value: data.name for data in cil_ast.dotdata}
+    data_names = {}
+    for index, value in enumerate(state.data):
+        name = f"data_{index}"
+        if names.get(value, name) != name:
+            data_names[name] = names[value]
+
+    ctm = INCREMENTAL_CIL_TO_MIPS(checker.context, data_names)
+    try:
+        with profiler.stage("INCREMENTAL_CIL_TO_MIPS"):
+            ctm.visit(cil_ast)
+        if output is None:
+            with profiler.stage("Mips.compile"):
+                result.mips = ctm.mips.compile()
+        else:
+            with profiler.stage("Mips.write_to"):
+                ctm.mips.write_to(output)
+        profiler.count("mips_lines", ctm.mips.lines)
+    finally:
+        ctm.mips.close()
+
+    state.data = [data.value for data in cil_ast.dotdata]
+    state.pieces = visitor.pieces
+    return result
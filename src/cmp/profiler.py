@@ -0,0 +1,100 @@
+"""
+Per stage wall time, counters and peak memory of a compilation.
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+from .cool_lang.ast import Node, node_fields
+
+
+class Profiler:
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.stages: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        tracing = self.memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.memory:
+            _reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = None
+            if self.memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                if tracing:
+                    tracemalloc.stop()
+            self.stages.append({"stage": name, "time": elapsed * 1000, "peak": peak})
+
+    def count(self, name: str, value: int):
+        self.counters[name] = value
+
+    def to_dict(self):
+        return {
+            "stages": self.stages,
+            "total": sum(stage["time"] for stage in self.stages),
+            "counters": self.counters,
+        }
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    def report(self):
+        lines = [f"{'stage':<32}{'time (ms)':>12}{'peak (KiB)':>14}"]
+        for stage in self.stages:
+            peak = "-" if stage["peak"] is None else f"{stage['peak'] / 1024:.1f}"
+            lines.append(f"{stage['stage']:<32}{stage['time']:>12.3f}{peak:>14}")
+        lines.append(f"{'total':<32}{self.to_dict()['total']:>12.3f}")
+        lines.append("")
+        for name, value in self.counters.items():
+            lines.append(f"{name:<32}{value:>12}")
+        return "\n".join(lines)
+
+
+class NullProfiler(Profiler):
+    """
+    Profiler used when no report was requested, it records nothing.
+    """
+
+    @contextmanager
+    def stage(self, name: str):
+        yield
+
+    def count(self, name: str, value: int):
+        pass
+
+
+NULL_PROFILER = NullProfiler(memory=False)
+
+
+def _reset_peak():
+    reset_peak = getattr(tracemalloc, "reset_peak", None)  # python >= 3.9
+    if reset_peak is not None:
+        reset_peak()
+    else:
+        tracemalloc.stop()
+        tracemalloc.start()
+
+
+def count_nodes(node: Node):
+    count = 0
+    pending = [node]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, Node):
+            count += 1
+            pending.extend(
+                getattr(value, name) for name in node_fields(type(value))
+            )
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return count
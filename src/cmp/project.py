@@ -0,0 +1,145 @@
+"""
+Programs split across many COOL files.
+
+Every file is lexed and parsed in a worker process, which sends its
+classes back serialized with `dump_ast`. The classes of all of them are
+merged into a single program before the semantic checks, in the
+order of the files. The lines of each file are numbered after the ones of
+the files before it, and `SourceMap` turns those numbers back into a file
+and a line of that file when an error is reported.
+
+A manifest lists the files of a program, one per line, relative to the
+manifest folder. Blank lines and lines starting with `#` are skipped.
+"""
+import multiprocessing
+import os
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+from .compiler import LEXERS, PARSERS
+from .cool_lang.ast import Node, ProgramNode, dump_ast, load_ast, node_fields
+from .cool_lang.errors import Error, LocalizedError
+
+_frontend = None
+
+
+def read_manifest(path: str) -> List[str]:
+    folder = os.path.dirname(path)
+    with open(path, "r") as fd:
+        lines = [line.strip() for line in fd]
+    return [
+        os.path.join(folder, line)
+        for line in lines
+        if line and not line.startswith("#")
+    ]
+
+
+class SourceMap:
+    def __init__(self):
+        self.files: List[str] = []
+        # First line of every file in the merged program
+        self.starts: List[int] = []
+        self.lines = 0
+
+    def add(self, file: str, code: str) -> int:
+        """
+        Register the next file and return the number of lines before it.
+        """
+        offset = self.lines
+        self.files.append(file)
+        self.starts.append(offset + 1)
+        self.lines += code.count("\n") + 1
+        return offset
+
+    def locate(self, line: int) -> Tuple[Optional[str], int]:
+        index = bisect_right(self.starts, line) - 1
+        if index < 0:
+            return None, line
+        return self.files[index], line - self.starts[index] + 1
+
+    def relocate(self, error: Error):
+        if isinstance(error, LocalizedError) and error.file is None:
+            file, error.row = self.locate(error.row)
+            error.file = file
+
+
+def shift_lines(nodes: List[Node], offset: int):
+    pending = list(nodes)
+    while pending:
+        value = pending.pop()
+        if isinstance(value, Node):
+            value.line += offset
+            pending.extend(getattr(value, name) for name in node_fields(type(value)))
+        elif isinstance(value, list):
+            pending.extend(value)
+
+
+def _init_worker(lexer: str = "ply", parser: str = "ply"):
+    global _frontend
+    cool_lexer = LEXERS[lexer]()
+    cool_lexer.build()
+    cool_parser = PARSERS[parser]()
+    cool_parser.build()
+    _frontend = cool_lexer, cool_parser
+
+
+def parse_job(job):
+    """
+    Serialized program of the classes of a single file, with its lines
+    numbered from `offset` on, or its errors.
+    """
+    file, code, offset = job
+    if _frontend is None:
+        _init_worker()
+    lexer, parser = _frontend
+
+    lexer.input(code)
+    parsed = parser.parse(lexer)
+    if not parsed:
+        lexer.drain()
+    # Lexical errors are reported before the syntactic ones, as for a
+    # single file
+    errors = list(lexer.errors) or list(parser.errors)
+    if errors:
+        for error in errors:
+            error.file = file
+        return None, errors
+
+    shift_lines(parser.result.classes, offset)
+    # Smaller than pickled, and deep ASTs are sent without recursion
+    return dump_ast(parser.result), []
+
+
+def parse_files(
+    files: List[str],
+    jobs: Optional[int] = None,
+    lexer: str = "ply",
+    parser: str = "ply",
+) -> Tuple[Optional[ProgramNode], List[Error], SourceMap]:
+    """
+    Parse `files` with `jobs` worker processes (one per core by default)
+    into a single program. The errors of every file are returned, in the
+    order of the files.
+    """
+    sources = SourceMap()
+    batch = []
+    for file in files:
+        with open(file, "r") as fd:
+            code = fd.read()
+        batch.append((file, code, sources.add(file, code)))
+
+    jobs = min(jobs or os.cpu_count() or 1, len(batch))
+    if jobs <= 1:
+        _init_worker(lexer, parser)
+        parsed = list(map(parse_job, batch))
+    else:
+        with multiprocessing.Pool(
+            jobs, initializer=_init_worker, initargs=(lexer, parser)
+        ) as pool:
+            parsed = pool.map(parse_job, batch)
+
+    errors = [error for _, file_errors in parsed for error in file_errors]
+    if errors:
+        return None, errors, sources
+    classes = [cls for data, _ in parsed for cls in load_ast(data).classes]
+    return ProgramNode(classes, classes[0].line, classes[0].column), [], sources
@@ -0,0 +1,98 @@
+"""
+JSON lines compilation server.
+
+Every request is a single line holding a JSON object:
+
+    {"id": 1, "source": "class Main { ... };", "cil": false}
+    {"id": 2, "input": "path/to/file.cl", "output": "path/to/file.mips"}
+
+and is answered with a single line:
+
+    {"id": 1, "ok": true, "errors": [], "mips": "...", "cil": null, "time": 1.2}
+
+When `output` is given the MIPS code (and the CIL code if requested) is
+written next to it instead of being sent back.
+"""
+import io
+import json
+import os
+import socketserver
+import stat
+import time
+
+from .compiler import COOL_COMPILER
+from .cool_lang.errors import CompilationError
+
+
+def handle_request(compiler: COOL_COMPILER, request: dict):
+    start = time.perf_counter()
+    response = {"id": request.get("id"), "ok": False, "errors": []}
+    if "source" in request:
+        code = request["source"]
+    else:
+        with open(request["input"], "r") as fd:
+            code = fd.read()
+
+    result = compiler.compile(code, cil=bool(request.get("cil", False)))
+    response["ok"] = result.ok
+    response["errors"] = [str(error) for error in result.errors]
+
+    output = request.get("output")
+    if output is not None and result.ok:
+        with open(output, "w") as fd:
+            fd.write(result.mips)
+        if result.cil is not None:
+            with open(os.path.splitext(output)[0] + ".cil", "w") as fd:
+                fd.write(result.cil)
+        response["output"] = output
+    else:
+        response["mips"] = result.mips
+        response["cil"] = result.cil
+
+    response["time"] = (time.perf_counter() - start) * 1000
+    return response
+
+
+def serve_stream(compiler: COOL_COMPILER, rfile, wfile):
+    for line in rfile:
+        if not line.strip():
+            continue
+        request = None
+        try:
+            request = json.loads(line)
+            response = handle_request(compiler, request)
+        except Exception as e:  # keep serving after a bad request
+            response = {
+                "id": request.get("id") if isinstance(request, dict) else None,
+                "ok": False,
+                "errors": [str(CompilationError(0, 0, f"{type(e).__name__}: {e}"))],
+            }
+        wfile.write(json.dumps(response) + "\n")
+        wfile.flush()
+
+
+def serve_socket(compiler: COOL_COMPILER, path: str):
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            serve_stream(
+                compiler,
+                io.TextIOWrapper(self.rfile, encoding="utf-8"),
+                io.TextIOWrapper(self.wfile, encoding="utf-8", write_through=True),
+            )
+
+    # Only the socket left behind by a server that died is replaced
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{path} already exists and is not a socket")
+        os.remove(path)
+    # Requests are handled one at a time, every one of them reuses the
+    # same warm compiler
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(path)
@@ -1,64 +1,258 @@
+import json
 import re
+import sys
+from enum import Enum
+from typing import List, Optional
 
 import typer
 
-from cmp.cil import CIL_FORMATTER, CIL_TO_MIPS, COOL_TO_CIL_VISITOR
-from cmp.cool_lang.lexer import COOL_LEXER
-from cmp.cool_lang.parser import COOL_PARSER
-from cmp.cool_lang.semantics import COOL_CHECKER
 
 app = typer.Typer()
 
+# Options of the application itself, any other first argument than them and
+# the names of the commands is taken as the input file of `run`
+APP_OPTIONS = {"--help", "--install-completion", "--show-completion"}
+
+
+class ProfileFormat(str, Enum):
+    text = "text"
+    json = "json"
+
+
+class LexerEngine(str, Enum):
+    ply = "ply"
+    fast = "fast"
+
+
+class ParserEngine(str, Enum):
+    ply = "ply"
+    descent = "descent"
+
 
 @app.command()
 def run(
     input_file: typer.FileText = typer.Argument(..., help="Cool file to compile."),
-    output_file: typer.FileTextWrite = typer.Argument(..., help="Mips resultant file."),
+    output_file: Optional[typer.FileTextWrite] = typer.Argument(
+        None, help="Mips resultant file (not needed with --check)."
+    ),
+    source: List[str] = typer.Option(
+        None, "--source", "-s", help="Another cool file of the program."
+    ),
+    manifest: Optional[str] = typer.Option(
+        None, help="File listing more cool files of the program, one per line."
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Processes parsing the files of the program."
+    ),
+    check_jobs: int = typer.Option(
+        1, help="Processes checking the types of big programs, 0 for one per core."
+    ),
+    check: bool = typer.Option(
+        False, help="Only check the program, stop before code generation."
+    ),
     verbose: bool = typer.Option(False, help="Execute in verbose mode."),
     cil: bool = typer.Option(False, help="Compile to cil file."),
+    lexer: LexerEngine = typer.Option(LexerEngine.ply, help="Scanner engine."),
+    parser: ParserEngine = typer.Option(ParserEngine.ply, help="Parser engine."),
+    cache_dir: Optional[str] = typer.Option(
+        None, envvar="COOLC_CACHE_DIR", help="Reuse results cached in this folder."
+    ),
+    cache_size: Optional[int] = typer.Option(
+        None,
+        envvar="COOLC_CACHE_SIZE",
+        help="Cache size limit in bytes, 256 MiB by default.",
+    ),
+    incremental_dir: Optional[str] = typer.Option(
+        None,
+        envvar="COOLC_INCREMENTAL_DIR",
+        help="Keep the code of every class in this folder and only generate "
+        "again the classes changed since the last build.",
+    ),
+    profile: bool = typer.Option(
+        False, help="Report the time, counters and memory peak of every stage."
+    ),
+    profile_format: ProfileFormat = typer.Option(
+        ProfileFormat.text, help="Format of the profile report."
+    ),
+    profile_memory: bool = typer.Option(
+        True, help="Trace the memory peaks while profiling (slower)."
+    ),
 ):
+    """
+    Compile a Cool program, the command run when none is given.
+    """
+    if output_file is None and not check:
+        raise typer.BadParameter("missing the output file", param_hint="OUTPUT_FILE")
     code = input_file.read()
+    sources = list(source or ())
+    if manifest is not None:
+        from cmp.project import read_manifest
 
-    clexer = COOL_LEXER()
-    if not clexer.tokenize(code):
-        for error in clexer.errors:
-            print(error)
-        exit(1)
+        sources += read_manifest(manifest)
 
-    if not list(filter(lambda x: x.type != "COMMENT", clexer.result)):
-        print("(0, 0) - SyntacticError: ERROR at or near EOF")
-        exit(1)
+    # The verbose output and the profile are only produced by an actual
+    # compilation, and only single file programs are cached
+    cache = None
+    if cache_dir is not None and not (verbose or profile or check or sources):
+        from cmp.cache import DEFAULT_MAX_SIZE, CompilationCache
 
-    cparser = COOL_PARSER()
-    if not cparser.parse(clexer):
-        for error in cparser.errors:
-            print(error)
-        exit(1)
+        if cache_size is None:
+            cache_size = DEFAULT_MAX_SIZE
+        cache = CompilationCache(cache_dir, cache_size)
+
+    result = cache.get(code, cil) if cache is not None else None
+    if result is None:
+        from cmp.compiler import COOL_COMPILER
+        from cmp.profiler import NULL_PROFILER, Profiler
+
+        profiler = Profiler(memory=profile_memory) if profile else NULL_PROFILER
+        compiler = COOL_COMPILER(lexer.value, parser.value)
+        state = None
+        if incremental_dir is not None:
+            from cmp.incremental import IncrementalState, state_path
 
-    program = cparser.result
-    cchecker = COOL_CHECKER()
-    if not cchecker.check_semantics(program, verbose=verbose):
-        for error in cchecker.errors:
+            state_file = state_path(incremental_dir, input_file.name)
+            state = IncrementalState.load(state_file)
+        options = dict(
+            cil=cil,
+            verbose=verbose,
+            profiler=profiler,
+            # Without a cache the mips code is streamed straight to the output
+            output=output_file if cache is None else None,
+            check=check,
+            incremental=state,
+            check_jobs=check_jobs,
+        )
+        if sources:
+            files = [input_file.name] + sources
+            result = compiler.compile_files(files, jobs, **options)
+        else:
+            result = compiler.compile(code, **options)
+        if profile:
+            if profile_format == ProfileFormat.json:
+                print(profiler.to_json(), file=sys.stderr)
+            else:
+                print(profiler.report(), file=sys.stderr)
+        if cache is not None:
+            cache.put(code, result, cil)
+        if state is not None and result.ok:
+            state.save(state_file)
+
+    if not result.ok:
+        for error in result.errors:
             print(error)
         exit(1)
 
-    ctc = COOL_TO_CIL_VISITOR(cchecker.context)
-    cil_ast = ctc.visit(program)
+    if check:
+        exit(0)
 
     if cil:
         with open(
             re.findall(r"^(.+)\.(.*)$", output_file.name)[0][0] + ".cil", "w"
         ) as out_fd:
-            out_fd.write(CIL_FORMATTER().visit(cil_ast))
-
-    ctm = CIL_TO_MIPS(cchecker.context)
-    ctm.visit(cil_ast)
-    mips_code = ctm.mips.compile()
+            out_fd.write(result.cil)
 
-    output_file.write(mips_code)
+    if result.mips is not None:
+        output_file.write(result.mips)
 
     exit(0)
 
 
+@app.command()
+def serve(
+    socket: Optional[str] = typer.Option(
+        None, help="Listen on this unix socket instead of stdin/stdout."
+    ),
+    lexer: LexerEngine = typer.Option(LexerEngine.ply, help="Scanner engine."),
+    parser: ParserEngine = typer.Option(ParserEngine.ply, help="Parser engine."),
+):
+    """
+    Keep a warm compiler answering JSON lines compilation requests.
+    """
+    from cmp.compiler import COOL_COMPILER
+    from cmp.server import serve_socket, serve_stream
+
+    compiler = COOL_COMPILER(lexer.value, parser.value)
+    if socket is None:
+        serve_stream(compiler, sys.stdin, sys.stdout)
+    else:
+        try:
+            serve_socket(compiler, socket)
+        except FileExistsError as e:
+            raise typer.BadParameter(str(e), param_hint="--socket")
+
+
+@app.command()
+def batch(
+    paths: List[str] = typer.Argument(..., help="Cool files or directories."),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Worker processes, one per core by default."
+    ),
+    output_dir: Optional[str] = typer.Option(
+        None, help="Write the mips files here instead of next to each source."
+    ),
+    cil: bool = typer.Option(False, help="Compile to cil files too."),
+    json_lines: bool = typer.Option(False, "--json", help="Report as JSON lines."),
+    lexer: LexerEngine = typer.Option(LexerEngine.ply, help="Scanner engine."),
+    parser: ParserEngine = typer.Option(ParserEngine.ply, help="Parser engine."),
+):
+    """
+    Compile many files with a pool of warm compilers.
+    """
+    from cmp.batch import collect_files, compile_batch, output_paths
+
+    files = collect_files(paths)
+    try:
+        output_paths(files, output_dir)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="PATHS")
+
+    failed = 0
+    for response in compile_batch(
+        files, jobs, cil, output_dir, lexer.value, parser.value
+    ):
+        failed += not response["ok"]
+        if json_lines:
+            print(json.dumps(response), flush=True)
+            continue
+
+        status = "OK" if response["ok"] else "FAIL"
+        target = f" -> {response['output']}" if response["ok"] else ""
+        time = f" ({response['time']:.1f} ms)" if "time" in response else ""
+        print(f"{status} {response['id']}{target}{time}")
+        for error in response["errors"]:
+            print(f"    {error}")
+        sys.stdout.flush()
+
+    exit(1 if failed else 0)
+
+
+@app.command()
+def cache(
+    cache_dir: str = typer.Option(
+        ..., envvar="COOLC_CACHE_DIR", help="Folder of the compilation cache."
+    ),
+    clear: bool = typer.Option(False, help="Remove every cached result."),
+):
+    """
+    Show the hit/miss statistics of the compilation cache.
+    """
+    from cmp.cache import CompilationCache
+
+    compilation_cache = CompilationCache(cache_dir)
+    if clear:
+        compilation_cache.clear()
+    for name, value in compilation_cache.stats().items():
+        print(f"{name}: {value}")
+
+
+def main(args: Optional[List[str]] = None):
+    args = sys.argv[1:] if args is None else list(args)
+    commands = {command.callback.__name__ for command in app.registered_commands}
+    if args and args[0] not in commands and args[0] not in APP_OPTIONS:
+        args.insert(0, "run")
+    app(args=args)
+
+
 if __name__ == "__main__":
-    app()
+    main()
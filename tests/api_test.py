@@ -0,0 +1,70 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import cmp
+from cmp.cool_lang.semantics import (
+    COOL_TYPE_BUILDER,
+    COOL_TYPE_CHECKER,
+    COOL_TYPE_COLLECTOR,
+    build_basic_context,
+)
+from utils import first_error_only_line  # type: ignore
+
+tests_dir = __file__.rpartition("/")[0]
+semantic_tests = sorted(
+    tests_dir + "/semantic/" + file
+    for file in os.listdir(tests_dir + "/semantic/")
+    if file.endswith(".cl")
+)
+codegen_tests = sorted(
+    tests_dir + "/codegen/" + file
+    for file in os.listdir(tests_dir + "/codegen/")
+    if file.endswith(".cl")
+)
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_compile_file_in_threads():
+    files = semantic_tests + codegen_tests
+    sequential = [cmp.compile_file(file, emit_cil=True) for file in files]
+    with ThreadPoolExecutor(4) as pool:
+        threaded = list(pool.map(lambda file: cmp.compile_file(file), files))
+
+    for file, expected, result in zip(files, sequential, threaded):
+        assert [str(e) for e in result.errors] == [str(e) for e in expected.errors]
+        assert result.mips == expected.mips, file
+
+
+@pytest.mark.semantic
+@pytest.mark.error
+@pytest.mark.run(order=3)
+def test_compile_source_returns_errors():
+    for file in semantic_tests:
+        with open(file, "r") as fd:
+            result = cmp.compile_source(fd.read())
+        assert not result.ok and result.mips is None
+        with open(file[:-3] + "_error.txt", "r") as fd:
+            errors = fd.read().split("\n")
+        first_error_only_line([str(e) for e in result.errors], errors)
+
+
+@pytest.mark.codegen
+@pytest.mark.ok
+@pytest.mark.run(order=4)
+def test_compile_source_emits_cil():
+    result = cmp.compile_file(codegen_tests[0], emit_cil=True)
+    assert result.ok
+    assert result.cil_ast is not None and result.cil_ast.dotcode
+    assert result.cil and result.mips
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_phases_do_not_share_errors():
+    context = build_basic_context()
+    assert COOL_TYPE_COLLECTOR().errors is not COOL_TYPE_COLLECTOR().errors
+    assert COOL_TYPE_BUILDER(context).errors is not COOL_TYPE_BUILDER(context).errors
+    assert COOL_TYPE_CHECKER(context).errors is not COOL_TYPE_CHECKER(context).errors
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from cmp.cool_lang.ast import Node, NodeArena, node_fields
+from cmp.cool_lang.ast.arena import node_kinds
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_DESCENT_PARSER
+from cmp.profiler import count_nodes
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + folder + file
+    for folder in ("/codegen/", "/semantic/")
+    for file in os.listdir(tests_dir + folder)
+    if file.endswith(".cl")
+)
+
+
+def dump(node):
+    if isinstance(node, list):
+        return [dump(child) for child in node]
+    if isinstance(node, Node):
+        fields = node_fields(type(node))
+        return type(node).__name__, {name: dump(getattr(node, name)) for name in fields}
+    return node
+
+
+def parse(code):
+    lexer = COOL_LEXER()
+    lexer.input(code)
+    parser = COOL_DESCENT_PARSER()
+    assert parser.parse(lexer), parser.errors
+    return parser.result
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+def test_nodes_have_no_dict():
+    for kind in node_kinds():
+        assert "__dict__" not in dir(kind), kind
+    program = parse("class Main { main(): Int { 0 }; };")
+    assert program.classes[0]._visited is False
+    with pytest.raises(AttributeError):
+        program.checked = True
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+@pytest.mark.parametrize("cool_file", tests)
+def test_arena_round_trip(cool_file):
+    with open(cool_file, "r") as fd:
+        program = parse(fd.read())
+
+    arena = NodeArena.from_ast(program)
+    assert len(arena) == count_nodes(program)
+    assert dump(arena.to_ast()) == dump(program)
+
+    # Every node but the root is the child of exactly one node
+    edges = [(index, child) for index in range(len(arena)) for child in arena.children(index)]
+    assert sorted(child for _, child in edges) == list(range(1, len(arena)))
+    assert all(child > index for index, child in edges)
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from cmp.cool_lang.ast import IdNode, Node, dump_ast, load_ast, node_fields
+from cmp.cool_lang.ast.serialization import FORMAT_VERSION, MAGIC
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_PARSER
+from cmp.cool_lang.semantics import COOL_CHECKER
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + "/codegen/" + file
+    for file in os.listdir(tests_dir + "/codegen/")
+    if file.endswith(".cl")
+)
+
+
+def dump(node, typed=False):
+    if isinstance(node, list):
+        return [dump(child, typed) for child in node]
+    if isinstance(node, Node):
+        fields = {
+            name: dump(getattr(node, name), typed)
+            for name in node_fields(type(node))
+            if name != "_visited" and (typed or name != "static_type")
+        }
+        return type(node).__name__, fields
+    return getattr(node, "name", node)
+
+
+def parse(code):
+    lexer = COOL_LEXER()
+    lexer.input(code)
+    parser = COOL_PARSER()
+    assert parser.parse(lexer), parser.errors
+    return parser.result
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+@pytest.mark.parametrize("cool_file", tests)
+def test_round_trip(cool_file):
+    with open(cool_file, "r") as fd:
+        program = parse(fd.read())
+
+    data = dump_ast(program)
+    assert data.startswith(MAGIC + bytes([FORMAT_VERSION, 0]))
+    assert dump(load_ast(data)) == dump(program)
+
+    checker = COOL_CHECKER()
+    assert checker.check_semantics(program)
+    typed = load_ast(dump_ast(program, typed=True), checker.context)
+    assert dump(typed, typed=True) == dump(program, typed=True)
+    assert typed.classes[0].static_type is None
+    assert typed.classes[0].features[-1].expression.static_type in (
+        checker.context.types.values()
+    )
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+def test_large_positions_and_unicode():
+    node = IdNode("número", 300000, 129)
+    assert dump(load_ast(dump_ast(node))) == dump(node)
+
+
+@pytest.mark.parser
+@pytest.mark.error
+@pytest.mark.run(order=2)
+def test_broken_data_is_rejected():
+    data = dump_ast(parse("class Main { main(): Int { 1 + 2 }; };"))
+    version = len(MAGIC)
+
+    for broken in (
+        b"not an ast",
+        data[:version] + bytes([FORMAT_VERSION + 1]) + data[version + 1 :],
+        data[:-1],
+        data[:-3],
+        data + b"\x00",
+    ):
+        with pytest.raises(ValueError):
+            load_ast(broken)
@@ -0,0 +1,52 @@
+import pytest
+
+from cmp.cil import COOL_TO_CIL_VISITOR, basic_transform
+from cmp.cil.formatter import CIL_FORMATTER
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER
+
+CODE = """class Main inherits IO {
+    main(): IO { out_string("hello ".concat("world").substr(0, 5)) };
+};
+"""
+
+
+def cil_of(code):
+    compiler = COOL_COMPILER()
+    compiler.lexer.input(code)
+    assert compiler.parser.parse(compiler.lexer)
+    checker = COOL_CHECKER(basic_context=compiler.basic_context)
+    assert checker.check_semantics(compiler.parser.result), checker.errors
+    return COOL_TO_CIL_VISITOR(checker.context).visit(compiler.parser.result)
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_transforms_share_the_basic_functions(monkeypatch):
+    first, second = cil_of(CODE), cil_of(CODE)
+    snapshot = basic_transform._basics[COOL_TO_CIL_VISITOR]
+    basics = len(snapshot.dotcode)
+    assert first.dotcode[0].name == "function_abort_at_Object"
+    # The nodes of the basic types are shared, the lists are not
+    assert first.dotcode is not second.dotcode
+    assert all(a is b for a, b in zip(first.dotcode[:basics], snapshot.dotcode))
+    assert first.dotdata[: len(snapshot.dotdata)] == list(snapshot.dotdata)
+    assert len(first.dotcode) == len(second.dotcode) > basics
+
+    # The same CIL as building the basic types for every program
+    monkeypatch.setattr(basic_transform, "_basics", {})
+    built = cil_of(CODE)
+    assert CIL_FORMATTER().visit(built) == CIL_FORMATTER().visit(first)
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_compilers_share_the_basic_context():
+    first, second = COOL_COMPILER(), COOL_COMPILER()
+    assert first.basic_context is second.basic_context
+    types = dict(first.basic_context.types)
+    assert first.compile(CODE).ok and second.compile(CODE).ok
+    # The compilations work on clones of it
+    assert first.basic_context.types == types
+    children = {child.name for child in types["Object"].children}
+    assert children == {"IO", "Int", "Bool", "String"}
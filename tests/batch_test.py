@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from cmp.batch import collect_files, compile_batch, output_paths
+from utils import first_error_only_line  # type: ignore
+
+tests_dir = __file__.rpartition("/")[0]
+
+
+@pytest.mark.semantic
+@pytest.mark.error
+@pytest.mark.run(order=3)
+def test_batch_semantic_errors(tmp_path):
+    files = collect_files([tests_dir + "/semantic/"])
+    responses = list(compile_batch(files, jobs=2, output_dir=str(tmp_path)))
+    assert sorted(response["id"] for response in responses) == files
+
+    for response in responses:
+        assert not response["ok"], response["id"]
+        with open(response["id"][:-3] + "_error.txt", "r") as fd:
+            errors = fd.read().split("\n")
+        first_error_only_line(response["errors"], errors)
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.codegen
+@pytest.mark.ok
+@pytest.mark.run(order=4)
+def test_batch_codegen(tmp_path):
+    files = collect_files([tests_dir + "/codegen/"])
+    responses = list(compile_batch(files, jobs=2, output_dir=str(tmp_path)))
+
+    assert all(response["ok"] for response in responses)
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(file)[:-2] + "mips" for file in files
+    )
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_batch_files_with_the_same_name(tmp_path):
+    sources = tmp_path / "sources"
+    for folder, value in (("x", 1), ("y/z", 2)):
+        (sources / folder).mkdir(parents=True)
+        (sources / folder / "main.cl").write_text(
+            f"class Main {{ main(): Int {{ {value} }}; }};"
+        )
+    files = collect_files([str(sources)])
+    output_dir = tmp_path / "out"
+    responses = list(compile_batch(files, jobs=2, output_dir=str(output_dir)))
+
+    assert sorted(response["output"] for response in responses) == [
+        str(output_dir / "x/main.mips"),
+        str(output_dir / "y/z/main.mips"),
+    ]
+    assert (output_dir / "x/main.mips").read_text() != (
+        output_dir / "y/z/main.mips"
+    ).read_text()
+
+    with pytest.raises(ValueError):
+        output_paths([files[0], files[0]], str(output_dir))
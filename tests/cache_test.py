@@ -0,0 +1,97 @@
+import os
+
+import pytest
+
+from cmp.cache import CompilationCache
+from cmp.compiler import COOL_COMPILER
+
+tests_dir = __file__.rpartition("/")[0] + "/codegen/"
+
+
+def read(file):
+    with open(tests_dir + file, "r") as fd:
+        return fd.read()
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_cache_hit_returns_stored_result(tmp_path):
+    cache = CompilationCache(str(tmp_path))
+    code = read("arith.cl")
+    assert cache.get(code, cil=True) is None
+
+    result = COOL_COMPILER().compile(code, cil=True)
+    cache.put(code, result, cil=True)
+    cached = cache.get(code, cil=True)
+    assert cached.ok
+    assert cached.mips == result.mips
+    assert cached.cil == result.cil
+
+    assert cache.get(code, cil=False) is None
+    assert cache.get(code + "\n", cil=True) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 3, 1)
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_cache_stores_errors(tmp_path):
+    cache = CompilationCache(str(tmp_path))
+    code = "class Main { main(): Int { x }; };"
+    cache.put(code, COOL_COMPILER().compile(code))
+    assert cache.get(code).errors == [
+        "(1, 28) - NameError: Variable x is not defined."
+    ]
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = CompilationCache(str(tmp_path))
+    compiler = COOL_COMPILER()
+    codes = [read(file) for file in ("arith.cl", "fib.cl", "hello_world.cl")]
+    for i, code in enumerate(codes):
+        cache.put(code, compiler.compile(code))
+        path = cache.entry_path(cache.key(code))
+        os.utime(path, (i, i))
+
+    # touching the oldest entry makes fib.cl the least recently used one
+    assert cache.get(codes[0]) is not None
+    cache.max_size = cache.stats()["size"] - 1
+    cache.evict()
+
+    assert cache.get(codes[0]) is not None
+    assert cache.get(codes[1]) is None
+    assert cache.get(codes[2]) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_cache_tracks_counters_and_size(tmp_path, monkeypatch):
+    cache = CompilationCache(str(tmp_path))
+    code = read("hello_world.cl")
+    result = COOL_COMPILER().compile(code)
+    cache.put(code, result)
+    counters_size = os.path.getsize(cache.counters_path)
+
+    # Under the size limit the cache folder is never walked
+    def walk(self):
+        raise AssertionError("walked the cache")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(CompilationCache, "entries", walk)
+        for _ in range(10):
+            assert cache.get(code) is not None
+            cache.put(code, result)
+        size = cache._update({})["size"]
+
+    assert os.path.getsize(cache.counters_path) == counters_size
+    stats = cache.stats()
+    assert (stats["hits"], stats["entries"], stats["size"]) == (10, 1, size)
+
+    # Going over the limit evicts
+    cache.max_size = size * 3 // 2
+    cache.put(read("fib.cl"), result)
+    assert cache.get(code) is None
+    assert cache.stats()["evictions"] == 1
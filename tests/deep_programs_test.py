@@ -0,0 +1,90 @@
+import sys
+
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+
+# Well past the default recursion limit of Python
+DEPTH = 3000
+
+compiler = COOL_COMPILER()
+
+
+def compiled(body):
+    result = compiler.compile(f"class Main {{\n    main(): Int {{ {body} }};\n}};\n")
+    assert result.ok, [str(error) for error in result.errors]
+    return result
+
+
+def error_descriptions(code):
+    return [error.description for error in compiler.compile(code, check=True).errors]
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_deeply_nested_expressions():
+    assert sys.getrecursionlimit() < DEPTH
+
+    body = "x"
+    for index in range(DEPTH):
+        body = f"let x : Int <- {index} in {body}"
+    assert compiled(body).mips
+
+    body = "0"
+    for index in range(DEPTH):
+        body = f"if {index} < x then {index} else {body} fi"
+    assert compiled(f"let x : Int <- 7 in {body}").mips
+
+    result = compiled(" + ".join(["1"] * DEPTH))
+    assert result.mips.count("\nfunction_main_at_Main:") == 1
+
+    # Errors deep down are found as well
+    body = " + ".join(["1"] * DEPTH) + ' + "one"'
+    code = f"class Main {{\n    main(): Int {{ {body} }};\n}};\n"
+    assert error_descriptions(code) == [
+        "Invalid arithmetic operation between types Int and String."
+    ]
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_deep_inheritance_chain():
+    # The children come before their parents
+    code = "".join(
+        f"class C{index} inherits C{index - 1} {{ }};\n"
+        for index in range(DEPTH - 1, 0, -1)
+    )
+    code += "class C0 { f(): Int { 0 }; };\n"
+    code += f"class Main inherits C{DEPTH - 1} {{\n    main(): Int {{ f() }};\n}};\n"
+    result = compiler.compile(code)
+    assert result.ok, [str(error) for error in result.errors]
+    assert "function_f_at_C0" in result.mips
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_inheritance_cycles():
+    code = "".join(
+        f"class C{index} inherits C{(index + 1) % DEPTH} {{ }};\n"
+        for index in range(DEPTH)
+    )
+    code += "class Main {\n    main(): Int { 0 };\n};\n"
+    # Every chain but the last one ends in a class not seen yet
+    assert error_descriptions(code) == [
+        f"Cyclic inheritance in the hierarchy of C{DEPTH - 1}."
+    ]
+
+    code = "\n".join(
+        [
+            "class A inherits B { };",
+            "class B inherits C { };",
+            "class C inherits B { };",
+            "class D inherits A { };",
+            "class E inherits IO { };",
+            "class F inherits F { };",
+            "class Main { main(): Int { 0 }; };",
+        ]
+    )
+    assert error_descriptions(code) == [
+        f"Cyclic inheritance in the hierarchy of {name}." for name in "CDF"
+    ]
@@ -0,0 +1,113 @@
+import os
+import random
+
+import pytest
+
+from cmp.cool_lang.ast import Node, node_fields
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_DESCENT_PARSER, COOL_PARSER
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + folder + file
+    for folder in ("/parser/", "/lexer/", "/codegen/", "/semantic/")
+    for file in os.listdir(tests_dir + folder)
+    if file.endswith(".cl")
+)
+
+EXPRESSION_TOKENS = [
+    "a", "1", "true", '"s"', "not", "isvoid", "~", "<-", "@", "A", ".", "(",
+    ")", "<", "<=", "=", "+", "-", "*", "/", "let", ":", "in", ",", "if",
+    "then", "else", "fi", "while", "loop", "pool", "{", "}", ";", "case", "of",
+    "=>", "esac", "new", "f",
+]
+
+
+def dump(node):
+    if isinstance(node, list):
+        return [dump(child) for child in node]
+    if isinstance(node, Node):
+        fields = node_fields(type(node))
+        return type(node).__name__, {name: dump(getattr(node, name)) for name in fields}
+    return node
+
+
+def generate(rand, depth=0):
+    if depth > 4:
+        return rand.choice(["a", "1", "true", '"s"', "new A"])
+    operand = lambda: generate(rand, depth + 1)  # noqa: E731
+    return rand.choice(
+        [
+            lambda: f"{operand()} {rand.choice('< <= = + - * /'.split())} {operand()}",
+            lambda: f"not {operand()}",
+            lambda: f"isvoid {operand()}",
+            lambda: f"~{operand()}",
+            lambda: f"x <- {operand()}",
+            lambda: f"{operand()}.f({operand()}, {operand()})",
+            lambda: f"{operand()}@A.g()",
+            lambda: f"let x : Int <- {operand()}, y : A in {operand()}",
+            lambda: f"({operand()})",
+            lambda: f"if {operand()} then {operand()} else {operand()} fi",
+            lambda: f"while {operand()} loop {operand()} pool",
+            lambda: f"{{ {operand()}; {operand()}; }}",
+            lambda: f"case {operand()} of y : A => {operand()}; esac",
+            lambda: f"h({operand()})",
+        ]
+    )()
+
+
+@pytest.fixture(scope="module")
+def parsers():
+    lexer = COOL_LEXER()
+    lexer.build()
+    parser = COOL_PARSER()
+    parser.build()
+
+    def parse(cool_parser, code):
+        lexer.input(code)
+        parsed = cool_parser.parse(lexer)
+        return parsed, dump(cool_parser.result), [str(e) for e in cool_parser.errors]
+
+    def compare(code):
+        assert parse(COOL_DESCENT_PARSER(), code) == parse(parser, code), code
+
+    return lexer, compare
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+@pytest.mark.parametrize("cool_file", tests)
+def test_descent_parser_matches_files(parsers, cool_file):
+    with open(cool_file, "r") as fd:
+        code = fd.read()
+    _, compare = parsers
+    compare(code)
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+@pytest.mark.parametrize("seed", range(100))
+def test_descent_parser_matches_expressions(parsers, seed):
+    rand = random.Random(seed)
+    _, compare = parsers
+
+    compare(f"class Main {{ m(): Int {{ {generate(rand)} }}; }};")
+    code = " ".join(rand.choice(EXPRESSION_TOKENS) for _ in range(rand.randint(1, 12)))
+    compare(f"class Main {{ m(): Int {{ {code} }}; }};")
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+@pytest.mark.parametrize("seed", range(100))
+def test_descent_parser_matches_broken_files(parsers, seed):
+    rand = random.Random(seed)
+    lexer, compare = parsers
+    with open(rand.choice(tests), "r") as fd:
+        values = [token.value for token in lexer.tokens_of(fd.read())]
+    for _ in range(rand.randint(1, 3)):
+        index = rand.randrange(len(values) + 1)
+        if values and rand.random() < 0.5:
+            del values[min(index, len(values) - 1)]
+        else:
+            values.insert(index, rand.choice(EXPRESSION_TOKENS + ["class", "Main"]))
+    compare(" ".join(values))
@@ -0,0 +1,55 @@
+import os
+import random
+
+import pytest
+
+from cmp.cool_lang.lexer import COOL_FAST_LEXER, COOL_LEXER
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + folder + file
+    for folder in ("/lexer/", "/codegen/", "/parser/", "/semantic/")
+    for file in os.listdir(tests_dir + folder)
+    if file.endswith(".cl")
+)
+
+PIECES = [
+    '"', '"', "\\", "\\\n", "\n", "\t", "\b", "\f", "\0", "\r", "(*", "*)", "(",
+    ")", "*", "--", "-", "<", "=", ">", "~", "a", "b C", "x <- 1;", " ", "#",
+    "class", "Main", "tRuE", "False", "NOT", "isvoid", "_", "007",
+]
+
+
+def lex_all(lexer, code):
+    tokens = [
+        (t.type, t.value, t.lineno, t.lexpos)
+        for t in lexer.tokens_of(code, comments=True)
+    ]
+    return tokens, [str(error) for error in lexer.errors]
+
+
+@pytest.fixture(scope="module")
+def lexers():
+    lexer = COOL_LEXER()
+    lexer.build()
+    return lexer, COOL_FAST_LEXER()
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=1)
+@pytest.mark.parametrize("cool_file", tests)
+def test_fast_lexer_matches_files(lexers, cool_file):
+    with open(cool_file, "r") as fd:
+        code = fd.read()
+    lexer, fast = lexers
+    assert lex_all(fast, code) == lex_all(lexer, code)
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=1)
+@pytest.mark.parametrize("seed", range(300))
+def test_fast_lexer_matches_random_input(lexers, seed):
+    rand = random.Random(seed)
+    code = "".join(rand.choice(PIECES) for _ in range(rand.randint(1, 60)))
+    lexer, fast = lexers
+    assert lex_all(fast, code) == lex_all(lexer, code), repr(code)
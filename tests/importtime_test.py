@@ -0,0 +1,33 @@
+import pytest
+
+from benchmarks.importtime import BACKEND, FRONTEND, import_times
+
+
+def backend_modules(statement):
+    return [
+        name
+        for name in import_times(statement)
+        if any(name == module or name.startswith(module + ".") for module in BACKEND)
+    ]
+
+
+@pytest.mark.lexer
+@pytest.mark.error
+@pytest.mark.run(order=0)
+def test_frontend_does_not_import_the_backend():
+    statement = f"{FRONTEND}; cmp.compiler.compile_source('class Main {{}};')"
+    assert backend_modules(statement) == []
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=0)
+def test_frontend_import_set():
+    assert backend_modules(FRONTEND) == []
+    assert backend_modules(FRONTEND + ", cmp.cil")
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=0)
+def test_entry_point_import_set():
+    # coolc.py only imports the cache and the compiler when they are used
+    assert backend_modules("import coolc") == []
@@ -0,0 +1,136 @@
+import os
+import re
+
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+from cmp.incremental import IncrementalState, state_path
+from cmp.profiler import Profiler
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + "/codegen/" + file
+    for file in os.listdir(tests_dir + "/codegen/")
+    if file.endswith(".cl")
+)
+
+PROGRAM = """class A inherits IO {
+    x : String <- "a".concat("!");
+    show(): Object { out_string(x) };
+};
+class B inherits A {
+    y : Int <- 2;
+    twice(n: Int): Int { n * y };
+};
+class C inherits B {
+    z : Int <- 3;
+    count(): Int { let i: Int <- 0 in { while i < 3 loop i <- i + 1 pool; i; } };
+};
+class Main {
+    main(): Object { (new C).show() };
+};
+"""
+
+compiler = COOL_COMPILER()
+
+
+def build(code, state):
+    profiler = Profiler(memory=False)
+    result = compiler.compile(code, incremental=state, profiler=profiler)
+    return result, profiler.counters
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+@pytest.mark.parametrize("cool_file", tests)
+def test_rebuilds_match_full_builds(cool_file, tmp_path):
+    with open(cool_file, "r") as fd:
+        code = fd.read()
+    path = state_path(str(tmp_path), cool_file)
+    state = IncrementalState()
+    assert compiler.compile(code, incremental=state).mips == compiler.compile(code).mips
+    state.save(path)
+
+    # Every string gets longer in turn, which moves the data and the labels
+    # of the code after it
+    for match in list(re.finditer(r'"[^"\n]*"', code))[:5]:
+        edited = code[: match.end() - 1] + 'edit"' + code[match.end() :]
+        full = compiler.compile(edited)
+        if not full.ok:
+            continue
+        state = IncrementalState.load(path)
+        assert compiler.compile(edited, incremental=state).mips == full.mips
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_only_changed_pieces_are_generated():
+    state = IncrementalState()
+    result, counters = build(PROGRAM, state)
+    assert result.ok
+    assert counters["generated_pieces"] == 8
+    assert counters["checked_classes"] == 4
+
+    result, counters = build(PROGRAM, state)
+    assert counters["generated_pieces"] == 0
+    assert counters["checked_classes"] == 0
+
+    # A method body, with one more loop and one more string
+    edited = PROGRAM.replace(
+        "n * y", 'if n < 0 then { out_string("neg"); 0; } else n * y fi'
+    )
+    result, counters = build(edited, state)
+    assert result.mips == compiler.compile(edited).mips
+    assert counters["generated_pieces"] == 1
+    assert counters["checked_classes"] == 1
+
+    # An attribute, its init function is inlined by the ones of the children
+    edited = edited.replace('x : String <- "a"', 'x : String <- "b"')
+    result, counters = build(edited, state)
+    assert result.mips == compiler.compile(edited).mips
+    assert counters["generated_pieces"] == 3
+    assert counters["checked_classes"] == 3
+
+    # A method of a class and an attribute of its child, whose init function
+    # inlines the attributes of every ancestor
+    edited = edited.replace("n * y", "n * y * 2").replace("<- 3", "<- 5")
+    result, counters = build(edited, state)
+    assert result.mips == compiler.compile(edited).mips
+    assert counters["generated_pieces"] == 2
+    assert counters["checked_classes"] == 3
+
+    # A signature, every piece is generated again
+    edited = edited.replace("twice(n: Int)", "twice(n: Int, m: Int)")
+    result, counters = build(edited, state)
+    assert result.mips == compiler.compile(edited).mips
+    assert counters["generated_pieces"] == 8
+
+
+@pytest.mark.semantic
+@pytest.mark.error
+@pytest.mark.run(order=3)
+def test_errors_leave_the_state():
+    state = IncrementalState()
+    build(PROGRAM, state)
+    pieces = dict(state.pieces)
+
+    broken = PROGRAM.replace("n * y", "n * x")
+    result, _ = build(broken, state)
+    assert [str(e) for e in result.errors] == [
+        str(e) for e in compiler.compile(broken).errors
+    ]
+    assert state.pieces == pieces
+
+    result, counters = build(PROGRAM, state)
+    assert result.mips == compiler.compile(PROGRAM).mips
+    assert counters["generated_pieces"] == 0
+
+
+@pytest.mark.codegen
+@pytest.mark.error
+@pytest.mark.run(order=4)
+def test_broken_state_is_ignored(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text('{"compiler": ')
+    assert IncrementalState.load(str(path)).pieces == {}
+    assert IncrementalState.load(str(tmp_path / "missing.json")).pieces == {}
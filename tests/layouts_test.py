@@ -0,0 +1,100 @@
+import pytest
+
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_PARSER
+from cmp.cool_lang.semantics import COOL_CHECKER
+from cmp.cool_lang.semantics.semantic_utils import Attribute
+
+PROGRAM = """class A inherits IO {
+    a : Int;
+    f(): Int { a };
+    g(): Int { 1 };
+};
+class B inherits A {
+    b : String;
+    g(): Int { 2 };
+    h(): String { b };
+};
+class C inherits B {
+};
+class D inherits C {
+    d : Bool;
+    f(): Int { 3 };
+};
+class Main {
+    main(): Int { (new D).f() };
+};
+"""
+
+
+def context():
+    lexer = COOL_LEXER()
+    lexer.input(PROGRAM)
+    parser = COOL_PARSER()
+    assert parser.parse(lexer), parser.errors
+    checker = COOL_CHECKER()
+    assert checker.check_semantics(parser.result), checker.errors
+    return checker.context
+
+
+def walked_features(typex):
+    """
+    The features of `typex` walking its ancestors, overridden methods in
+    the place of the inherited ones.
+    """
+    features = [] if typex.parent is None else walked_features(typex.parent)
+    inherited = set()
+    for index, feature in enumerate(features):
+        if not isinstance(feature, Attribute) and feature[0].name in typex.methods:
+            inherited.add(feature[0].name)
+            features[index] = (typex.methods[feature[0].name], typex)
+    features += typex.attributes
+    features += [
+        (method, typex)
+        for method in typex.methods.values()
+        if method.name not in inherited
+    ]
+    return features
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_layouts_keep_the_inherited_order():
+    types = context().types
+    for typex in types.values():
+        features = walked_features(typex)
+        assert list(typex.get_all_features()) == features
+        assert list(typex.get_all_attributes()) == [
+            f for f in features if isinstance(f, Attribute)
+        ]
+        assert list(typex.get_all_methods()) == [
+            f for f in features if not isinstance(f, Attribute)
+        ]
+
+    d = types["D"]
+    assert [attr.name for attr in d.get_all_attributes()] == ["a", "b", "d"]
+    owners = {method.name: owner.name for method, owner in d.get_all_methods()}
+    assert owners["f"] == "D" and owners["g"] == "B" and owners["h"] == "B"
+    assert owners["out_string"] == "IO"
+    assert d.get_all_methods() is d.get_all_methods()
+    # C adds nothing, it shares the layouts of B
+    assert types["C"].get_all_features() is types["B"].get_all_features()
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_definitions_drop_the_layouts_below():
+    types = context().types
+    a, d, main = types["A"], types["D"], types["Main"]
+    integer = types["Int"]
+    d.get_all_features()
+    main.get_all_features()
+
+    attribute = a.define_attribute("e", integer)
+    assert d._layouts is None and main._layouts is not None
+    assert [attr.name for attr in d.get_all_attributes()] == ["a", "e", "b", "d"]
+    assert attribute in d.get_all_features()
+
+    method = types["C"].define_method("k", [], [], integer)
+    assert (method, types["C"]) in d.get_all_methods()
+    assert (method, types["C"]) not in types["B"].get_all_methods()
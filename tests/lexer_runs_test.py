@@ -0,0 +1,44 @@
+import random
+
+import ply.lex as lex
+import pytest
+
+from cmp.cool_lang.lexer import COOL_LEXER
+
+PIECES = [
+    '"', '"', "\\", "\\\n", "\n", "\t", "\b", "\f", "\0", "(*", "*)", "(", ")",
+    "*", "--", "a", "b c", "x <- 1;", " ", "#", "class", "Main",
+]
+
+
+def per_char_lexer():
+    """
+    COOL_LEXER without the rules consuming whole runs of strings and
+    comments, every character goes through the error rules instead.
+    """
+    lexer = COOL_LEXER()
+    rules = {
+        name: getattr(lexer, name)
+        for name in dir(lexer)
+        if not name.startswith("__") and not name.endswith("_text")
+    }
+    lexer.lexer = lex.lex(module=type("PerCharRules", (), rules)())
+    return lexer
+
+
+def lex_all(lexer, code):
+    ok = lexer.tokenize(code)
+    tokens = [(t.type, t.value, t.lineno, t.lexpos) for t in lexer.result]
+    return ok, tokens, [str(error) for error in lexer.errors]
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=1)
+@pytest.mark.parametrize("seed", range(200))
+def test_runs_match_per_char_lexing(seed):
+    rand = random.Random(seed)
+    code = "".join(rand.choice(PIECES) for _ in range(rand.randint(1, 60)))
+
+    fast = COOL_LEXER()
+    fast.build()
+    assert lex_all(fast, code) == lex_all(per_char_lexer(), code), repr(code)
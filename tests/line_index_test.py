@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.utils import LineIndex, find_column
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=1)
+def test_line_index_matches_find_column():
+    rand = random.Random(0)
+    code = "".join(rand.choice(["a", " ", "\n", "\n\n", "bc"]) for _ in range(2000))
+    index = LineIndex(code)
+    for lexpos in range(len(code) + 1):
+        assert index.column(lexpos) == find_column(code, lexpos)
+        assert index.line(lexpos) == code.count("\n", 0, lexpos) + 1
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=2)
+@pytest.mark.parametrize("engine", ["ply", "fast"])
+def test_errors_at_the_end_of_a_very_long_line(engine):
+    body = " + ".join(["1"] * 50000)
+    code = f"class Main {{ main(): Int {{ {body} }}; }}; class A {{ x : Int <- ; }};"
+    lexpos = code.rindex("<- ;") + 3
+    result = COOL_COMPILER(engine).compile(code, check=True)
+    assert [str(e) for e in result.errors] == [
+        f"(1, {lexpos + 1}) - SyntacticError: "
+        f"Syntactic error!!! in token: LexToken(SEMICOLON,';',1,{lexpos})"
+    ]
+
+    code = f"class Main {{ main(): Int {{ {body} }}; }}; #"
+    result = COOL_COMPILER(engine).compile(code, check=True)
+    assert [str(e) for e in result.errors] == [
+        f'(1, {len(code)}) - LexicographicError: Invalid character "#".'
+    ]
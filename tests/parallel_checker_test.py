@@ -0,0 +1,82 @@
+import os
+
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics import COOL_CHECKER, parallel_checker
+from cmp.cool_lang.semantics.parallel_checker import split, walk
+from cmp.profiler import Profiler
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + folder + file
+    for folder in ("/codegen/", "/semantic/")
+    for file in os.listdir(tests_dir + folder)
+    if file.endswith(".cl")
+)
+
+compiler = COOL_COMPILER()
+
+
+def checked(code, jobs):
+    compiler.lexer.input(code)
+    assert compiler.parser.parse(compiler.lexer)
+    program = compiler.parser.result
+    checker = COOL_CHECKER(basic_context=compiler.basic_context, jobs=jobs)
+    profiler = Profiler(memory=False)
+    checker.check_semantics(program, profiler=profiler)
+    types = [
+        None if node.static_type is None else node.static_type.name
+        for node in walk(program.classes)
+    ]
+    return [str(error) for error in checker.errors], types, profiler.counters
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+@pytest.mark.parametrize("cool_file", tests)
+def test_workers_match_a_single_process(cool_file, monkeypatch):
+    monkeypatch.setattr(parallel_checker, "MIN_FEATURES", 1)
+    with open(cool_file, "r") as fd:
+        code = fd.read()
+    errors, types, counters = checked(code, 3)
+    assert (errors, types) == checked(code, 1)[:2]
+    if cool_file.endswith("/codegen/arith.cl"):
+        assert counters["check_jobs"] == 3
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_runs_cover_every_feature():
+    class Class:
+        def __init__(self, features):
+            self.features = [None] * features
+
+    classes = [Class(count) for count in (5, 0, 1, 12, 3)]
+    chunks = split(classes, 4)
+    assert len(chunks) == 4
+    runs = [run for chunk in chunks for run in chunk]
+    assert runs[0] == (0, 0, 5) and (1, 0, 0) in runs
+    for index, node in enumerate(classes):
+        ranges = [(start, end) for i, start, end in runs if i == index]
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(node.features)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    # Small programs are checked in a single process
+    assert parallel_checker.parallel_jobs(classes, 8) == 0
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_deep_programs_and_no_fork(monkeypatch):
+    monkeypatch.setattr(parallel_checker, "MIN_FEATURES", 1)
+    body = " + ".join(["1"] * 3000)
+    code = f"class Main {{\n    main(): Int {{ {body} }};\n    f(): Int {{ 0 }};\n}};\n"
+    errors, types, counters = checked(code, 2)
+    assert (errors, counters["check_jobs"]) == ([], 2)
+    assert types == checked(code, 1)[1]
+
+    # Without fork the context and the classes are not pickled for workers
+    monkeypatch.setattr(
+        parallel_checker.multiprocessing, "get_all_start_methods", lambda: ["spawn"]
+    )
+    assert "check_jobs" not in checked(code, 2)[2]
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+from cmp.profiler import Profiler
+
+tests_dir = __file__.rpartition("/")[0] + "/codegen/"
+
+STAGES = [
+    "COOL_LEXER.tokenize",
+    "COOL_PARSER.parse",
+    "COOL_TYPE_COLLECTOR",
+    "COOL_TYPE_BUILDER",
+    "COOL_TYPE_CHECKER",
+    "COOL_TO_CIL_VISITOR",
+    "CIL_TO_MIPS",
+    "Mips.compile",
+]
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_profile_reports_every_stage():
+    with open(tests_dir + "hello_world.cl", "r") as fd:
+        code = fd.read()
+
+    profiler = Profiler()
+    result = COOL_COMPILER().compile(code, profiler=profiler)
+    assert result.ok
+
+    report = json.loads(profiler.to_json())
+    assert [stage["stage"] for stage in report["stages"]] == STAGES
+    assert all(stage["peak"] > 0 for stage in report["stages"])
+    assert report["counters"]["mips_lines"] == len(result.mips.split("\n"))
+    for counter in ("tokens", "ast_nodes", "cil_functions", "cil_instructions"):
+        assert report["counters"][counter] > 0
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_profile_stops_at_the_failing_stage():
+    profiler = Profiler(memory=False)
+    code = "class Main { main(): Int { x }; };"
+    result = COOL_COMPILER().compile(code, profiler=profiler)
+    assert not result.ok
+    assert [stage["stage"] for stage in profiler.stages] == STAGES[:5]
+    assert "cil_functions" not in profiler.counters
@@ -0,0 +1,100 @@
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+from cmp.project import SourceMap, read_manifest
+
+MAIN = """class Main inherits IO {
+    main(): Object { out_string((new A).greet()) };
+};
+"""
+A = """-- A lives apart from its parent
+class A inherits B {
+    greet(): String { "hi\\n".concat(x) };
+};
+"""
+B = """class B {
+    x : String <- "there";
+};
+"""
+
+
+def write(folder, **files):
+    paths = []
+    for name, code in files.items():
+        path = folder / f"{name}.cl"
+        path.write_text(code)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_files_compile_like_their_concatenation(tmp_path, jobs):
+    files = write(tmp_path, main=MAIN, a=A, b=B)
+    compiler = COOL_COMPILER()
+
+    result = compiler.compile_files(files, jobs)
+    assert result.ok, [str(e) for e in result.errors]
+    assert result.mips == compiler.compile(MAIN + A + B).mips
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_deep_files_in_worker_processes(tmp_path):
+    # Deeper than pickle can send back from a worker process
+    body = "x"
+    for index in range(3000):
+        body = f"let x : Int <- {index} in {body}"
+    deep = f"class B {{\n    x : Int <- {body};\n}};\n"
+    files = write(tmp_path, main=MAIN, a=A.replace(".concat(x)", ""), b=deep)
+
+    result = COOL_COMPILER().compile_files(files, 2, check=True)
+    assert result.ok, [str(e) for e in result.errors]
+
+
+@pytest.mark.semantic
+@pytest.mark.error
+@pytest.mark.run(order=3)
+def test_semantic_errors_tell_their_file(tmp_path):
+    files = write(tmp_path, main=MAIN, a=A, b=B.replace('"there"', "1"))
+
+    result = COOL_COMPILER().compile_files(files, 1)
+    assert [str(e) for e in result.errors] == [
+        f"{files[2]}:(2, 5) - TypeError: Invalid attribute initialization. "
+        "Type Int is not subtype of String."
+    ]
+
+
+@pytest.mark.parser
+@pytest.mark.error
+@pytest.mark.run(order=2)
+def test_front_end_errors_of_every_file(tmp_path):
+    files = write(tmp_path, main=MAIN, a=A.replace("concat", "#"), b=B + "class")
+
+    result = COOL_COMPILER(parser="descent").compile_files(files, 2)
+    assert [str(e) for e in result.errors] == [
+        f'{files[1]}:(3, 30) - LexicographicError: Invalid character "#".',
+        f"{files[2]}:(0, 0) - SyntacticError: ERROR at or near EOF",
+    ]
+
+
+@pytest.mark.parser
+@pytest.mark.error
+@pytest.mark.run(order=2)
+def test_manifest_and_source_map(tmp_path):
+    (tmp_path / "lib").mkdir()
+    manifest = tmp_path / "project.txt"
+    manifest.write_text("# the library\nlib/a.cl\n\n  lib/b.cl  \n")
+    assert read_manifest(str(manifest)) == [
+        str(tmp_path / "lib/a.cl"),
+        str(tmp_path / "lib/b.cl"),
+    ]
+
+    sources = SourceMap()
+    assert sources.add("a.cl", "one\ntwo\n") == 0
+    assert sources.add("b.cl", "three") == 3
+    assert sources.locate(2) == ("a.cl", 2)
+    assert sources.locate(3) == ("a.cl", 3)
+    assert sources.locate(4) == ("b.cl", 1)
+    assert sources.locate(0) == (None, 0)
@@ -0,0 +1,74 @@
+import pytest
+
+from cmp.cil.utils import Scope as CilScope
+from cmp.compiler import COOL_COMPILER
+from cmp.cool_lang.semantics.semantic_utils import Scope, SemanticException
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_levels_shadow_and_restore():
+    scope = Scope()
+    outer = scope.define_var("x", "Int")
+    with scope.enter():
+        inner = scope.define_var("x", "String")
+        scope.define_var("y", "Bool")
+        assert scope.get_var("x") is inner
+        with pytest.raises(SemanticException) as error:
+            scope.define_var("y", "Int")
+        assert error.value.text == "Variable y already defined in current context."
+    assert scope.get_var("x") is outer
+    with pytest.raises(SemanticException) as error:
+        scope.get_var("y")
+    assert error.value.text == "Variable y is not defined."
+
+    scope.enter()
+    scope.define_var("x", "Bool")
+    scope.enter()
+    scope.define_var("x", "Int")
+    scope.exit(2)
+    assert scope.get_var("x") is outer
+    assert scope.marks == [] and scope.log == ["x"]
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_cil_levels_rebind():
+    scope = CilScope()
+    scope.define_var("self", "local_self")
+    with scope.enter():
+        scope.define_var("x", "local_1")
+        scope.define_var("x", "local_2")
+        assert scope.get_var("x").local_name == "local_2"
+    assert scope.get_var("x") is None
+    assert scope.get_var("self").local_name == "local_self"
+
+
+@pytest.mark.semantic
+@pytest.mark.error
+@pytest.mark.run(order=3)
+def test_bindings_end_with_their_expression():
+    code = """class Main {
+    a : Int <- 1;
+    f(p: Int, p: String): Int { p };
+    g(): String {
+        {
+            let a: String <- "s", a: Bool <- true in if a then b else c fi;
+            case a of b: Int => b; c: Object => c; esac;
+            a;
+        }
+    };
+    main(): Int { b };
+};
+"""
+    result = COOL_COMPILER().compile(code)
+    # The second `a` of the let shadows the first one and the attribute, and
+    # the attribute is back in `g` once the let ends
+    assert [str(error) for error in result.errors] == [
+        '(3, 15) - SemanticError: Identifier "p" can only be used once.',
+        "(6, 64) - NameError: Variable b is not defined.",
+        "(6, 71) - NameError: Variable c is not defined.",
+        "(4, 5) - TypeError: Invalid return type. "
+        + "Type Int is not subtype of String.",
+        "(11, 19) - NameError: Variable b is not defined.",
+    ]
@@ -0,0 +1,65 @@
+import io
+import json
+import os
+
+import pytest
+
+from cmp.compiler import COOL_COMPILER
+from cmp.server import handle_request, serve_socket, serve_stream
+from utils import first_error_only_line  # type: ignore
+
+tests_dir = __file__.rpartition("/")[0] + "/semantic/"
+tests = sorted(file for file in os.listdir(tests_dir) if file.endswith(".cl"))
+
+
+@pytest.fixture(scope="module")
+def responses():
+    requests = "".join(
+        json.dumps({"id": file, "input": tests_dir + file}) + "\n" for file in tests
+    )
+    wfile = io.StringIO()
+    serve_stream(COOL_COMPILER(), io.StringIO(requests + "not json\n"), wfile)
+    return [json.loads(line) for line in wfile.getvalue().splitlines()]
+
+
+@pytest.mark.semantic
+@pytest.mark.error
+@pytest.mark.run(order=3)
+@pytest.mark.parametrize("index", range(len(tests)))
+def test_served_semantic_errors(responses, index):
+    cool_file = tests[index]
+    response = responses[index]
+    assert response["id"] == cool_file
+    assert not response["ok"]
+
+    with open(tests_dir + cool_file[:-3] + "_error.txt", "r") as fd:
+        errors = fd.read().split("\n")
+    first_error_only_line(response["errors"], errors)
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_bad_request_keeps_serving(responses):
+    assert len(responses) == len(tests) + 1
+    assert responses[-1]["id"] is None
+    assert "CompilationError" in responses[-1]["errors"][0]
+
+
+@pytest.mark.codegen
+@pytest.mark.run(order=4)
+def test_output_without_extension(tmp_path):
+    output = str(tmp_path / "program")
+    request = {"source": "class Main { main(): Int { 0 }; };", "output": output}
+    response = handle_request(COOL_COMPILER(), dict(request, cil=True))
+    assert response["ok"] and response["output"] == output
+    assert os.path.exists(output) and os.path.exists(output + ".cil")
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_socket_path_is_not_replaced(tmp_path):
+    path = tmp_path / "program.cl"
+    path.write_text("class Main { };")
+    with pytest.raises(FileExistsError):
+        serve_socket(COOL_COMPILER(), str(path))
+    assert path.read_text() == "class Main { };"
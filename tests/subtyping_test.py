@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from cmp.cool_lang.semantics.semantic_utils import (
+    Context,
+    ErrorType,
+    VoidType,
+    find_common_ancestor,
+)
+
+
+def hierarchy(parents):
+    """
+    A context with the types T0, T1... where the parent of Ti is the type
+    `parents[i]` (Object when None).
+    """
+    context = Context()
+    root = context.create_type("Object")
+    types = [context.create_type(f"T{index}") for index in range(len(parents))]
+    for typex, parent in zip(types, parents):
+        typex.set_parent(root if parent is None else types[parent])
+    context.compute_finish_time()
+    return context, root, types
+
+
+def ancestors(typex):
+    result = []
+    while typex is not None:
+        result.append(typex)
+        typex = typex.parent
+    return result
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_numbers_agree_with_the_parent_chains():
+    generator = random.Random(19)
+    parents = [None] + [generator.randrange(index) for index in range(1, 80)]
+    parents[40] = None
+    context, root, types = hierarchy(parents)
+    everything = [root] + types
+
+    for first in everything:
+        for second in everything:
+            expected = second in ancestors(first)
+            assert first.is_subtype(second) == expected
+            common = next(t for t in ancestors(second) if t in ancestors(first))
+            assert find_common_ancestor(first, second) is common
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_deep_and_wide_hierarchies():
+    context, root, types = hierarchy([None] + list(range(5000)))
+    assert types[-1].is_subtype(types[1])
+    assert not types[1].is_subtype(types[-1])
+    assert find_common_ancestor(types[-1], types[2500]) is types[2500]
+
+    context, root, types = hierarchy([None] * 10000)
+    assert find_common_ancestor(types[0], types[-1]) is root
+    assert not types[0].is_subtype(types[-1])
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_special_and_unnumbered_types():
+    context, root, types = hierarchy([None, 0])
+    error, void = ErrorType(), VoidType()
+    assert types[1].is_subtype(error)
+    assert error.is_subtype(types[1])
+    assert not void.is_subtype(root)
+    assert not types[0].is_subtype(void)
+
+    # A type added after the numbering is found walking its parents
+    late = context.create_type("Late")
+    late.set_parent(types[1])
+    assert late.is_subtype(types[0])
+    assert not types[0].is_subtype(late)
+    assert find_common_ancestor(late, types[0]) is types[0]
+    context.compute_finish_time()
+    assert late._order is not None
+    assert find_common_ancestor(types[1], late) is types[1]
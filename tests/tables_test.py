@@ -0,0 +1,20 @@
+import pytest
+
+from cmp.cool_lang.lexer import COOL_LEXER, lextab
+from cmp.cool_lang.parser import COOL_PARSER, parsetab
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=0)
+def test_lextab_is_up_to_date():
+    assert lextab._lexsignature == COOL_LEXER().signature()
+    with open(lextab.__file__, "r") as fd:
+        assert fd.readline().startswith("# lextab.py.")
+
+
+@pytest.mark.parser
+@pytest.mark.run(order=0)
+def test_parsetab_is_up_to_date():
+    assert parsetab._lr_signature == COOL_PARSER().signature()
+    with open(parsetab.__file__, "r") as fd:
+        assert fd.read(64).lstrip().startswith("# parsetab.py\n")
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from cmp.cool_lang.lexer import COOL_LEXER
+
+tests_dir = __file__.rpartition("/")[0]
+tests = sorted(
+    tests_dir + folder + file
+    for folder in ("/lexer/", "/parser/", "/codegen/")
+    for file in os.listdir(tests_dir + folder)
+    if file.endswith(".cl")
+)
+
+
+def tokens(lexer_tokens):
+    return [(t.type, t.value, t.lineno, t.lexpos) for t in lexer_tokens]
+
+
+@pytest.fixture(scope="module")
+def lexer():
+    lexer = COOL_LEXER()
+    lexer.build()
+    return lexer
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=1)
+@pytest.mark.parametrize("cool_file", tests)
+def test_stream_matches_tokenize(lexer, cool_file):
+    with open(cool_file, "r") as fd:
+        code = fd.read()
+
+    ok = lexer.tokenize(code)
+    expected = tokens(t for t in lexer.result if t.type != "COMMENT")
+    expected_errors = [str(e) for e in lexer.errors]
+
+    assert tokens(lexer.tokens_of(code)) == expected
+    assert [str(e) for e in lexer.errors] == expected_errors
+
+    lexer.input(code)
+    assert tokens(iter(lexer.token, None)) == expected
+    assert lexer.drain() == ok
+
+
+@pytest.mark.lexer
+@pytest.mark.run(order=1)
+def test_stream_is_lazy_and_stops_at_first_error(lexer):
+    code = "class Main {};\n" * 1000 + "#\n" + "class A {};\n" * 1000
+    stream = lexer.tokens_of(code)
+    next(stream)
+    assert lexer.lexer.lexpos < 10
+
+    assert sum(1 for _ in stream) == 5 * 1000 - 1
+    assert [str(e) for e in lexer.errors] == [
+        '(1001, 1) - LexicographicError: Invalid character "#".'
+    ]
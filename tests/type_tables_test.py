@@ -0,0 +1,88 @@
+import pytest
+
+from cmp.cool_lang.lexer import COOL_LEXER
+from cmp.cool_lang.parser import COOL_PARSER
+from cmp.cool_lang.semantics import COOL_CHECKER
+from cmp.cool_lang.semantics.semantic_utils import SemanticException
+
+PROGRAM = """class A {
+    a : Int;
+    f(): Int { a };
+};
+class B inherits A {
+    b : String;
+    f(): Int { 1 };
+    g(): String { b };
+};
+class C inherits B {
+};
+class Main {
+    main(): Int { (new C).f() };
+};
+"""
+
+
+def context():
+    lexer = COOL_LEXER()
+    lexer.input(PROGRAM)
+    parser = COOL_PARSER()
+    assert parser.parse(lexer), parser.errors
+    checker = COOL_CHECKER()
+    assert checker.check_semantics(parser.result), checker.errors
+    return checker.context
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_tables_resolve_inherited_features():
+    types = context().types
+    a, b, c = types["A"], types["B"], types["C"]
+    assert all(typex._method_table is not None for typex in types.values())
+
+    assert c.get_attribute("a") is a.attributes[0]
+    assert c.get_attribute("b") is b.attributes[0]
+    assert c.get_method("f") is b.methods["f"]
+    assert a.get_method("f") is a.methods["f"]
+    assert c.get_method("abort") is types["Object"].methods["abort"]
+    # C adds nothing, it shares the tables of B
+    assert c._method_table is b._method_table
+
+    with pytest.raises(SemanticException) as error:
+        c.get_method("h")
+    assert error.value.text == 'Method "h" is not defined in type C.'
+    with pytest.raises(SemanticException) as error:
+        a.get_attribute("b")
+    assert error.value.text == 'Attribute "b" is not defined in type A.'
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+def test_changes_drop_the_tables_below():
+    checked = context()
+    types = checked.types
+    a, b, c = types["A"], types["B"], types["C"]
+    integer = types["Int"]
+
+    method = a.define_method("h", [], [], integer)
+    assert a._method_table is None and c._method_table is None
+    assert types["Main"]._method_table is not None
+    assert c.get_method("h") is method
+
+    types["Object"].freeze()
+    assert c._method_table is None
+    c.freeze()
+    assert c.get_method("h") is method
+    attribute = b.define_attribute("d", integer)
+    assert c.get_attribute("d") is attribute
+    assert a.find_attribute("d") is None
+    with pytest.raises(SemanticException):
+        c.define_attribute("a", integer)
+    with pytest.raises(SemanticException):
+        c.define_method("h", ["x"], [integer], integer)
+
+    d = checked.create_type("D")
+    d.freeze()
+    assert d.find_method("h") is None
+    d.set_parent(c)
+    assert d._method_table is None
+    assert d.get_method("h") is method
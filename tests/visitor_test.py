@@ -0,0 +1,104 @@
+import pytest
+
+from cmp.cil.utils import visitor as cil_visitor
+from cmp.cool_lang.utils import visitor as cool_visitor
+
+
+class Node:
+    pass
+
+
+class Expression(Node):
+    pass
+
+
+class Atom(Expression):
+    pass
+
+
+class Unknown:
+    pass
+
+
+def visitor_class(module):
+    on, when = module.on, module.when
+
+    class Visitor:
+        @on("node")
+        def visit(self, node, tabs=0):
+            pass
+
+        @when(Node)
+        def visit(self, node, tabs=0):  # noqa:F811
+            return ("node", tabs)
+
+        @when(Expression)
+        def visit(self, node, tabs=0):  # noqa:F811
+            return ("expression", tabs)
+
+    return Visitor
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+@pytest.mark.parametrize("module", [cool_visitor, cil_visitor])
+def test_dispatch_is_resolved_once(module):
+    visitor = visitor_class(module)()
+    dispatcher = visitor.visit.dispatcher
+
+    assert visitor.visit(Expression(), 1) == ("expression", 1)
+    # Atom has no target, every base class with one is visited
+    assert visitor.visit(Atom(), tabs=2) == [("node", 2), ("expression", 2)]
+    assert visitor.visit(Unknown()) == []
+    assert set(dispatcher.cache) == {Expression, Atom, Unknown}
+
+    dispatcher.add_target(Atom, lambda self, node, tabs=0: ("atom", tabs))
+    assert dispatcher.cache == {}
+    assert visitor.visit(Atom()) == ("atom", 0)
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+@pytest.mark.parametrize("module", [cool_visitor, cil_visitor])
+def test_method_table_matches_the_dispatcher(module):
+    plain = visitor_class(module)
+    table = module.method_table(visitor_class(module))
+    assert table.visit.__name__ == "visit"
+    assert table.visit.dispatcher is not plain.visit.dispatcher
+
+    for node in (Node(), Expression(), Atom(), Unknown()):
+        assert table().visit(node, 3) == plain().visit(node, 3)
+        assert table().visit(node) == plain().visit(node)
+
+
+@pytest.mark.semantic
+@pytest.mark.run(order=3)
+@pytest.mark.parametrize("module", [cool_visitor, cil_visitor])
+def test_trampoline_sends_the_results_back(module):
+    on, when = module.on, module.when
+
+    class Pair:
+        def __init__(self, left, right):
+            self.left, self.right = left, right
+
+    class Summer:
+        @on("node")
+        def visit(self, node, scale):
+            pass
+
+        @when(int)
+        def visit(self, node, scale):  # noqa:F811
+            return node * scale
+
+        @when(Pair)
+        def visit(self, node, scale):  # noqa:F811
+            left = yield node.left, scale
+            right = yield node.right, scale + 1
+            return left + right
+
+    tree = 1
+    for value in range(5000):
+        tree = Pair(tree, value)
+    expected = 1 + sum(value * 2 for value in range(5000))
+    assert module.trampoline(Summer().visit, tree, 1) == expected
+    assert module.trampoline(Summer().visit, 7, 3) == 21